@@ -10,6 +10,22 @@ from osn_bas.browsers_handler._windows import (
 )
 
 
+_BROWSERS_VERSIONS: dict[str, str] = {}
+_BROWSERS_PATHS: dict[str, pathlib.Path] = {}
+
+
+def clear_browsers_cache():
+	"""
+	Drops the browser versions and paths cached by `get_version_of_browser` and `get_path_to_browser`.
+
+	Call it after a browser was updated or moved while the process is running,
+	so the next lookups search the installed browsers again.
+	"""
+	
+	_BROWSERS_VERSIONS.clear()
+	_BROWSERS_PATHS.clear()
+
+
 def get_installed_browsers() -> list[Browser]:
 	"""
 	Retrieves a list of installed browsers on the system.
@@ -35,6 +51,8 @@ def get_version_of_browser(browser_name: str) -> Optional[str]:
 	Retrieves the version of a specific installed browser.
 
 	This function searches for an installed browser by its name and returns its version if found.
+	A found version is cached per browser name until `clear_browsers_cache` is called;
+	a browser that was not found is searched again on the next call.
 
 	Args:
 		browser_name (str): The name of the browser to find the version for (e.g., "Chrome", "Firefox").
@@ -43,8 +61,16 @@ def get_version_of_browser(browser_name: str) -> Optional[str]:
 		Optional[str]: The version string of the browser if found, otherwise None.
 	"""
 	
+	version = _BROWSERS_VERSIONS.get(browser_name)
+	
+	if version is not None:
+		return version
+	
 	for browser in get_installed_browsers():
 		if browser["name"] == browser_name:
+			if browser["version"] is not None:
+				_BROWSERS_VERSIONS[browser_name] = browser["version"]
+		
 			return browser["version"]
 	
 	return None
@@ -55,6 +81,8 @@ def get_path_to_browser(browser_name: str) -> Optional[pathlib.Path]:
 	Retrieves the installation path of a specific installed browser.
 
 	This function searches for an installed browser by its name and returns its installation path as a pathlib.Path object if found.
+	A found path is cached per browser name until `clear_browsers_cache` is called;
+	a browser that was not found is searched again on the next call.
 
 	Args:
 		browser_name (str): The name of the browser to find the path for (e.g., "Chrome", "Firefox").
@@ -63,8 +91,16 @@ def get_path_to_browser(browser_name: str) -> Optional[pathlib.Path]:
 		Optional[pathlib.Path]: The pathlib.Path object representing the browser's installation path if found, otherwise None.
 	"""
 	
+	path = _BROWSERS_PATHS.get(browser_name)
+	
+	if path is not None:
+		return path
+	
 	for browser in get_installed_browsers():
 		if browser["name"] == browser_name:
+			if browser["path"] is not None:
+				_BROWSERS_PATHS[browser_name] = browser["path"]
+		
 			return browser["path"]
 	
 	return None
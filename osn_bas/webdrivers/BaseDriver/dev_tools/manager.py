@@ -11,9 +11,6 @@ from contextlib import (
 	AbstractAsyncContextManager,
 	asynccontextmanager
 )
-from osn_bas.webdrivers.BaseDriver.protocols import (
-	TrioWebDriverWrapperProtocol
-)
 from osn_bas.webdrivers.BaseDriver.dev_tools.errors import (
 	CantEnterDevToolsContextError
 )
@@ -40,6 +37,7 @@ from osn_bas.webdrivers.BaseDriver.dev_tools._utils import (
 
 if TYPE_CHECKING:
 	from osn_bas.webdrivers.BaseDriver.webdriver import BrowserWebDriver
+	from osn_bas.webdrivers.BaseDriver.protocols import TrioWebDriverWrapperProtocol
 
 
 class DevTools:
@@ -292,7 +290,7 @@ class DevTools:
 			async with new_connection.open_session(target_id) as new_session:
 				yield new_session
 	
-	async def __aenter__(self) -> TrioWebDriverWrapperProtocol:
+	async def __aenter__(self) -> "TrioWebDriverWrapperProtocol":
 		"""
 		Asynchronously enters the DevTools event handling context.
 
@@ -331,7 +329,7 @@ class DevTools:
 		self._is_active = True
 		self._exit_event = trio.Event()
 		
-		return cast(TrioWebDriverWrapperProtocol, self._webdriver.to_wrapper())
+		return cast("TrioWebDriverWrapperProtocol", self._webdriver.to_wrapper())
 	
 	async def __aexit__(
 			self,
@@ -1,6 +1,8 @@
-from random import choice
+import copy
+from random import Random
+from itertools import cycle
 from selenium import webdriver
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Union
 from osn_bas.webdrivers.types import WebdriverOption
 
 
@@ -24,8 +26,16 @@ class BrowserOptionsManager:
 			Configuration for the proxy option.
 		_enable_bidi_command (WebdriverOption):
 			Configuration for the enable BiDi option.
+		_proxy_list (Optional[tuple[str, ...]]):
+			The proxy list last passed to `set_proxy`, or None if no list was passed.
+		_proxy_cycle (Optional[Iterator[str]]):
+			Endless iterator over a shuffled copy of `_proxy_list`, yielding the next proxy to use.
+		_rng (Random):
+			Random number generator shared by all managers, used to shuffle proxy lists.
 	"""
 	
+	_rng = Random()
+	
 	def __init__(
 			self,
 			debugging_port_command: WebdriverOption,
@@ -52,6 +62,8 @@ class BrowserOptionsManager:
 		self._user_agent_command = user_agent_command
 		self._proxy_command = proxy_command
 		self._enable_bidi_command = enable_bidi_command
+		self._proxy_list: Optional[tuple[str, ...]] = None
+		self._proxy_cycle: Optional[Iterator[str]] = None
 	
 	def renew_webdriver_options(self) -> Any:
 		"""
@@ -123,6 +135,30 @@ class BrowserOptionsManager:
 				self._options.experimental_options.pop(experimental_option[0])
 				delattr(self, experimental_option_name)
 	
+	@staticmethod
+	def copy_webdriver_options(options: Any) -> Any:
+		"""
+		Makes a cheap independent copy of a WebDriver options object.
+
+		The object is copied shallowly, and only its top-level list and dict attributes (arguments, capabilities,
+		experimental options, extensions) are copied too, so changing the copy doesn't change the original.
+		This is much cheaper than `copy.deepcopy` and than constructing a new options object.
+
+		Args:
+			options (Any): The options object to copy.
+
+		Returns:
+			Any: The copied options object.
+		"""
+		
+		options_copy = copy.copy(options)
+		
+		for attribute_name, value in vars(options).items():
+			if isinstance(value, (list, dict)):
+				setattr(options_copy, attribute_name, value.copy())
+		
+		return options_copy
+	
 	def remove_argument(self, argument_name: str):
 		"""
 		Removes a browser argument by its attribute name.
@@ -141,6 +177,30 @@ class BrowserOptionsManager:
 				self._options.arguments.remove(argument)
 				delattr(self, argument_name)
 	
+	def remove_arguments(self, argument_names: Iterable[str]):
+		"""
+		Removes several browser arguments by their attribute names.
+
+		Works like calling `remove_argument` for every name, but rebuilds the argument list of the options object in one pass.
+
+		Args:
+			argument_names (Iterable[str]): Attribute names of the arguments to remove.
+		"""
+		
+		arguments_to_remove = set()
+		
+		for argument_name in argument_names:
+			if hasattr(self, argument_name):
+				arguments_to_remove.add(getattr(self, argument_name))
+				delattr(self, argument_name)
+		
+		if arguments_to_remove:
+			self._options.arguments[:] = [
+				argument
+				for argument in self._options.arguments
+				if argument not in arguments_to_remove
+			]
+	
 	def remove_option(self, option: WebdriverOption):
 		"""
 		Removes a browser option by its configuration object.
@@ -156,13 +216,13 @@ class BrowserOptionsManager:
 			ValueError: If the option type is not recognized.
 		"""
 		
-		if option["type"] == "normal":
-			self.remove_argument(option["name"])
-		elif option["type"] == "experimental":
-			self.remove_experimental_option(option["name"])
-		elif option["type"] == "attribute":
-			self.remove_attribute(option["name"])
-		elif option["type"] is None:
+		if option.type == "normal":
+			self.remove_argument(option.name)
+		elif option.type == "experimental":
+			self.remove_experimental_option(option.name)
+		elif option.type == "attribute":
+			self.remove_attribute(option.name)
+		elif option.type is None:
 			pass
 		else:
 			raise ValueError(f"Unknown option type ({option}).")
@@ -231,6 +291,25 @@ class BrowserOptionsManager:
 		self._options.add_argument(argument_line)
 		setattr(self, argument_name, argument_line)
 	
+	def set_arguments(self, arguments: Iterable[tuple[str, str]]):
+		"""
+		Sets several browser arguments without values.
+
+		Works like calling `set_argument` for every pair, but removes the previous values
+		and appends the new arguments to the options object in one pass each.
+
+		Args:
+			arguments (Iterable[tuple[str, str]]): Pairs of the name to store the argument under and the argument itself.
+		"""
+		
+		arguments = tuple(arguments)
+		self.remove_arguments(argument_name for argument_name, _ in arguments)
+		
+		self._options.arguments.extend(argument for _, argument in arguments)
+		
+		for argument_name, argument in arguments:
+			setattr(self, argument_name, argument)
+	
 	def set_option(self, option: WebdriverOption, value: Any):
 		"""
 		Sets a browser option based on its configuration object.
@@ -240,20 +319,20 @@ class BrowserOptionsManager:
 		It uses the option's type to determine the appropriate method for setting the option with the given value.
 
 		Args:
-			option (WebdriverOption): A dictionary-like object containing the configuration for the option to be set.
+			option (WebdriverOption): A named tuple containing the configuration for the option to be set.
 			value (Any): The value to be set for the option. The type and acceptable values depend on the specific browser option being configured.
 
 		Raises:
 			ValueError: If the option type is not recognized.
 		"""
 		
-		if option["type"] == "normal":
-			self.set_argument(option["name"], option["command"], value)
-		elif option["type"] == "experimental":
-			self.set_experimental_option(option["name"], option["command"], value)
-		elif option["type"] == "attribute":
-			self.set_attribute(option["name"], option["command"], value)
-		elif option["type"] is None:
+		if option.type == "normal":
+			self.set_argument(option.name, option.command, value)
+		elif option.type == "experimental":
+			self.set_experimental_option(option.name, option.command, value)
+		elif option.type == "attribute":
+			self.set_attribute(option.name, option.command, value)
+		elif option.type is None:
 			pass
 		else:
 			raise ValueError(f"Unknown option type ({option}).")
@@ -293,15 +372,29 @@ class BrowserOptionsManager:
 		Sets the proxy browser option.
 
 		Configures the browser to use a proxy server for network requests.
-		This can be a single proxy or a list from which a random proxy will be selected.
+		This can be a single proxy or a list of proxies to rotate through.
+		A list is shuffled once, and every call with the same list takes the next proxy of the shuffled order,
+		so all proxies are used evenly and no call reshuffles the list.
 
 		Args:
-			proxy (Optional[Union[str, list[str]]]): Proxy string or list of proxy strings. If a list, a random proxy is chosen. If None, removes the proxy argument. Defaults to None.
+			proxy (Optional[Union[str, list[str]]]): Proxy string or list of proxy strings. If a list, the next proxy of its shuffled rotation is chosen. If None, removes the proxy argument. Defaults to None.
+
+		Raises:
+			ValueError: If `proxy` is an empty list.
 		"""
 		
 		if proxy is not None:
 			if isinstance(proxy, list):
-				proxy = choice(proxy)
+				if not proxy:
+					raise ValueError("Proxy list must not be empty.")
+		
+				proxy_list = tuple(proxy)
+		
+				if proxy_list != self._proxy_list:
+					self._proxy_list = proxy_list
+					self._proxy_cycle = cycle(self._rng.sample(proxy_list, len(proxy_list)))
+		
+				proxy = next(self._proxy_cycle)
 		
 			self.set_option(self._proxy_command, proxy)
 		else:
@@ -4,7 +4,7 @@ from selenium import webdriver
 from types import TracebackType
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
-from osn_bas.webdrivers.types import ActionPoint
+from osn_bas.webdrivers.types import ActionPoint, JS_Scripts
 from selenium.webdriver.common.bidi.cdp import CdpSession
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.actions.key_input import KeyInput
@@ -38,6 +38,7 @@ from typing import (
 	AsyncGenerator,
 	Callable,
 	Coroutine,
+	Iterable,
 	Mapping,
 	Optional,
 	Protocol,
@@ -135,6 +136,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 
 		Determines a random target point within the element's bounding box (using `get_random_element_point`)
 		and then uses `build_hm_move_action` to create a human-like movement sequence to that point.
+		If the element has no visible point, no move is added.
 
 		Args:
 			start_position (ActionPoint): The starting coordinates for the mouse movement.
@@ -343,7 +345,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		"""
 		Closes all open windows.
 
-		Iterates through all window handles and closes each window associated with the WebDriver instance.
+		Closes every window associated with the WebDriver instance using `close_windows`.
 		This effectively closes the entire browser session managed by the driver.
 		"""
 		
@@ -376,6 +378,23 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def close_windows(self, windows: Optional[list[Union[str, int]]] = None):
+		"""
+		Closes several browser windows at once.
+
+		If the driver supports Chrome DevTools commands, each window is closed with a `Target.closeTarget`
+		command (window handles are the DevTools target IDs), without switching focus to it first. If the
+		focused window was closed, focus is switched to the last remaining window. Otherwise, the windows
+		are closed one by one with `close_window`.
+
+		Args:
+			windows (Optional[list[Union[str, int]]]): Identifiers of the windows to close.
+				Each one can be a window handle (string) or an index (int) in the list of window handles.
+				If None, all windows are closed. Defaults to None.
+		"""
+		
+		...
+	
 	async def context_click_action(
 			self,
 			element: Optional[WebElement] = None,
@@ -566,6 +585,22 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def batch_execute_js_scripts(self, scripts: Iterable[str]) -> list[Any]:
+		"""
+		Executes several argument-less JavaScript scripts with a single WebDriver command.
+
+		The scripts are combined into one script that runs them in order and returns the list of their results,
+		so N scripts cost one round trip instead of N.
+
+		Args:
+			scripts (Iterable[str]): The JavaScript code of the scripts. Each script must `return` its result.
+
+		Returns:
+			list[Any]: The results of the scripts, in the same order as the scripts.
+		"""
+		
+		...
+	
 	async def find_debugging_port(self, debugging_port: Optional[int], profile_dir: Optional[str]) -> int:
 		"""
 		Finds an appropriate debugging port, either reusing a previous session's port or finding a free port.
@@ -592,6 +627,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element within another element.
@@ -605,6 +641,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value (str): Locator value. The actual string used by the locator strategy to find the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Overrides default if provided. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Overrides default if provided. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element. If no element is found within the timeout, a `NoSuchElementException` is raised.
@@ -619,6 +656,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements within another element.
@@ -632,6 +671,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value (str): Locator value. Used in conjunction with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
@@ -644,7 +685,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element on the page.
@@ -657,6 +699,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value (str): Locator value. Used with the 'by' strategy to identify the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element.
@@ -672,7 +715,9 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements on the page.
@@ -685,6 +730,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			value (str): Locator value. Used with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
@@ -706,15 +753,21 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
-	async def get_element_css_style(self, element: WebElement) -> dict[str, str]:
+	async def get_element_css_style(
+			self,
+			element: WebElement,
+			properties: Optional[Iterable[str]] = None
+	) -> dict[str, str]:
 		"""
 		Retrieves the computed CSS style of a WebElement.
 
-		Uses JavaScript to get all computed CSS properties and their values for a given web element.
+		Uses JavaScript to get computed CSS properties and their values for a given web element.
 		Returns a dictionary where keys are CSS property names and values are their computed values.
+		Requesting only the needed properties keeps the transferred payload small.
 
 		Args:
 			element (WebElement): The WebElement for which to retrieve the CSS style.
+			properties (Optional[Iterable[str]]): Names of the CSS properties to retrieve. If None, all computed properties are retrieved. Defaults to None.
 
 		Returns:
 			dict[str, str]: A dictionary of CSS property names and their computed values as strings.
@@ -740,21 +793,37 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
-	async def get_random_element_point(self, element: WebElement) -> ActionPoint:
+	async def get_element_rects_in_viewport(self, elements: list[WebElement]) -> list[Rectangle]:
+		"""
+		Gets the positions and dimensions of several elements relative to the viewport.
+
+		Executes a predefined JavaScript snippet that calculates the bounding rectangles of all
+		given elements with a single call, instead of one call per element.
+
+		Args:
+			elements (list[WebElement]): The Selenium WebElements whose rectangles are needed.
+
+		Returns:
+			list[Rectangle]: TypedDicts containing the 'x', 'y', 'width', and 'height' of each element
+					   relative to the viewport's top-left corner, in the order of `elements`.
+		"""
+		
+		...
+	
+	async def get_random_element_point(self, element: WebElement) -> Optional[ActionPoint]:
 		"""
 		Gets the coordinates of a random point within an element, relative to the viewport origin.
 
-		Calculates a random point within the visible portion of the element relative to the
-		element's own top-left corner. It then adds the element's top-left coordinates
-		(relative to the viewport) to get the final coordinates of the random point,
-		also relative to the viewport's top-left origin (0,0).
+		Calculates a random point within the visible portion of the element with a single JavaScript call,
+		which returns the point's coordinates relative to the viewport's top-left origin (0,0) directly.
 
 		Args:
 			element (WebElement): The target element within which to find a random point.
 
 		Returns:
-			ActionPoint: An ActionPoint named tuple containing the 'x' and 'y' coordinates
-						 of the random point within the element, relative to the viewport origin.
+			Optional[ActionPoint]: An ActionPoint containing the 'x' and 'y' coordinates of the random point
+				within the element, relative to the viewport origin. None if no visible point of the element
+				is found (e.g., it is scrolled out of the viewport or fully covered by other elements).
 		"""
 		
 		...
@@ -773,9 +842,40 @@ class TrioWebDriverWrapperProtocol(Protocol):
 				will be multiples of this step within the valid range. Defaults to 1 (any pixel).
 
 		Returns:
-			Position: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
+			Optional[Position]: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
 					  within the element's visible area in the viewport. Coordinates are relative
-					  to the element's top-left corner (0,0).
+					  to the element's top-left corner (0,0). None if the element has no visible point in the viewport.
+		"""
+		
+		...
+	
+	async def get_remote_capabilities(self) -> dict[str, Any]:
+		"""
+		Gets the capabilities returned by the server for the current WebDriver session.
+
+		Pass them to `remote_connect_driver` together with the values of `get_vars_for_remote`, so the attached driver
+		knows the real session values (e.g., `webSocketUrl` or `se:cdp`) needed for BiDi and DevTools connections.
+
+		Returns:
+			dict[str, Any]: The session capabilities.
+		"""
+		
+		...
+	
+	async def get_html(self, use_cache: bool = False) -> str:
+		"""
+		Gets the current page source, optionally reusing the previously fetched one.
+
+		Without caching this is the same as the `html` property. With `use_cache`, the DOM mutation counter
+		maintained in the page is compared with the one the cached source was fetched at;
+		if the DOM has not been mutated since then, the cached source is returned without transferring the page source again.
+		Checking the counter costs one JavaScript call, so caching only pays off for large pages that are read repeatedly.
+
+		Args:
+			use_cache (bool): If True, returns the previously fetched source when the DOM has not been mutated since then. Defaults to False.
+
+		Returns:
+			str: The HTML source code of the current page.
 		"""
 		
 		...
@@ -822,6 +922,17 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def get_viewport_rect_and_document_scroll_size(self) -> tuple[Rectangle, Size]:
+		"""
+		Gets the viewport rectangle and the document's scrollable size with a single command.
+
+		Returns:
+			tuple[Rectangle, Size]: The viewport rectangle (as `get_viewport_rect` returns it)
+				and the document scroll size (as `get_document_scroll_size` returns it).
+		"""
+		
+		...
+	
 	async def get_viewport_size(self) -> Size:
 		"""
 		Gets the current dimensions (width and height) of the browser's viewport.
@@ -862,6 +973,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 
 		This method configures the browser options to hide or show automation
 		indicators, which are typically present when a browser is controlled by WebDriver.
+		Does nothing if the requested state is already applied.
 
 		Args:
 			hide (bool): If True, hides automation indicators; otherwise, shows them.
@@ -876,6 +988,7 @@ class TrioWebDriverWrapperProtocol(Protocol):
 
 		Retrieves the HTML source code of the currently loaded webpage. This is useful for
 		inspecting the page structure and content, especially for debugging or data extraction purposes.
+		Use `get_html` to reuse the previously fetched source while the page is unchanged.
 
 		Returns:
 			str: The HTML source code of the current page.
@@ -963,7 +1076,9 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			self,
 			element: WebElement,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds a move mouse cursor action to the specified web element.
@@ -978,10 +1093,16 @@ class TrioWebDriverWrapperProtocol(Protocol):
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
 		...
@@ -992,7 +1113,9 @@ class TrioWebDriverWrapperProtocol(Protocol):
 			xoffset: int,
 			yoffset: int,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds an action to move the mouse cursor to an offset from the center of a specified element.
@@ -1009,10 +1132,16 @@ class TrioWebDriverWrapperProtocol(Protocol):
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move-with-offset action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
 		...
@@ -1029,6 +1158,25 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def open_new_target(self, link: str = "", switch_to: bool = True) -> str:
+		"""
+		Opens a new tab with the given URL and returns its window handle.
+
+		If the driver supports Chrome DevTools commands, the tab is created with a `Target.createTarget` command
+		(DevTools target IDs are the window handles), so no JavaScript is executed in the current page. This makes it
+		cheap for several WebDriver instances attached to the same browser (the same debugging port) to work in their own tabs
+		instead of starting a browser each. Otherwise, the tab is opened with `open_new_tab`.
+
+		Args:
+			link (str): URL to open in the new tab. If empty, opens a blank tab. Defaults to "".
+			switch_to (bool): Whether to switch focus to the new tab. Defaults to True.
+
+		Returns:
+			str: The window handle of the new tab.
+		"""
+		
+		...
+	
 	@property
 	def rect(self) -> WindowRect:
 		"""
@@ -1080,7 +1228,12 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
-	async def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	async def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote WebDriver session.
 
@@ -1090,6 +1243,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 		"""
 		
 		...
@@ -1168,6 +1323,23 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def reuse_webdriver(self, clean_session: bool = True):
+		"""
+		Prepares the running browser for the next task instead of restarting it.
+
+		Closing and starting the browser takes seconds, while cleaning the session takes a few commands.
+		All tabs except the first one are closed, focus is switched to the first tab, and it is navigated to the start page URL.
+		If `clean_session` is True, cookies and site storage are cleared first. With Chrome DevTools, all cookies are deleted
+		and the storage of every origin of an open tab, frame, worker or cookie is cleared; origins that are no longer open
+		and have no cookies are not known to the browser session and keep their storage. Otherwise, the cookies visible
+		to the current page are deleted and the local and session storage of every open tab is cleared.
+
+		Args:
+			clean_session (bool): Whether to clear cookies and site storage. Defaults to True.
+		"""
+		
+		...
+	
 	async def scroll_by_amount_action(
 			self,
 			delta_x: int,
@@ -1351,8 +1523,8 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		Sets both page load timeout and implicit wait timeout for WebDriver.
 
 		A convenience method to set both the page load timeout and the implicit wait timeout
-		in a single operation. This can simplify timeout configuration at the start of tests or
-		when adjusting timeouts dynamically.
+		in a single operation. Both values are sent with one WebDriver `setTimeouts` command
+		instead of one command per timeout.
 
 		Args:
 			page_load_timeout (float): The page load timeout value in seconds.
@@ -1447,11 +1619,11 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		Sets the proxy.
 
 		Configures the browser to use a proxy server for network requests. This can be a single proxy server or a list
-		of proxy servers, from which one will be randomly selected for use. Proxies are used to route browser traffic
+		of proxy servers, which are used in a shuffled round-robin order. Proxies are used to route browser traffic
 		through an intermediary server, often for anonymity, security, or accessing geo-restricted content.
 
 		Args:
-			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, a proxy will be randomly chosen from the list.
+			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, the next proxy of its shuffled rotation is used.
 				If None, proxy settings are removed.
 		"""
 		
@@ -1552,13 +1724,25 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def switch_to_default_content(self):
+		"""
+		Switches the driver's focus back to the top-level document of the current window.
+
+		Use it instead of `driver.switch_to.default_content()`, so the driver knows that predefined
+		JavaScript snippets can be run over DevTools again.
+		"""
+		
+		...
+	
 	async def switch_to_frame(self, frame: Union[str, int, WebElement]):
 		"""
 		Switches the driver's focus to a frame.
 
 		Changes the WebDriver's focus to a specific frame within the current page. Frames are often used to embed
 		content from other sources within a webpage. After switching to a frame, all WebDriver commands will be
-		directed to elements within that frame until focus is switched back.
+		directed to elements within that frame until focus is switched back with `switch_to_parent_frame`,
+		`switch_to_default_content` or `switch_to_window`. Use these methods instead of `driver.switch_to`,
+		as only they keep track of the focused frame.
 
 		Args:
 			frame (Union[str, int, WebElement]): Specifies the frame to switch to. Can be a frame name (str), index (int), or a WebElement representing the frame.
@@ -1566,6 +1750,16 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def switch_to_parent_frame(self):
+		"""
+		Switches the driver's focus to the parent of the current frame.
+
+		Use it instead of `driver.switch_to.parent_frame()`, so the driver keeps track of the frame it is focused on.
+		Does nothing if the driver is focused on a top-level browsing context.
+		"""
+		
+		...
+	
 	async def switch_to_window(self, window: Optional[Union[str, int]] = None):
 		"""
 		Switches the driver's focus to the specified browser window.
@@ -1641,6 +1835,26 @@ class TrioWebDriverWrapperProtocol(Protocol):
 		
 		...
 	
+	async def wait_for_element(self, by: By, value: str, timeout: float = 5) -> Optional[WebElement]:
+		"""
+		Waits for a web element to appear on the page without polling.
+
+		For CSS selectors and XPath, a `MutationObserver` is registered in the page and the element is returned
+		as soon as a DOM change makes it match, instead of repeatedly querying the DOM like an implicit wait does.
+		Other locator strategies fall back to `find_web_element` with the timeout as a temporary implicit wait.
+		The timeout must not exceed the WebDriver script timeout (30 seconds by default).
+
+		Args:
+			by (By): Locator strategy to use (e.g., By.CSS_SELECTOR, By.XPATH).
+			value (str): Locator value. Used with the 'by' strategy to identify the element.
+			timeout (float): Maximum time to wait for the element in seconds. Defaults to 5.
+
+		Returns:
+			Optional[WebElement]: The found web element, or None if it did not appear within the timeout.
+		"""
+		
+		...
+	
 	@property
 	def windows_handles(self) -> list[str]:
 		"""
@@ -1980,7 +2194,7 @@ class BrowserWebDriverProtocol(Protocol):
 	"""
 	
 	_window_rect: WindowRect
-	_js_scripts: dict[str, str]
+	_js_scripts: JS_Scripts
 	_browser_exe: Union[str, pathlib.Path]
 	_webdriver_path: str
 	_webdriver_start_args: BrowserStartArgs
@@ -1992,6 +2206,13 @@ class BrowserWebDriverProtocol(Protocol):
 	_enable_devtools: bool
 	trio_capacity_limiter: trio.CapacityLimiter
 	dev_tools: "DevTools"
+	_find_cache: dict[tuple, tuple[tuple[int, int, int], Union[WebElement, list[WebElement]]]]
+	_html_cache: Optional[tuple[tuple[int, int], str]]
+	_frame_depth: int
+	_compiled_js_scripts: dict[str, str]
+	_timeouts_cache: dict[str, Optional[int]]
+	_automation_hidden: Optional[bool]
+	_webdriver_active_check: Optional[tuple[float, bool]]
 	
 	def __init__(
 			self,
@@ -2015,6 +2236,33 @@ class BrowserWebDriverProtocol(Protocol):
 	):
 		...
 	
+	def __enter__(self) -> "BrowserWebDriverProtocol":
+		"""
+		Enters the WebDriver context.
+
+		Returns:
+			BrowserWebDriverProtocol: This WebDriver instance.
+		"""
+		
+		...
+	
+	def __exit__(
+			self,
+			exc_type: Optional[type],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType]
+	):
+		"""
+		Exits the WebDriver context and closes the WebDriver if it is running.
+
+		Args:
+			exc_type (Optional[type]): The exception type, if any, that caused the context to be exited.
+			exc_val (Optional[BaseException]): The exception value, if any.
+			exc_tb (Optional[TracebackType]): The exception traceback, if any.
+		"""
+		
+		...
+	
 	def build_action_chains(
 			self,
 			duration: int = 250,
@@ -2086,6 +2334,7 @@ class BrowserWebDriverProtocol(Protocol):
 
 		Determines a random target point within the element's bounding box (using `get_random_element_point`)
 		and then uses `build_hm_move_action` to create a human-like movement sequence to that point.
+		If the element has no visible point, no move is added.
 
 		Args:
 			start_position (ActionPoint): The starting coordinates for the mouse movement.
@@ -2280,7 +2529,7 @@ class BrowserWebDriverProtocol(Protocol):
 		"""
 		Closes all open windows.
 
-		Iterates through all window handles and closes each window associated with the WebDriver instance.
+		Closes every window associated with the WebDriver instance using `close_windows`.
 		This effectively closes the entire browser session managed by the driver.
 		"""
 		
@@ -2303,6 +2552,23 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def close_windows(self, windows: Optional[list[Union[str, int]]] = None):
+		"""
+		Closes several browser windows at once.
+
+		If the driver supports Chrome DevTools commands, each window is closed with a `Target.closeTarget`
+		command (window handles are the DevTools target IDs), without switching focus to it first. If the
+		focused window was closed, focus is switched to the last remaining window. Otherwise, the windows
+		are closed one by one with `close_window`.
+
+		Args:
+			windows (Optional[list[Union[str, int]]]): Identifiers of the windows to close.
+				Each one can be a window handle (string) or an index (int) in the list of window handles.
+				If None, all windows are closed. Defaults to None.
+		"""
+		
+		...
+	
 	def context_click_action(
 			self,
 			element: Optional[WebElement] = None,
@@ -2467,6 +2733,22 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def batch_execute_js_scripts(self, scripts: Iterable[str]) -> list[Any]:
+		"""
+		Executes several argument-less JavaScript scripts with a single WebDriver command.
+
+		The scripts are combined into one script that runs them in order and returns the list of their results,
+		so N scripts cost one round trip instead of N.
+
+		Args:
+			scripts (Iterable[str]): The JavaScript code of the scripts. Each script must `return` its result.
+
+		Returns:
+			list[Any]: The results of the scripts, in the same order as the scripts.
+		"""
+		
+		...
+	
 	def find_inner_web_element(
 			self,
 			parent_element: WebElement,
@@ -2474,6 +2756,7 @@ class BrowserWebDriverProtocol(Protocol):
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element within another element.
@@ -2487,6 +2770,7 @@ class BrowserWebDriverProtocol(Protocol):
 			value (str): Locator value. The actual string used by the locator strategy to find the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Overrides default if provided. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Overrides default if provided. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element. If no element is found within the timeout, a `NoSuchElementException` is raised.
@@ -2501,6 +2785,8 @@ class BrowserWebDriverProtocol(Protocol):
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements within another element.
@@ -2514,6 +2800,8 @@ class BrowserWebDriverProtocol(Protocol):
 			value (str): Locator value. Used in conjunction with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
@@ -2526,7 +2814,8 @@ class BrowserWebDriverProtocol(Protocol):
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element on the page.
@@ -2539,6 +2828,7 @@ class BrowserWebDriverProtocol(Protocol):
 			value (str): Locator value. Used with the 'by' strategy to identify the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element.
@@ -2554,7 +2844,9 @@ class BrowserWebDriverProtocol(Protocol):
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements on the page.
@@ -2567,6 +2859,8 @@ class BrowserWebDriverProtocol(Protocol):
 			value (str): Locator value. Used with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
@@ -2588,15 +2882,21 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
-	def get_element_css_style(self, element: WebElement) -> dict[str, str]:
+	def get_element_css_style(
+			self,
+			element: WebElement,
+			properties: Optional[Iterable[str]] = None
+	) -> dict[str, str]:
 		"""
 		Retrieves the computed CSS style of a WebElement.
 
-		Uses JavaScript to get all computed CSS properties and their values for a given web element.
+		Uses JavaScript to get computed CSS properties and their values for a given web element.
 		Returns a dictionary where keys are CSS property names and values are their computed values.
+		Requesting only the needed properties keeps the transferred payload small.
 
 		Args:
 			element (WebElement): The WebElement for which to retrieve the CSS style.
+			properties (Optional[Iterable[str]]): Names of the CSS properties to retrieve. If None, all computed properties are retrieved. Defaults to None.
 
 		Returns:
 			dict[str, str]: A dictionary of CSS property names and their computed values as strings.
@@ -2622,21 +2922,37 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
-	def get_random_element_point(self, element: WebElement) -> ActionPoint:
+	def get_element_rects_in_viewport(self, elements: list[WebElement]) -> list[Rectangle]:
+		"""
+		Gets the positions and dimensions of several elements relative to the viewport.
+
+		Executes a predefined JavaScript snippet that calculates the bounding rectangles of all
+		given elements with a single call, instead of one call per element.
+
+		Args:
+			elements (list[WebElement]): The Selenium WebElements whose rectangles are needed.
+
+		Returns:
+			list[Rectangle]: TypedDicts containing the 'x', 'y', 'width', and 'height' of each element
+					   relative to the viewport's top-left corner, in the order of `elements`.
+		"""
+		
+		...
+	
+	def get_random_element_point(self, element: WebElement) -> Optional[ActionPoint]:
 		"""
 		Gets the coordinates of a random point within an element, relative to the viewport origin.
 
-		Calculates a random point within the visible portion of the element relative to the
-		element's own top-left corner. It then adds the element's top-left coordinates
-		(relative to the viewport) to get the final coordinates of the random point,
-		also relative to the viewport's top-left origin (0,0).
+		Calculates a random point within the visible portion of the element with a single JavaScript call,
+		which returns the point's coordinates relative to the viewport's top-left origin (0,0) directly.
 
 		Args:
 			element (WebElement): The target element within which to find a random point.
 
 		Returns:
-			ActionPoint: An ActionPoint named tuple containing the 'x' and 'y' coordinates
-						 of the random point within the element, relative to the viewport origin.
+			Optional[ActionPoint]: An ActionPoint containing the 'x' and 'y' coordinates of the random point
+				within the element, relative to the viewport origin. None if no visible point of the element
+				is found (e.g., it is scrolled out of the viewport or fully covered by other elements).
 		"""
 		
 		...
@@ -2655,9 +2971,40 @@ class BrowserWebDriverProtocol(Protocol):
 				will be multiples of this step within the valid range. Defaults to 1 (any pixel).
 
 		Returns:
-			Position: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
+			Optional[Position]: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
 					  within the element's visible area in the viewport. Coordinates are relative
-					  to the element's top-left corner (0,0).
+					  to the element's top-left corner (0,0). None if the element has no visible point in the viewport.
+		"""
+		
+		...
+	
+	def get_remote_capabilities(self) -> dict[str, Any]:
+		"""
+		Gets the capabilities returned by the server for the current WebDriver session.
+
+		Pass them to `remote_connect_driver` together with the values of `get_vars_for_remote`, so the attached driver
+		knows the real session values (e.g., `webSocketUrl` or `se:cdp`) needed for BiDi and DevTools connections.
+
+		Returns:
+			dict[str, Any]: The session capabilities.
+		"""
+		
+		...
+	
+	def get_html(self, use_cache: bool = False) -> str:
+		"""
+		Gets the current page source, optionally reusing the previously fetched one.
+
+		Without caching this is the same as the `html` property. With `use_cache`, the DOM mutation counter
+		maintained in the page is compared with the one the cached source was fetched at;
+		if the DOM has not been mutated since then, the cached source is returned without transferring the page source again.
+		Checking the counter costs one JavaScript call, so caching only pays off for large pages that are read repeatedly.
+
+		Args:
+			use_cache (bool): If True, returns the previously fetched source when the DOM has not been mutated since then. Defaults to False.
+
+		Returns:
+			str: The HTML source code of the current page.
 		"""
 		
 		...
@@ -2704,6 +3051,17 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def get_viewport_rect_and_document_scroll_size(self) -> tuple[Rectangle, Size]:
+		"""
+		Gets the viewport rectangle and the document's scrollable size with a single command.
+
+		Returns:
+			tuple[Rectangle, Size]: The viewport rectangle (as `get_viewport_rect` returns it)
+				and the document scroll size (as `get_document_scroll_size` returns it).
+		"""
+		
+		...
+	
 	def get_viewport_size(self) -> Size:
 		"""
 		Gets the current dimensions (width and height) of the browser's viewport.
@@ -2754,6 +3112,7 @@ class BrowserWebDriverProtocol(Protocol):
 
 		Retrieves the HTML source code of the currently loaded webpage. This is useful for
 		inspecting the page structure and content, especially for debugging or data extraction purposes.
+		Use `get_html` to reuse the previously fetched source while the page is unchanged.
 
 		Returns:
 			str: The HTML source code of the current page.
@@ -2841,7 +3200,9 @@ class BrowserWebDriverProtocol(Protocol):
 			self,
 			element: WebElement,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds a move mouse cursor action to the specified web element.
@@ -2856,10 +3217,16 @@ class BrowserWebDriverProtocol(Protocol):
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
 		...
@@ -2870,7 +3237,9 @@ class BrowserWebDriverProtocol(Protocol):
 			xoffset: int,
 			yoffset: int,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds an action to move the mouse cursor to an offset from the center of a specified element.
@@ -2887,10 +3256,16 @@ class BrowserWebDriverProtocol(Protocol):
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move-with-offset action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
 		...
@@ -2907,6 +3282,25 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def open_new_target(self, link: str = "", switch_to: bool = True) -> str:
+		"""
+		Opens a new tab with the given URL and returns its window handle.
+
+		If the driver supports Chrome DevTools commands, the tab is created with a `Target.createTarget` command
+		(DevTools target IDs are the window handles), so no JavaScript is executed in the current page. This makes it
+		cheap for several WebDriver instances attached to the same browser (the same debugging port) to work in their own tabs
+		instead of starting a browser each. Otherwise, the tab is opened with `open_new_tab`.
+
+		Args:
+			link (str): URL to open in the new tab. If empty, opens a blank tab. Defaults to "".
+			switch_to (bool): Whether to switch focus to the new tab. Defaults to True.
+
+		Returns:
+			str: The window handle of the new tab.
+		"""
+		
+		...
+	
 	@property
 	def rect(self) -> WindowRect:
 		"""
@@ -2958,7 +3352,12 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote WebDriver session.
 
@@ -2968,6 +3367,8 @@ class BrowserWebDriverProtocol(Protocol):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 		"""
 		
 		...
@@ -2991,8 +3392,8 @@ class BrowserWebDriverProtocol(Protocol):
 		Sets both page load timeout and implicit wait timeout for WebDriver.
 
 		A convenience method to set both the page load timeout and the implicit wait timeout
-		in a single operation. This can simplify timeout configuration at the start of tests or
-		when adjusting timeouts dynamically.
+		in a single operation. Both values are sent with one WebDriver `setTimeouts` command
+		instead of one command per timeout.
 
 		Args:
 			page_load_timeout (float): The page load timeout value in seconds.
@@ -3074,11 +3475,11 @@ class BrowserWebDriverProtocol(Protocol):
 		Sets the proxy.
 
 		Configures the browser to use a proxy server for network requests. This can be a single proxy server or a list
-		of proxy servers, from which one will be randomly selected for use. Proxies are used to route browser traffic
+		of proxy servers, which are used in a shuffled round-robin order. Proxies are used to route browser traffic
 		through an intermediary server, often for anonymity, security, or accessing geo-restricted content.
 
 		Args:
-			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, a proxy will be randomly chosen from the list.
+			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, the next proxy of its shuffled rotation is used.
 				If None, proxy settings are removed.
 		"""
 		
@@ -3120,6 +3521,26 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def switch_to_default_content(self):
+		"""
+		Switches the driver's focus back to the top-level document of the current window.
+
+		Use it instead of `driver.switch_to.default_content()`, so the driver knows that predefined
+		JavaScript snippets can be run over DevTools again.
+		"""
+		
+		...
+	
+	def switch_to_parent_frame(self):
+		"""
+		Switches the driver's focus to the parent of the current frame.
+
+		Use it instead of `driver.switch_to.parent_frame()`, so the driver keeps track of the frame it is focused on.
+		Does nothing if the driver is focused on a top-level browsing context.
+		"""
+		
+		...
+	
 	def switch_to_window(self, window: Optional[Union[str, int]] = None):
 		"""
 		Switches the driver's focus to the specified browser window.
@@ -3169,6 +3590,26 @@ class BrowserWebDriverProtocol(Protocol):
 		
 		...
 	
+	def wait_for_element(self, by: By, value: str, timeout: float = 5) -> Optional[WebElement]:
+		"""
+		Waits for a web element to appear on the page without polling.
+
+		For CSS selectors and XPath, a `MutationObserver` is registered in the page and the element is returned
+		as soon as a DOM change makes it match, instead of repeatedly querying the DOM like an implicit wait does.
+		Other locator strategies fall back to `find_web_element` with the timeout as a temporary implicit wait.
+		The timeout must not exceed the WebDriver script timeout (30 seconds by default).
+
+		Args:
+			by (By): Locator strategy to use (e.g., By.CSS_SELECTOR, By.XPATH).
+			value (str): Locator value. Used with the 'by' strategy to identify the element.
+			timeout (float): Maximum time to wait for the element in seconds. Defaults to 5.
+
+		Returns:
+			Optional[WebElement]: The found web element, or None if it did not appear within the timeout.
+		"""
+		
+		...
+	
 	@property
 	def windows_handles(self) -> list[str]:
 		"""
@@ -0,0 +1,118 @@
+import math
+from copy import copy
+from typing import Any, Optional, Union
+from selenium import webdriver
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+class AttachedRemote(webdriver.Remote):
+	"""
+	Remote WebDriver that attaches to an existing session instead of creating one.
+
+	`webdriver.Remote` always sends a `New Session` command on construction, which launches a throwaway
+	browser session before the caller can switch `session_id` to the one it wants. This class skips that command
+	and uses the given session ID directly, so attaching costs no round trip at all.
+
+	Attributes:
+		_attached_session_id (str): The ID of the existing WebDriver session to attach to.
+		_attached_capabilities (Optional[dict[str, Any]]): The capabilities returned by the server when the session was created.
+	"""
+	
+	def __init__(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			options: Any,
+			capabilities: Optional[dict[str, Any]] = None
+	):
+		"""
+		Initializes AttachedRemote.
+
+		Args:
+			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
+			session_id (str): The ID of the existing WebDriver session to attach to.
+			options (Any): Browser options describing the session (e.g., ChromeOptions, FirefoxOptions).
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server when the session was created
+				(the `caps` of the original driver). Values such as `webSocketUrl`, `se:cdp` or `browserVersion` are only known from them.
+				If None, the requested capabilities of `options` are used. Defaults to None.
+		"""
+		
+		self._attached_session_id = session_id
+		self._attached_capabilities = capabilities
+		
+		super().__init__(command_executor=command_executor, options=options)
+	
+	def start_session(self, capabilities: dict) -> None:
+		"""
+		Attaches to the existing session instead of creating a new one.
+
+		The session capabilities are the ones returned by the server for the original session if they were given,
+		as the requested capabilities contain placeholders (e.g., `webSocketUrl: True`) instead of the real values.
+
+		Args:
+			capabilities (dict): The capabilities requested by the options, used only if no session capabilities were given.
+		"""
+		
+		self.session_id = self._attached_session_id
+		self.caps = self._attached_capabilities if self._attached_capabilities is not None else capabilities
+
+
+def get_remote_connection(
+		command_executor: Union[str, RemoteConnection],
+		keep_alive: bool = True,
+		pool_maxsize: int = 32
+) -> RemoteConnection:
+	"""
+	Builds a keep-alive RemoteConnection with a connection pool of the given size.
+
+	The pool size is passed to Selenium through `ClientConfig.init_args_for_pool_manager`, so the timeout, proxy
+	and certificate settings of the client config still apply, and concurrent commands reuse up to `pool_maxsize`
+	kept-alive HTTP connections instead of opening a new one per request.
+	Every call builds its own connection, so quitting one driver doesn't close the connections of others.
+
+	Args:
+		command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
+			For a `RemoteConnection` object (e.g., from `get_vars_for_remote`), a new connection is built from a copy of its client config,
+			as the object itself is closed when its driver quits.
+		keep_alive (bool): Whether to ask the server to keep HTTP connections alive. Defaults to True.
+		pool_maxsize (int): The number of connections kept per host. Defaults to 32.
+
+	Returns:
+		RemoteConnection: The connection to pass as the `command_executor` of a remote WebDriver.
+	"""
+	
+	if isinstance(command_executor, RemoteConnection):
+		client_config = copy(command_executor._client_config)
+	else:
+		client_config = ClientConfig(remote_server_addr=command_executor)
+	
+	pool_manager_args = client_config.init_args_for_pool_manager.get("init_args_for_pool_manager", {})
+	
+	client_config.keep_alive = keep_alive
+	client_config.init_args_for_pool_manager = {"init_args_for_pool_manager": {**pool_manager_args, "maxsize": pool_maxsize}}
+	
+	return RemoteConnection(client_config=client_config)
+
+
+def set_connection_pool_size(remote_connection: RemoteConnection, size: Union[int, float], min_size: int = 20):
+	"""
+	Resizes the per-host connection pool of a RemoteConnection.
+
+	Selenium creates the `urllib3.PoolManager` of a local driver with one connection per host,
+	so concurrent commands (e.g. from Trio tasks) wait for each other and log "connection pool is full" warnings.
+	The new size applies to the connections opened after this call; already opened ones are dropped.
+
+	Args:
+		remote_connection (RemoteConnection): The command executor of the driver.
+		size (Union[int, float]): The wanted pool size, usually the Trio capacity limiter total tokens. An infinite size is replaced with `min_size`.
+		min_size (int): The smallest pool size to use. Defaults to 20.
+	"""
+	
+	pool_manager = getattr(remote_connection, "_conn", None)
+	
+	if pool_manager is None:
+		return
+	
+	pool_manager.connection_pool_kw["maxsize"] = max(min_size, int(size)) if math.isfinite(size) else min_size
+	pool_manager.clear()
@@ -0,0 +1,125 @@
+import atexit
+import threading
+from functools import lru_cache
+from selenium.webdriver.common.service import Service
+
+
+_SHARED_SERVICES: dict[tuple[type, str], Service] = {}
+_SHARED_SERVICES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_shared_service_class(service_class: type[Service]) -> type[Service]:
+	"""
+	Builds a subclass of a Selenium service class whose instances can be shared by several WebDrivers.
+
+	Selenium WebDrivers call `start` on their service when they are created and `stop` when they quit.
+	The subclass starts its process only if it is not running yet and ignores `stop`,
+	so one WebDriver quitting doesn't kill the driver process used by the others.
+	The process is stopped by `stop_shared_services` instead.
+
+	Args:
+		service_class (type[Service]): The Selenium service class to extend (e.g., Edge or Chrome `Service`).
+
+	Returns:
+		type[Service]: The shareable service class.
+	"""
+	
+	class SharedService(service_class):
+		"""
+		Selenium service that keeps one driver process for several WebDrivers.
+
+		Attributes:
+			_start_lock (threading.Lock): Serializes starts of the driver process.
+		"""
+	
+		def __init__(self, *args, **kwargs):
+			"""
+			Initializes SharedService.
+
+			Args:
+				*args: Positional arguments of the extended service class.
+				**kwargs: Keyword arguments of the extended service class.
+			"""
+			
+			self._start_lock = threading.Lock()
+			self.process = None
+			
+			super().__init__(*args, **kwargs)
+	
+		def start(self) -> None:
+			"""
+			Starts the driver process if it is not running.
+			"""
+			
+			with self._start_lock:
+				if self.process is None or self.process.poll() is not None:
+					super().start()
+	
+		def stop(self) -> None:
+			"""
+			Does nothing, the process is stopped by `stop_shared_services`.
+			"""
+			
+			pass
+	
+		def stop_shared(self) -> None:
+			"""
+			Stops the driver process.
+			"""
+			
+			super().stop()
+	
+	SharedService.__name__ = f"Shared{service_class.__name__}"
+	SharedService.__qualname__ = SharedService.__name__
+	
+	return SharedService
+
+
+def get_shared_service(service_class: type[Service], executable_path: str) -> Service:
+	"""
+	Returns a started service process shared by all WebDrivers that use the same driver executable.
+
+	Every Selenium WebDriver normally starts its own driver process (msedgedriver, chromedriver, ...),
+	which costs a process start and a port per browser. The driver process can serve several sessions,
+	so WebDrivers created with the same executable reuse one process. A process that exited is started again.
+
+	Args:
+		service_class (type[Service]): The Selenium service class of the browser (e.g., Edge or Chrome `Service`).
+		executable_path (str): Path to the driver executable.
+
+	Returns:
+		Service: The started shared service.
+	"""
+	
+	key = (service_class, str(executable_path))
+	
+	with _SHARED_SERVICES_LOCK:
+		service = _SHARED_SERVICES.get(key)
+	
+		if service is None:
+			service = _get_shared_service_class(service_class)(executable_path=executable_path)
+			_SHARED_SERVICES[key] = service
+	
+	service.start()
+	
+	return service
+
+
+@atexit.register
+def stop_shared_services():
+	"""
+	Stops all shared driver processes.
+
+	Called automatically when the interpreter exits.
+	"""
+	
+	with _SHARED_SERVICES_LOCK:
+		services = list(_SHARED_SERVICES.values())
+		_SHARED_SERVICES.clear()
+	
+	for service in services:
+		try:
+			service.stop_shared()
+		except Exception:
+			pass
@@ -1,3 +1,5 @@
+import sys
+import shlex
 import pathlib
 from typing import Optional, Union
 from osn_bas.webdrivers._functions import (
@@ -5,6 +7,9 @@ from osn_bas.webdrivers._functions import (
 )
 
 
+_UNSET = object()
+
+
 class BrowserStartArgs:
 	"""
 	Manages browser start arguments for WebDriver.
@@ -22,15 +27,60 @@ class BrowserStartArgs:
 		_mute_audio_command_line (str): Command-line argument to mute audio.
 		_user_agent_command_line (str): Command-line format string for setting the user agent.
 		_proxy_server_command_line (str): Command-line format string for setting the proxy server.
-		start_page_url (str): URL to open when the browser starts.
-		debugging_port (Optional[int]): Current debugging port number, can be None if not set.
-		profile_dir (Optional[str]): Current profile directory path, can be None if not set.
-		headless_mode (bool): Current headless mode status.
-		mute_audio (bool): Current mute audio status.
-		user_agent (Optional[str]): Current user agent string, can be None if not set.
-		proxy_server (Optional[str]): Current proxy server address, can be None if not set.
+		_debugging_port (Optional[int]): Current debugging port number, can be None if not set.
+		_profile_dir (Optional[str]): Current profile directory path, can be None if not set.
+		_headless_mode (bool): Current headless mode status.
+		_mute_audio (bool): Current mute audio status.
+		_user_agent (Optional[str]): Current user agent string, can be None if not set.
+		_proxy_server (Optional[str]): Current proxy server address, can be None if not set.
+		_debugging_port_template_parts (tuple[str, Optional[str]]): The debugging port template split around its placeholder.
+		_profile_dir_template_parts (tuple[str, Optional[str]]): The profile directory template split around its placeholder.
+		_user_agent_template_parts (tuple[str, Optional[str]]): The user agent template split around its placeholder.
+		_proxy_server_template_parts (tuple[str, Optional[str]]): The proxy server template split around its placeholder.
+		_fragments (dict[str, str]): Formatted command-line fragments keyed by option name, in command order.
+			An empty string means the option is not set.
+		_start_page_url (str): URL to open when the browser starts.
+		_start_page_suffix (str): The start page URL prefixed with a space, or an empty string if no URL is set.
+		_debugging_port_argv_parts (tuple[tuple[str, Optional[str]], ...]): The debugging port template split into argv tokens and around its placeholder.
+		_profile_dir_argv_parts (tuple[tuple[str, Optional[str]], ...]): The profile directory template split into argv tokens and around its placeholder.
+		_user_agent_argv_parts (tuple[tuple[str, Optional[str]], ...]): The user agent template split into argv tokens and around its placeholder.
+		_proxy_server_argv_parts (tuple[tuple[str, Optional[str]], ...]): The proxy server template split into argv tokens and around its placeholder.
+		_argv_fragments (dict[str, tuple[str, ...]]): Unquoted argv tokens keyed by option name, in command order.
+			An empty tuple means the option is not set.
+		_start_command (Optional[str]): Cached start command, or None if a setting changed since it was last built.
+		_start_argv_tuple (Optional[tuple[str, ...]]): Cached start argument vector, or None if a setting changed since it was last built.
 	"""
 	
+	__slots__ = (
+		"_browser_exe",
+		"_debugging_port_command_line",
+		"_profile_dir_command_line",
+		"_headless_mode_command_line",
+		"_mute_audio_command_line",
+		"_user_agent_command_line",
+		"_proxy_server_command_line",
+		"_debugging_port_template_parts",
+		"_profile_dir_template_parts",
+		"_user_agent_template_parts",
+		"_proxy_server_template_parts",
+		"_debugging_port",
+		"_profile_dir",
+		"_headless_mode",
+		"_mute_audio",
+		"_user_agent",
+		"_proxy_server",
+		"_fragments",
+		"_start_page_url",
+		"_start_page_suffix",
+		"_debugging_port_argv_parts",
+		"_profile_dir_argv_parts",
+		"_user_agent_argv_parts",
+		"_proxy_server_argv_parts",
+		"_argv_fragments",
+		"_start_command",
+		"_start_argv_tuple",
+	)
+	
 	def __init__(
 			self,
 			browser_exe: Union[str, pathlib.Path],
@@ -47,6 +97,7 @@ class BrowserStartArgs:
 		This method sets up the BrowserStartArgs instance by storing the browser executable path,
 		command-line format strings for various browser options, and the initial start page URL.
 		It also initializes attributes to hold the current values for these options and builds the initial start command.
+		The templates are interned, so every instance created with the same templates shares the same string objects.
 
 		Args:
 			browser_exe (Union[str, pathlib.Path]): Path to the browser executable.
@@ -58,20 +109,149 @@ class BrowserStartArgs:
 			proxy_server_command_line (str): Command-line format string for proxy server.
 		"""
 		
-		self._browser_exe = browser_exe
-		self._debugging_port_command_line = debugging_port_command_line
-		self._profile_dir_command_line = profile_dir_command_line
-		self._headless_mode_command_line = headless_mode_command_line
-		self._mute_audio_command_line = mute_audio_command_line
-		self._user_agent_command_line = user_agent_command_line
-		self._proxy_server_command_line = proxy_server_command_line
-		self.debugging_port: Optional[int] = None
-		self.profile_dir: Optional[str] = None
-		self.headless_mode = False
-		self.mute_audio = False
-		self.user_agent: Optional[str] = None
-		self.proxy_server: Optional[str] = None
-		self.start_page_url = ""
+		self._debugging_port_command_line = sys.intern(debugging_port_command_line)
+		self._profile_dir_command_line = sys.intern(profile_dir_command_line)
+		self._headless_mode_command_line = sys.intern(headless_mode_command_line)
+		self._mute_audio_command_line = sys.intern(mute_audio_command_line)
+		self._user_agent_command_line = sys.intern(user_agent_command_line)
+		self._proxy_server_command_line = sys.intern(proxy_server_command_line)
+		self._debugging_port_template_parts = self._split_template(debugging_port_command_line)
+		self._profile_dir_template_parts = self._split_template(profile_dir_command_line)
+		self._user_agent_template_parts = self._split_template(user_agent_command_line)
+		self._proxy_server_template_parts = self._split_template(proxy_server_command_line)
+		self._debugging_port_argv_parts = self._split_argv_template(debugging_port_command_line)
+		self._profile_dir_argv_parts = self._split_argv_template(profile_dir_command_line)
+		self._user_agent_argv_parts = self._split_argv_template(user_agent_command_line)
+		self._proxy_server_argv_parts = self._split_argv_template(proxy_server_command_line)
+		self._debugging_port: Optional[int] = None
+		self._profile_dir: Optional[str] = None
+		self._headless_mode: bool = False
+		self._mute_audio: bool = False
+		self._user_agent: Optional[str] = None
+		self._proxy_server: Optional[str] = None
+		self._fragments: dict[str, str] = {
+			"browser_exe": "",
+			"debugging_port": "",
+			"profile_dir": "",
+			"headless_mode": "",
+			"mute_audio": "",
+			"user_agent": "",
+			"proxy_server": "",
+		}
+		self._argv_fragments: dict[str, tuple[str, ...]] = {
+			"browser_exe": (),
+			"debugging_port": (),
+			"profile_dir": (),
+			"headless_mode": (),
+			"mute_audio": (),
+			"user_agent": (),
+			"proxy_server": (),
+		}
+		self._start_page_url = ""
+		self._start_page_suffix = ""
+		self._start_command: Optional[str] = None
+		self._start_argv_tuple: Optional[tuple[str, ...]] = None
+		self.browser_exe = browser_exe
+	
+	@staticmethod
+	def _fill_argv_template(parts: tuple[tuple[str, Optional[str]], ...], value: object) -> tuple[str, ...]:
+		"""
+		Builds argv tokens from a template split by `_split_argv_template`.
+
+		Args:
+			parts (tuple[tuple[str, Optional[str]], ...]): The split argv template.
+			value (object): The value to put in place of the placeholder.
+
+		Returns:
+			tuple[str, ...]: The unquoted argv tokens with the placeholder replaced by the given value.
+		"""
+		
+		value = str(value)
+		
+		return tuple(prefix if suffix is None else prefix + value + suffix for prefix, suffix in parts)
+	
+	@staticmethod
+	def _fill_template(parts: tuple[str, Optional[str]], value: object) -> str:
+		"""
+		Builds a command-line fragment from a template split by `_split_template`.
+
+		Args:
+			parts (tuple[str, Optional[str]]): The split template.
+			value (object): The value to put in place of the placeholder.
+
+		Returns:
+			str: The template with the placeholder replaced by the given value.
+		"""
+		
+		prefix, suffix = parts
+		
+		if suffix is None:
+			return prefix
+		
+		return prefix + str(value) + suffix
+	
+	@staticmethod
+	def _split_argv_template(template: str) -> tuple[tuple[str, Optional[str]], ...]:
+		"""
+		Splits a command-line template into argv tokens, each split around the `{value}` placeholder.
+
+		The template is split into tokens the way a shell would, which removes the quotes around the placeholder,
+		so the filled tokens can be passed to `subprocess.Popen` without `shell=True`.
+
+		Args:
+			template (str): The command-line template, e.g. `--user-data-dir="{value}"`.
+
+		Returns:
+			tuple[tuple[str, Optional[str]], ...]: The split template of every token.
+		"""
+		
+		return tuple(BrowserStartArgs._split_template(token) for token in shlex.split(template))
+	
+	@staticmethod
+	def _split_template(template: str) -> tuple[str, Optional[str]]:
+		"""
+		Splits a command-line template around its `{value}` placeholder.
+
+		The template is split once, so filling in a value is a plain string concatenation
+		instead of parsing the template with `str.format` on every call.
+
+		Args:
+			template (str): The command-line template, e.g. `--remote-debugging-port={value}`.
+
+		Returns:
+			tuple[str, Optional[str]]: The parts before and after the placeholder.
+				The second part is None if the template has no placeholder, and the template is used as is.
+		"""
+		
+		prefix, placeholder, suffix = template.partition("{value}")
+		
+		if not placeholder:
+			return template, None
+		
+		return prefix, suffix
+	
+	def _rebuild_start_argv(self):
+		"""
+		Rebuilds the cached start argument vector from the current argv fragments.
+
+		Called only when the argument vector is read, so reading `start_argv` never joins the command string.
+		"""
+		
+		start_argv = [token for fragment in self._argv_fragments.values() for token in fragment]
+		
+		if self._start_page_url:
+			start_argv.append(self._start_page_url)
+		
+		self._start_argv_tuple = tuple(sys.intern(token) for token in start_argv)
+	
+	def _rebuild_start_command(self):
+		"""
+		Rebuilds the cached start command string from the current command fragments.
+
+		Called only when the start command is read, so callers that launch the browser from `start_argv` never pay for the join.
+		"""
+		
+		self._start_command = " ".join(fragment for fragment in self._fragments.values() if fragment) + self._start_page_suffix
 	
 	@property
 	def browser_exe(self) -> Union[str, pathlib.Path]:
@@ -86,6 +266,28 @@ class BrowserStartArgs:
 		
 		return self._browser_exe
 	
+	@browser_exe.setter
+	def browser_exe(self, browser_exe: Union[str, pathlib.Path]):
+		"""
+		Sets the browser executable path and builds the first start argument for it.
+
+		The first argument is built here once, instead of on every start command composition.
+
+		Args:
+			browser_exe (Union[str, pathlib.Path]): Path to the browser executable.
+
+		Raises:
+			TypeError: If `browser_exe` is not of type str or pathlib.Path.
+		"""
+		
+		self._browser_exe = browser_exe
+		self._fragments["browser_exe"] = build_first_start_argument(browser_exe)
+		self._argv_fragments["browser_exe"] = (
+				sys.intern(str(browser_exe.resolve()) if isinstance(browser_exe, pathlib.Path) else browser_exe),
+		)
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	def clear_command(self) -> None:
 		"""
 		Resets all optional arguments for the browser start command.
@@ -102,6 +304,96 @@ class BrowserStartArgs:
 		self.user_agent = None
 		self.proxy_server = None
 	
+	def configure(
+			self,
+			*,
+			debugging_port: Optional[int] = _UNSET,
+			profile_dir: Optional[str] = _UNSET,
+			headless_mode: bool = _UNSET,
+			mute_audio: bool = _UNSET,
+			user_agent: Optional[str] = _UNSET,
+			proxy_server: Optional[str] = _UNSET,
+			start_page_url: str = _UNSET,
+	) -> str:
+		"""
+		Applies several settings at once and returns the resulting start command.
+
+		Only the passed settings are changed, so None can still be used to remove an argument.
+		The start command is composed once, after all settings are applied.
+
+		Args:
+			debugging_port (Optional[int]): The debugging port number, or None to remove the argument.
+			profile_dir (Optional[str]): The profile directory path, or None to remove the argument.
+			headless_mode (bool): True to start the browser in headless mode.
+			mute_audio (bool): True to start the browser with muted audio.
+			user_agent (Optional[str]): The user agent string, or None to remove the argument.
+			proxy_server (Optional[str]): The proxy server address, or None to remove the argument.
+			start_page_url (str): The start page URL, or an empty string to open no page.
+
+		Returns:
+			str: The complete command string to start the browser with specified arguments.
+		"""
+		
+		if debugging_port is not _UNSET:
+			self.debugging_port = debugging_port
+		
+		if profile_dir is not _UNSET:
+			self.profile_dir = profile_dir
+		
+		if headless_mode is not _UNSET:
+			self.headless_mode = headless_mode
+		
+		if mute_audio is not _UNSET:
+			self.mute_audio = mute_audio
+		
+		if user_agent is not _UNSET:
+			self.user_agent = user_agent
+		
+		if proxy_server is not _UNSET:
+			self.proxy_server = proxy_server
+		
+		if start_page_url is not _UNSET:
+			self.start_page_url = start_page_url
+		
+		return self.start_command
+	
+	@property
+	def debugging_port(self) -> Optional[int]:
+		"""
+		Returns the current debugging port number.
+
+		Returns:
+			Optional[int]: The current debugging port number.
+		"""
+		
+		return self._debugging_port
+	
+	@debugging_port.setter
+	def debugging_port(self, debugging_port: Optional[int]):
+		"""
+		Sets the debugging port number and formats its command-line argument.
+
+		Args:
+			debugging_port (Optional[int]): The debugging port number, or None to remove the argument.
+		"""
+		
+		if self._debugging_port == debugging_port:
+			return
+		
+		self._debugging_port = debugging_port
+		self._fragments["debugging_port"] = (
+				self._fill_template(self._debugging_port_template_parts, debugging_port)
+				if debugging_port is not None
+				else ""
+		)
+		self._argv_fragments["debugging_port"] = (
+				self._fill_argv_template(self._debugging_port_argv_parts, debugging_port)
+				if debugging_port is not None
+				else ()
+		)
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	@property
 	def debugging_port_command_line(self) -> str:
 		"""
@@ -116,6 +408,37 @@ class BrowserStartArgs:
 		
 		return self._debugging_port_command_line
 	
+	@property
+	def headless_mode(self) -> bool:
+		"""
+		Returns the current headless mode status.
+
+		Returns:
+			bool: The current headless mode status.
+		"""
+		
+		return self._headless_mode
+	
+	@headless_mode.setter
+	def headless_mode(self, headless_mode: bool):
+		"""
+		Sets the headless mode status and formats its command-line argument.
+
+		Args:
+			headless_mode (bool): True to start the browser in headless mode. The value is stored as a plain bool.
+		"""
+		
+		headless_mode = bool(headless_mode)
+		
+		if self._headless_mode is headless_mode:
+			return
+		
+		self._headless_mode = headless_mode
+		self._fragments["headless_mode"] = self._headless_mode_command_line if headless_mode else ""
+		self._argv_fragments["headless_mode"] = tuple(shlex.split(self._headless_mode_command_line)) if headless_mode else ()
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	@property
 	def headless_mode_command_line(self) -> str:
 		"""
@@ -130,6 +453,37 @@ class BrowserStartArgs:
 		
 		return self._headless_mode_command_line
 	
+	@property
+	def mute_audio(self) -> bool:
+		"""
+		Returns the current mute audio status.
+
+		Returns:
+			bool: The current mute audio status.
+		"""
+		
+		return self._mute_audio
+	
+	@mute_audio.setter
+	def mute_audio(self, mute_audio: bool):
+		"""
+		Sets the mute audio status and formats its command-line argument.
+
+		Args:
+			mute_audio (bool): True to start the browser with muted audio. The value is stored as a plain bool.
+		"""
+		
+		mute_audio = bool(mute_audio)
+		
+		if self._mute_audio is mute_audio:
+			return
+		
+		self._mute_audio = mute_audio
+		self._fragments["mute_audio"] = self._mute_audio_command_line if mute_audio else ""
+		self._argv_fragments["mute_audio"] = tuple(shlex.split(self._mute_audio_command_line)) if mute_audio else ()
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	@property
 	def mute_audio_command_line(self) -> str:
 		"""
@@ -144,6 +498,43 @@ class BrowserStartArgs:
 		
 		return self._mute_audio_command_line
 	
+	@property
+	def profile_dir(self) -> Optional[str]:
+		"""
+		Returns the current profile directory path.
+
+		Returns:
+			Optional[str]: The current profile directory path.
+		"""
+		
+		return self._profile_dir
+	
+	@profile_dir.setter
+	def profile_dir(self, profile_dir: Optional[str]):
+		"""
+		Sets the profile directory path and formats its command-line argument.
+
+		Args:
+			profile_dir (Optional[str]): The profile directory path, or None to remove the argument.
+		"""
+		
+		if self._profile_dir == profile_dir:
+			return
+		
+		self._profile_dir = profile_dir
+		self._fragments["profile_dir"] = (
+				self._fill_template(self._profile_dir_template_parts, profile_dir)
+				if profile_dir is not None
+				else ""
+		)
+		self._argv_fragments["profile_dir"] = (
+				self._fill_argv_template(self._profile_dir_argv_parts, profile_dir)
+				if profile_dir is not None
+				else ()
+		)
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	@property
 	def profile_dir_command_line(self) -> str:
 		"""
@@ -158,6 +549,43 @@ class BrowserStartArgs:
 		
 		return self._profile_dir_command_line
 	
+	@property
+	def proxy_server(self) -> Optional[str]:
+		"""
+		Returns the current proxy server address.
+
+		Returns:
+			Optional[str]: The current proxy server address.
+		"""
+		
+		return self._proxy_server
+	
+	@proxy_server.setter
+	def proxy_server(self, proxy_server: Optional[str]):
+		"""
+		Sets the proxy server address and formats its command-line argument.
+
+		Args:
+			proxy_server (Optional[str]): The proxy server address, or None to remove the argument.
+		"""
+		
+		if self._proxy_server == proxy_server:
+			return
+		
+		self._proxy_server = proxy_server
+		self._fragments["proxy_server"] = (
+				self._fill_template(self._proxy_server_template_parts, proxy_server)
+				if proxy_server is not None
+				else ""
+		)
+		self._argv_fragments["proxy_server"] = (
+				self._fill_argv_template(self._proxy_server_argv_parts, proxy_server)
+				if proxy_server is not None
+				else ()
+		)
+		self._start_command = None
+		self._start_argv_tuple = None
+	
 	@property
 	def proxy_server_command_line(self) -> str:
 		"""
@@ -179,35 +607,113 @@ class BrowserStartArgs:
 
 		Composes the command line arguments based on the current settings
 		(debugging port, profile directory, headless mode, etc.) and the browser executable path.
+		The arguments are formatted once, when the corresponding setting is changed,
+		and the command itself is joined lazily, on the first read after a change.
 
 		Returns:
 			str: The complete command string to start the browser with specified arguments.
 		"""
 		
-		start_args = [build_first_start_argument(self._browser_exe)]
+		if self._start_command is None:
+			self._rebuild_start_command()
+		
+		return self._start_command
+	
+	@property
+	def start_argv(self) -> list[str]:
+		"""
+		Generates the browser start command as an argument vector.
+
+		Contains the same arguments as `start_command`, but as separate unquoted tokens,
+		suitable for `subprocess.Popen` without a shell.
+
+		Returns:
+			list[str]: The browser executable followed by its start arguments.
+		"""
+		
+		return list(self.start_argv_tuple)
+	
+	@property
+	def start_argv_tuple(self) -> tuple[str, ...]:
+		"""
+		Returns the browser start argument vector as a tuple of interned strings.
+
+		The tuple is built on the first read after a setting change and then reused,
+		so repeated launches with the same configuration share it. Being hashable, it can also serve as a cache key.
+
+		Returns:
+			tuple[str, ...]: The browser executable followed by its start arguments.
+		"""
 		
-		if self.debugging_port is not None:
-			start_args.append(self._debugging_port_command_line.format(value=self.debugging_port))
+		if self._start_argv_tuple is None:
+			self._rebuild_start_argv()
 		
-		if self.profile_dir is not None:
-			start_args.append(self._profile_dir_command_line.format(value=self.profile_dir))
+		return self._start_argv_tuple
+	
+	@property
+	def start_page_url(self) -> str:
+		"""
+		Returns the URL to open when the browser starts.
+
+		Returns:
+			str: The start page URL, or an empty string if not set.
+		"""
 		
-		if self.headless_mode:
-			start_args.append(self._headless_mode_command_line)
+		return self._start_page_url
+	
+	@start_page_url.setter
+	def start_page_url(self, start_page_url: str):
+		"""
+		Sets the URL to open when the browser starts and precomputes the command suffix for it.
+
+		Args:
+			start_page_url (str): The start page URL, or an empty string to open no page.
+		"""
 		
-		if self.mute_audio:
-			start_args.append(self._mute_audio_command_line)
+		if self._start_page_url == start_page_url:
+			return
 		
-		if self.user_agent is not None:
-			start_args.append(self._user_agent_command_line.format(value=self.user_agent))
+		self._start_page_url = start_page_url
+		self._start_page_suffix = f" {start_page_url}" if start_page_url else ""
+		self._start_command = None
+		self._start_argv_tuple = None
+	
+	@property
+	def user_agent(self) -> Optional[str]:
+		"""
+		Returns the current user agent string.
+
+		Returns:
+			Optional[str]: The current user agent string.
+		"""
 		
-		if self.proxy_server is not None:
-			start_args.append(self._proxy_server_command_line.format(value=self.proxy_server))
+		return self._user_agent
+	
+	@user_agent.setter
+	def user_agent(self, user_agent: Optional[str]):
+		"""
+		Sets the user agent string and formats its command-line argument.
+
+		Args:
+			user_agent (Optional[str]): The user agent string, or None to remove the argument.
+		"""
 		
-		if self.start_page_url:
-			start_args.append(self.start_page_url)
+		if self._user_agent == user_agent:
+			return
 		
-		return " ".join(start_args)
+		self._user_agent = user_agent
+		self._fragments["user_agent"] = (
+				self._fill_template(self._user_agent_template_parts, user_agent)
+				if user_agent is not None
+				else ""
+		)
+		self._argv_fragments["user_agent"] = (
+				self._fill_argv_template(self._user_agent_argv_parts, user_agent)
+				if user_agent is not None
+				else ()
+		)
+		self._start_command = None
+		self._start_argv_tuple = None
 	
 	@property
 	def user_agent_command_line(self) -> str:
@@ -1,13 +1,27 @@
+import json
+import time
 import trio
 import pathlib
+from types import TracebackType
 from random import random
+from urllib.parse import urlparse
 from subprocess import Popen
 from functools import partial
+from collections import OrderedDict
 from selenium import webdriver
-from typing import Any, Optional, Union
+from contextlib import contextmanager
+from typing import (
+	Any,
+	Callable,
+	Generator,
+	Iterable,
+	Optional,
+	Union
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver import ActionChains
 from osn_bas.webdrivers.types import ActionPoint
+from selenium.webdriver.remote.command import Command
 from selenium.webdriver.remote.webelement import WebElement
 from osn_windows_cmd.taskkill.parameters import TaskKillTypes
 from selenium.webdriver.common.actions.key_input import KeyInput
@@ -17,6 +31,12 @@ from osn_windows_cmd.taskkill import (
 	ProcessID,
 	taskkill_windows
 )
+from selenium.common.exceptions import (
+	JavascriptException,
+	NoSuchElementException,
+	NoSuchWindowException,
+	WebDriverException
+)
 from osn_bas.types import (
 	Position,
 	Rectangle,
@@ -41,6 +61,7 @@ from osn_bas.webdrivers._functions import (
 	move_to_parts,
 	read_js_scripts,
 	scroll_to_parts,
+	smooth_move_to_parts,
 	text_input_to_parts
 )
 
@@ -68,8 +89,51 @@ class BrowserWebDriver:
 		_is_active (bool): Indicates if the WebDriver instance is currently active.
 		trio_capacity_limiter (trio.CapacityLimiter): Trio capacity limiter for controlling concurrent operations.
 		dev_tools (DevTools): Instance of DevTools for interacting with browser developer tools.
+		_find_cache (dict[tuple, tuple[tuple[int, int, int], Union[WebElement, list[WebElement]]]]):
+			Results of cached element searches keyed by (parent element id, locator strategy, locator value, search kind),
+			each stored together with the DOM fingerprint captured when the search was made.
+		_html_cache (Optional[tuple[tuple[int, int], str]]): The page source last fetched by `get_html` with caching, together with
+			the (observer ID, mutation count) part of the DOM fingerprint it was fetched at.
+		_frame_depth (int): Number of frames entered with `switch_to_frame` and not left yet, 0 if the driver is focused on a top-level browsing context.
+			Direct `driver.switch_to` calls are not tracked.
+		_compiled_js_scripts (dict[str, str]): DevTools script IDs of the predefined snippets compiled in the current page, keyed by snippet name.
+		_timeouts_cache (dict[str, Optional[int]]): The implicit wait and page load timeouts (in milliseconds) last set on the driver, or None if unknown.
+		_automation_hidden (Optional[bool]): The automation hiding state last applied to the options, or None if it was never applied.
+		_webdriver_active_check (Optional[tuple[float, bool]]): Monotonic time and result of the last `check_webdriver_active` process scan.
+		_session_timeouts (OrderedDict[str, dict[str, Optional[int]]]): Timeouts last set on each WebDriver session of the process, keyed by session ID.
+			Shared by all instances, so a reconnect to a known session knows its timeouts without asking the driver.
+			Holds at most `_session_timeouts_maxsize` sessions; the least recently updated ones are dropped first.
+		_session_timeouts_maxsize (int): The maximum number of sessions kept in `_session_timeouts`.
+		_batched_js_snippets (dict[tuple[str, ...], str]): Combined scripts built by `_execute_js_snippets`, keyed by snippet names.
+			Shared by all instances, as all of them use the same `JS_Scripts`.
 	"""
 	
+	_session_timeouts: OrderedDict[str, dict[str, Optional[int]]] = OrderedDict()
+	_session_timeouts_maxsize = 256
+	_batched_js_snippets: dict[tuple[str, ...], str] = {}
+	
+	__slots__ = (
+		"_window_rect",
+		"_js_scripts",
+		"_browser_exe",
+		"_webdriver_path",
+		"_webdriver_start_args",
+		"_webdriver_options_manager",
+		"driver",
+		"_base_implicitly_wait",
+		"_base_page_load_timeout",
+		"_is_active",
+		"trio_capacity_limiter",
+		"dev_tools",
+		"_find_cache",
+		"_html_cache",
+		"_frame_depth",
+		"_compiled_js_scripts",
+		"_timeouts_cache",
+		"_automation_hidden",
+		"_webdriver_active_check",
+	)
+	
 	def __init__(
 			self,
 			browser_exe: Union[str, pathlib.Path],
@@ -133,6 +197,13 @@ class BrowserWebDriver:
 		self._is_active = False
 		self.trio_capacity_limiter = trio.CapacityLimiter(trio_tokens_limit)
 		self.dev_tools = DevTools(self)
+		self._find_cache: dict[tuple, tuple[tuple[int, int, int], Union[WebElement, list[WebElement]]]] = {}
+		self._html_cache: Optional[tuple[tuple[int, int], str]] = None
+		self._frame_depth = 0
+		self._compiled_js_scripts: dict[str, str] = {}
+		self._timeouts_cache: dict[str, Optional[int]] = {"implicit": None, "pageLoad": None}
+		self._automation_hidden: Optional[bool] = None
+		self._webdriver_active_check: Optional[tuple[float, bool]] = None
 		
 		self.update_settings(
 				enable_devtools=enable_devtools,
@@ -146,6 +217,42 @@ class BrowserWebDriver:
 				start_page_url=start_page_url,
 		)
 	
+	def __enter__(self) -> "BrowserWebDriver":
+		"""
+		Enters the WebDriver context.
+
+		Returns:
+			BrowserWebDriver: This WebDriver instance.
+
+		:Usage:
+			with EdgeWebDriver(webdriver_path="path/to/msedgedriver", enable_devtools=False) as webdriver:
+				webdriver.start_webdriver()
+				webdriver.search_url("https://www.example.com")
+		"""
+		
+		return self
+	
+	def __exit__(
+			self,
+			exc_type: Optional[type],
+			exc_val: Optional[BaseException],
+			exc_tb: Optional[TracebackType]
+	):
+		"""
+		Exits the WebDriver context and closes the WebDriver if it is running.
+
+		Closing quits the session, which also closes the pooled HTTP connections of the driver,
+		so their sockets are released right away instead of whenever the driver is garbage collected.
+
+		Args:
+			exc_type (Optional[type]): The exception type, if any, that caused the context to be exited.
+			exc_val (Optional[BaseException]): The exception value, if any.
+			exc_tb (Optional[TracebackType]): The exception traceback, if any.
+		"""
+		
+		if self.driver is not None:
+			self.close_webdriver()
+	
 	def build_action_chains(
 			self,
 			duration: int = 250,
@@ -234,6 +341,185 @@ class BrowserWebDriver:
 		
 		return self.driver.execute_script(script, *args)
 	
+	@staticmethod
+	def _build_batched_js_script(scripts: Iterable[str]) -> str:
+		"""
+		Combines argument-less scripts into one script returning the list of their results.
+
+		Every script is wrapped into its own function, so `return` statements and variables don't clash.
+
+		Args:
+			scripts (Iterable[str]): The JavaScript code of the scripts.
+
+		Returns:
+			str: The combined script.
+		"""
+		
+		return "return [\n" + ",\n".join(f"(function() {{\n{script}\n}})()" for script in scripts) + "\n];"
+	
+	def batch_execute_js_scripts(self, scripts: Iterable[str]) -> list[Any]:
+		"""
+		Executes several argument-less JavaScript scripts with a single WebDriver command.
+
+		The scripts are combined into one script that runs them in order and returns the list of their results,
+		so N scripts cost one round trip instead of N.
+
+		Args:
+			scripts (Iterable[str]): The JavaScript code of the scripts. Each script must `return` its result.
+
+		Returns:
+			list[Any]: The results of the scripts, in the same order as the scripts.
+		"""
+		
+		return self.execute_js_script(self._build_batched_js_script(scripts))
+	
+	def _execute_js_snippets(self, *names: str) -> list[Any]:
+		"""
+		Executes several predefined argument-less JavaScript snippets with a single command.
+
+		The combined script for a set of names is built once per process and kept in `_batched_js_snippets`.
+		Like `_execute_js_snippet`, the combined script is compiled and run over DevTools when the driver supports it
+		and is focused on a top-level browsing context, otherwise it is executed with `execute_js_script`.
+
+		Args:
+			*names (str): The names of the snippets in `_js_scripts`.
+
+		Returns:
+			list[Any]: The results of the snippets, in the same order as the names.
+		"""
+		
+		script = self._batched_js_snippets.get(names)
+		
+		if script is None:
+			script = self._build_batched_js_script(getattr(self._js_scripts, name) for name in names)
+			self._batched_js_snippets[names] = script
+		
+		if self._frame_depth == 0 and hasattr(self.driver, "execute_cdp_cmd"):
+			return self._run_compiled_js_snippet("+".join(names), script)
+		
+		return self.execute_js_script(script)
+	
+	def _execute_js_snippet(self, name: str, *args) -> Any:
+		"""
+		Executes one of the predefined JavaScript snippets.
+
+		If the driver supports Chrome DevTools commands, is focused on a top-level browsing context and
+		all arguments are JSON-serializable, the snippet is run over DevTools and its result is returned
+		by value, bypassing WebDriver's script argument and result marshalling. Snippets without arguments
+		are compiled once with `Runtime.compileScript` and then run by their script ID, snippets with
+		arguments are run with `Runtime.evaluate`. Otherwise, the snippet is executed with `execute_js_script`.
+
+		Only snippets returning plain values (not DOM elements) may be run through this method.
+		The focused frame is known only from `switch_to_frame`, `switch_to_parent_frame`, `switch_to_default_content`
+		and `switch_to_window`; after a direct `driver.switch_to` call, snippets may run in the wrong document.
+
+		Args:
+			name (str): The name of the snippet in `_js_scripts`.
+			*args: Arguments to pass to the snippet. These are accessible in the snippet as `arguments[0]`, `arguments[1]`, etc.
+
+		Returns:
+			Any: The result of the snippet execution.
+
+		Raises:
+			JavascriptException: If the snippet throws an exception when run with `Runtime.evaluate`.
+		"""
+		
+		script = getattr(self._js_scripts, name)
+		
+		if self._frame_depth == 0 and hasattr(self.driver, "execute_cdp_cmd"):
+			if not args:
+				return self._run_compiled_js_snippet(name)
+		
+			try:
+				json_args = json.dumps(args)
+			except TypeError:
+				json_args = None
+		
+			if json_args is not None:
+				response = self.driver.execute_cdp_cmd(
+						"Runtime.evaluate",
+						{
+							"expression": f"(function() {{\n{script}\n}}).apply(null, {json_args})",
+							"returnByValue": True,
+						}
+				)
+		
+				return self._get_cdp_js_result(response)
+		
+		return self.execute_js_script(script, *args)
+	
+	@staticmethod
+	def _get_cdp_js_result(response: dict[str, Any]) -> Any:
+		"""
+		Extracts the value of a DevTools `Runtime` script run result.
+
+		Args:
+			response (dict[str, Any]): The response of a `Runtime.evaluate`, `Runtime.compileScript` or `Runtime.runScript` command.
+
+		Returns:
+			Any: The value the script returned, or None if the response contains no result.
+
+		Raises:
+			JavascriptException: If the response reports a script exception.
+		"""
+		
+		if "exceptionDetails" in response:
+			exception_details = response["exceptionDetails"]
+			raise JavascriptException(
+					exception_details.get("exception", {}).get("description", exception_details["text"])
+			)
+		
+		return response.get("result", {}).get("value")
+	
+	def _run_compiled_js_snippet(self, name: str, script: Optional[str] = None) -> Any:
+		"""
+		Runs a predefined argument-less JavaScript snippet by its compiled script ID.
+
+		The snippet is compiled with `Runtime.compileScript` on first use in the current page and its
+		script ID is kept in `_compiled_js_scripts`, so subsequent runs do not send or re-parse the source.
+		Compiled scripts belong to the page's execution context, so if running fails (e.g. after the page
+		navigated), the snippet is compiled again and rerun once.
+
+		Args:
+			name (str): The name of the snippet in `_js_scripts`, or the key of a combined script.
+			script (Optional[str]): The source of the snippet. If None, it is taken from `_js_scripts` by `name`. Defaults to None.
+
+		Returns:
+			Any: The result of the snippet execution.
+
+		Raises:
+			JavascriptException: If the snippet throws an exception.
+		"""
+		
+		script_id = self._compiled_js_scripts.get(name)
+		
+		if script_id is not None:
+			try:
+				return self._get_cdp_js_result(
+						self.driver.execute_cdp_cmd("Runtime.runScript", {"scriptId": script_id, "returnByValue": True})
+				)
+			except WebDriverException:
+				self._compiled_js_scripts.pop(name, None)
+		
+		compiled_script = self.driver.execute_cdp_cmd(
+				"Runtime.compileScript",
+				{
+					"expression": f"(function() {{\n{script if script is not None else getattr(self._js_scripts, name)}\n}})()",
+					"sourceURL": f"{name}.js",
+					"persistScript": True,
+				}
+		)
+		self._get_cdp_js_result(compiled_script)
+		
+		self._compiled_js_scripts[name] = compiled_script["scriptId"]
+		
+		return self._get_cdp_js_result(
+				self.driver.execute_cdp_cmd(
+						"Runtime.runScript",
+						{"scriptId": compiled_script["scriptId"], "returnByValue": True}
+				)
+		)
+	
 	def get_element_rect_in_viewport(self, element: WebElement) -> Rectangle:
 		"""
 		Gets the position and dimensions of an element relative to the viewport.
@@ -250,7 +536,7 @@ class BrowserWebDriver:
 					   if the element is partially scrolled out of view to the top or left.
 		"""
 		
-		rect = self.execute_js_script(self._js_scripts["get_element_rect_in_viewport"], element)
+		rect = self._execute_js_snippet("get_element_rect_in_viewport", element)
 		
 		return Rectangle(
 				x=int(rect["x"]),
@@ -259,6 +545,64 @@ class BrowserWebDriver:
 				height=int(rect["height"])
 		)
 	
+	def get_element_rects_in_viewport(self, elements: list[WebElement]) -> list[Rectangle]:
+		"""
+		Gets the positions and dimensions of several elements relative to the viewport.
+
+		Executes a predefined JavaScript snippet that calculates the bounding rectangles of all
+		given elements with a single call, instead of one call per element.
+
+		Args:
+			elements (list[WebElement]): The Selenium WebElements whose rectangles are needed.
+
+		Returns:
+			list[Rectangle]: TypedDicts containing the 'x', 'y', 'width', and 'height' of each element
+					   relative to the viewport's top-left corner, in the order of `elements`.
+		"""
+		
+		if not elements:
+			return []
+		
+		rects = self._execute_js_snippet("get_element_rects_in_viewport", elements)
+		
+		return [
+			Rectangle(
+					x=int(rect["x"]),
+					y=int(rect["y"]),
+					width=int(rect["width"]),
+					height=int(rect["height"])
+			)
+			for rect in rects
+		]
+	
+	def _filter_elements_in_viewport(self, elements: list[WebElement]) -> list[WebElement]:
+		"""
+		Keeps only the elements intersecting the viewport.
+
+		Gets the rectangles of all elements with one `get_element_rects_in_viewport` call and
+		compares them with the viewport size.
+
+		Args:
+			elements (list[WebElement]): The elements to filter.
+
+		Returns:
+			list[WebElement]: The elements intersecting the viewport, in their original order.
+		"""
+		
+		if not elements:
+			return []
+		
+		viewport_size = self.get_viewport_size()
+		
+		return [
+			element
+			for element, rect in zip(elements, self.get_element_rects_in_viewport(elements))
+			if rect["x"] + rect["width"] > 0
+			and rect["y"] + rect["height"] > 0
+			and rect["x"] < viewport_size["width"]
+			and rect["y"] < viewport_size["height"]
+		]
+	
 	def get_random_element_point_in_viewport(self, element: WebElement, step: int = 1) -> Optional[Position]:
 		"""
 		Calculates a random point within the visible portion of a given element in the viewport.
@@ -273,42 +617,40 @@ class BrowserWebDriver:
 				will be multiples of this step within the valid range. Defaults to 1 (any pixel).
 
 		Returns:
-			Position: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
+			Optional[Position]: A TypedDict containing the integer 'x' and 'y' coordinates of a random point
 					  within the element's visible area in the viewport. Coordinates are relative
-					  to the element's top-left corner (0,0).
+					  to the element's top-left corner (0,0). None if the element has no visible point in the viewport.
 		"""
 		
-		position = self.execute_js_script(self._js_scripts["get_random_element_point_in_viewport"], element, step)
+		position = self._execute_js_snippet("get_random_element_point_in_viewport", element, step)
 		
 		if position is not None:
 			return Position(x=int(position["x"]), y=int(position["y"]))
 		
 		return None
 	
-	def get_random_element_point(self, element: WebElement) -> ActionPoint:
+	def get_random_element_point(self, element: WebElement) -> Optional[ActionPoint]:
 		"""
 		Gets the coordinates of a random point within an element, relative to the viewport origin.
 
-		Calculates a random point within the visible portion of the element relative to the
-		element's own top-left corner. It then adds the element's top-left coordinates
-		(relative to the viewport) to get the final coordinates of the random point,
-		also relative to the viewport's top-left origin (0,0).
+		Calculates a random point within the visible portion of the element with a single JavaScript call,
+		which returns the point's coordinates relative to the viewport's top-left origin (0,0) directly.
 
 		Args:
 			element (WebElement): The target element within which to find a random point.
 
 		Returns:
-			ActionPoint: An ActionPoint named tuple containing the 'x' and 'y' coordinates
-						 of the random point within the element, relative to the viewport origin.
+			Optional[ActionPoint]: An ActionPoint containing the 'x' and 'y' coordinates of the random point
+				within the element, relative to the viewport origin. None if no visible point of the element
+				is found (e.g., it is scrolled out of the viewport or fully covered by other elements).
 		"""
 		
-		point_in_viewport = self.get_random_element_point_in_viewport(element=element, step=1)
-		element_viewport_pos = self.get_element_rect_in_viewport(element=element)
+		point = self._execute_js_snippet("get_random_element_point_in_viewport", element, 1)
 		
-		x = int(element_viewport_pos["x"] + point_in_viewport["x"])
-		y = int(element_viewport_pos["y"] + point_in_viewport["y"])
+		if point is not None:
+			return ActionPoint(x=int(point["viewportX"]), y=int(point["viewportY"]))
 		
-		return ActionPoint(x=x, y=y)
+		return None
 	
 	def build_hm_move_to_element_action(
 			self,
@@ -344,11 +686,18 @@ class BrowserWebDriver:
 				- The ActionChains instance with the human-like move-to-element sequence added.
 				  Needs to be finalized with `.perform()`.
 				- The calculated end `ActionPoint` (relative to viewport) within the element that the
-				  mouse path targets.
+				  mouse path targets. If the element has no visible point, no move is added and
+				  `start_position` is returned instead.
 		"""
 		
 		end_position = self.get_random_element_point(element=element)
 		
+		if end_position is None:
+			if parent_action is None:
+				parent_action = self.build_action_chains(duration=duration, devices=devices)
+		
+			return parent_action, start_position
+		
 		return (
 				self.build_hm_move_action(
 						start_position=start_position,
@@ -371,7 +720,7 @@ class BrowserWebDriver:
 			Size: A TypedDict containing the 'width' and 'height' of the viewport in pixels.
 		"""
 		
-		size = self.execute_js_script(self._js_scripts["get_viewport_size"])
+		size = self._execute_js_snippet("get_viewport_size")
 		
 		return Size(width=int(size["width"]), height=int(size["height"]))
 	
@@ -445,7 +794,7 @@ class BrowserWebDriver:
 					   the viewport dimensions (window.innerWidth, window.innerHeight).
 		"""
 		
-		rect = self.execute_js_script(self._js_scripts["get_viewport_rect"])
+		rect = self._execute_js_snippet("get_viewport_rect")
 		
 		return Rectangle(
 				x=int(rect["x"]),
@@ -454,6 +803,30 @@ class BrowserWebDriver:
 				height=int(rect["height"])
 		)
 	
+	def get_viewport_rect_and_document_scroll_size(self) -> tuple[Rectangle, Size]:
+		"""
+		Gets the viewport rectangle and the document's scrollable size with a single command.
+
+		Runs the `get_viewport_rect` and `get_document_scroll_size` snippets in one script,
+		so callers needing both pay one round trip instead of two.
+
+		Returns:
+			tuple[Rectangle, Size]: The viewport rectangle (as `get_viewport_rect` returns it)
+				and the document scroll size (as `get_document_scroll_size` returns it).
+		"""
+		
+		rect, size = self._execute_js_snippets("get_viewport_rect", "get_document_scroll_size")
+		
+		return (
+				Rectangle(
+						x=int(rect["x"]),
+						y=int(rect["y"]),
+						width=int(rect["width"]),
+						height=int(rect["height"])
+				),
+				Size(width=int(size["width"]), height=int(size["height"]))
+		)
+	
 	def build_hm_scroll_to_element_action(
 			self,
 			element: WebElement,
@@ -577,7 +950,7 @@ class BrowserWebDriver:
 			bool: True if the element is at least partially within the viewport, False otherwise.
 		"""
 		
-		return self.execute_js_script(self._js_scripts["check_element_in_viewport"], element)
+		return self._execute_js_snippet("check_element_in_viewport", element)
 	
 	def click_action(
 			self,
@@ -700,6 +1073,8 @@ class BrowserWebDriver:
 		"""
 		
 		self.driver.switch_to.window(self.get_window_handle(window))
+		self._frame_depth = 0
+		self._invalidate_page_caches()
 	
 	@property
 	def current_window_handle(self) -> str:
@@ -739,6 +1114,7 @@ class BrowserWebDriver:
 			self.switch_to_window(close_window_handle)
 		
 		self.driver.close()
+		self._invalidate_page_caches()
 		
 		if len(self.windows_handles) > 0:
 			if is_current_closing:
@@ -746,16 +1122,71 @@ class BrowserWebDriver:
 			else:
 				self.switch_to_window(start_window_handle)
 	
+	def close_windows(self, windows: Optional[list[Union[str, int]]] = None):
+		"""
+		Closes several browser windows at once.
+
+		If the driver supports Chrome DevTools commands, each window is closed with a `Target.closeTarget`
+		command (window handles are the DevTools target IDs), without switching focus to it first. The commands
+		are sent through the focused window, so it is closed last, and windows that are already gone are skipped.
+		If the focused window was closed, focus is switched to the last remaining window, if any.
+		Otherwise, the windows are closed one by one with `close_window`.
+
+		Args:
+			windows (Optional[list[Union[str, int]]]): Identifiers of the windows to close.
+				Each one can be a window handle (string) or an index (int) in the list of window handles.
+				If None, all windows are closed. Defaults to None.
+		"""
+		
+		windows_handles = self.windows_handles
+		
+		if windows is None:
+			close_windows_handles = windows_handles
+		else:
+			close_windows_handles = [
+				windows_handles[window] if isinstance(window, int) else window
+				for window in windows
+			]
+		
+		if not hasattr(self.driver, "execute_cdp_cmd"):
+			for window in close_windows_handles:
+				self.close_window(window)
+		
+			return
+		
+		start_window_handle = self.current_window_handle
+		close_current_window = start_window_handle in close_windows_handles
+		
+		for window in close_windows_handles:
+			if window != start_window_handle:
+				try:
+					self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": window})
+				except NoSuchWindowException:
+					pass
+		
+		if close_current_window:
+			try:
+				self.driver.execute_cdp_cmd("Target.closeTarget", {"targetId": start_window_handle})
+			except NoSuchWindowException:
+				pass
+		
+		self._invalidate_page_caches()
+		
+		if close_current_window:
+			remaining_windows_handles = [window for window in windows_handles if window not in close_windows_handles]
+		
+			if len(remaining_windows_handles) > 0:
+				self.switch_to_window(remaining_windows_handles[-1])
+	
 	def close_all_windows(self):
 		"""
 		Closes all open windows.
 
-		Iterates through all window handles and closes each window associated with the WebDriver instance.
+		Closes every window associated with the WebDriver instance using `close_windows`.
 		This effectively closes the entire browser session managed by the driver.
 		"""
 		
-		for window in self.windows_handles:
-			self.close_window(window)
+		self.close_windows()
 	
 	def context_click_action(
 			self,
@@ -908,6 +1339,153 @@ class BrowserWebDriver:
 		
 		return action_chain
 	
+	def _add_base_timeouts_capability(self, options: Any):
+		"""
+		Adds the base timeouts to the `timeouts` capability of WebDriver options.
+
+		The New Session command then creates the session with these timeouts already set,
+		so no separate `setTimeouts` command is needed after the driver is created.
+
+		Args:
+			options (Any): The WebDriver options the session will be created with.
+		"""
+		
+		options.set_capability(
+				"timeouts",
+				{
+					"implicit": round(float(self._base_implicitly_wait) * 1000),
+					"pageLoad": round(float(self._base_page_load_timeout) * 1000),
+				}
+		)
+	
+	def _apply_base_timeouts(self):
+		"""
+		Makes sure a newly created session uses the base timeouts.
+
+		Seeds `_timeouts_cache` with the timeouts reported in the session capabilities
+		and sends a `setTimeouts` command only for the base timeouts the session didn't accept.
+		"""
+		
+		session_timeouts = self.driver.caps.get("timeouts") or {}
+		self._timeouts_cache.update(
+				{
+					name: session_timeouts[name]
+					for name in self._timeouts_cache
+					if name in session_timeouts
+				}
+		)
+		self._remember_session_timeouts()
+		
+		self._set_timeouts(
+				implicit=round(float(self._base_implicitly_wait) * 1000),
+				page_load=round(float(self._base_page_load_timeout) * 1000)
+		)
+	
+	def _apply_attached_session_timeouts(self):
+		"""
+		Makes sure a session the driver was attached to uses the base timeouts.
+
+		If this process already set timeouts on the session, `_timeouts_cache` is seeded from `_session_timeouts`,
+		so a reconnect with matching timeouts sends no `setTimeouts` command. Unknown sessions get the base timeouts with one command.
+		"""
+		
+		self._timeouts_cache = {"implicit": None, "pageLoad": None}
+		self._timeouts_cache.update(self._session_timeouts.get(self.driver.session_id, {}))
+		
+		self._set_timeouts(
+				implicit=round(float(self._base_implicitly_wait) * 1000),
+				page_load=round(float(self._base_page_load_timeout) * 1000)
+		)
+	
+	def _write_timeouts(self, timeouts: dict[str, int]):
+		"""
+		Sends timeouts to the driver with a single `setTimeouts` command and remembers them.
+
+		Args:
+			timeouts (dict[str, int]): W3C timeouts to set, in milliseconds (e.g., {"implicit": 5000, "pageLoad": 5000}).
+		"""
+		
+		self.driver.execute(Command.SET_TIMEOUTS, timeouts)
+		self._timeouts_cache.update(timeouts)
+		self._remember_session_timeouts()
+	
+	def _remember_session_timeouts(self):
+		"""
+		Stores `_timeouts_cache` as the known timeouts of the current session in `_session_timeouts`.
+
+		Sessions that died or were dropped without `close_webdriver` are never removed explicitly,
+		so the least recently updated entries are evicted once `_session_timeouts_maxsize` is exceeded.
+		"""
+		
+		if self.driver.session_id is not None:
+			self._session_timeouts[self.driver.session_id] = self._timeouts_cache.copy()
+			self._session_timeouts.move_to_end(self.driver.session_id)
+		
+			while len(self._session_timeouts) > self._session_timeouts_maxsize:
+				self._session_timeouts.popitem(last=False)
+	
+	def _set_timeouts(self, implicit: Optional[int] = None, page_load: Optional[int] = None):
+		"""
+		Sets driver timeouts, skipping the ones already set to the requested value.
+
+		Compares the requested values with `_timeouts_cache` and sends only the changed ones.
+		If nothing changed, no command is sent at all. The cache is refreshed from `_session_timeouts` first,
+		so timeouts set on the same session by another driver object are taken into account.
+
+		Args:
+			implicit (Optional[int]): The implicit wait timeout in milliseconds. None leaves it unchanged. Defaults to None.
+			page_load (Optional[int]): The page load timeout in milliseconds. None leaves it unchanged. Defaults to None.
+		"""
+		
+		self._timeouts_cache.update(self._session_timeouts.get(self.driver.session_id, {}))
+		
+		timeouts = {
+			name: value
+			for name, value in (("implicit", implicit), ("pageLoad", page_load))
+			if value is not None and self._timeouts_cache[name] != value
+		}
+		
+		if timeouts:
+			self._write_timeouts(timeouts)
+	
+	@contextmanager
+	def _with_timeouts(
+			self,
+			implicitly_wait: Optional[float] = None,
+			page_load_timeout: Optional[float] = None
+	) -> Generator[None, None, None]:
+		"""
+		Context manager temporarily overriding driver timeouts.
+
+		On enter, sets the given timeouts with `_set_timeouts`, so values matching the current ones
+		cost no command. On exit, restores only the timeouts that were changed, with a single command.
+		Timeouts that were unknown before entering (e.g., on an attached session) are restored to the base timeouts,
+		so a temporary value never stays on the session.
+
+		Args:
+			implicitly_wait (Optional[float]): Temporary implicit wait timeout in seconds. None keeps the current one. Defaults to None.
+			page_load_timeout (Optional[float]): Temporary page load timeout in seconds. None keeps the current one. Defaults to None.
+		"""
+		
+		previous_timeouts = self._timeouts_cache.copy()
+		
+		self._set_timeouts(
+				implicit=round(float(implicitly_wait) * 1000) if implicitly_wait is not None else None,
+				page_load=round(float(page_load_timeout) * 1000) if page_load_timeout is not None else None
+		)
+		
+		try:
+			yield
+		finally:
+			self._set_timeouts(
+					implicit=previous_timeouts["implicit"]
+					if previous_timeouts["implicit"] is not None
+					else round(float(self._base_implicitly_wait) * 1000),
+					page_load=previous_timeouts["pageLoad"]
+					if previous_timeouts["pageLoad"] is not None
+					else round(float(self._base_page_load_timeout) * 1000)
+			)
+	
 	def set_implicitly_wait_timeout(self, timeout: float):
 		"""
 		Sets the implicit wait timeout for WebDriver element searches.
@@ -920,7 +1498,7 @@ class BrowserWebDriver:
 			timeout (float): The implicit wait timeout value in seconds.
 		"""
 		
-		self.driver.implicitly_wait(timeout)
+		self._write_timeouts({"implicit": round(float(timeout) * 1000)})
 	
 	def set_page_load_timeout(self, timeout: float):
 		"""
@@ -934,23 +1512,27 @@ class BrowserWebDriver:
 			timeout (float): The page load timeout value in seconds.
 		"""
 		
-		self.driver.set_page_load_timeout(timeout)
+		self._write_timeouts({"pageLoad": round(float(timeout) * 1000)})
 	
 	def set_driver_timeouts(self, page_load_timeout: float, implicit_wait_timeout: float):
 		"""
 		Sets both page load timeout and implicit wait timeout for WebDriver.
 
 		A convenience method to set both the page load timeout and the implicit wait timeout
-		in a single operation. This can simplify timeout configuration at the start of tests or
-		when adjusting timeouts dynamically.
+		in a single operation. Both values are sent with one WebDriver `setTimeouts` command
+		instead of one command per timeout.
 
 		Args:
 			page_load_timeout (float): The page load timeout value in seconds.
 			implicit_wait_timeout (float): The implicit wait timeout value in seconds.
 		"""
 		
-		self.set_page_load_timeout(page_load_timeout)
-		self.set_implicitly_wait_timeout(implicit_wait_timeout)
+		self._write_timeouts(
+				{
+					"implicit": round(float(implicit_wait_timeout) * 1000),
+					"pageLoad": round(float(page_load_timeout) * 1000),
+				}
+		)
 	
 	def update_times(
 			self,
@@ -984,6 +1566,89 @@ class BrowserWebDriver:
 				implicit_wait_timeout=implicitly_wait
 		)
 	
+	def wait_for_element(self, by: By, value: str, timeout: float = 5) -> Optional[WebElement]:
+		"""
+		Waits for a web element to appear on the page without polling.
+
+		For CSS selectors and XPath, a `MutationObserver` is registered in the page and the element is returned
+		as soon as a DOM change makes it match, instead of repeatedly querying the DOM like an implicit wait does.
+		Other locator strategies fall back to `find_web_element` with the timeout as a temporary implicit wait.
+		The timeout must not exceed the WebDriver script timeout (30 seconds by default).
+
+		Args:
+			by (By): Locator strategy to use (e.g., By.CSS_SELECTOR, By.XPATH).
+			value (str): Locator value. Used with the 'by' strategy to identify the element.
+			timeout (float): Maximum time to wait for the element in seconds. Defaults to 5.
+
+		Returns:
+			Optional[WebElement]: The found web element, or None if it did not appear within the timeout.
+		"""
+		
+		if by not in (By.CSS_SELECTOR, By.XPATH):
+			try:
+				return self.find_web_element(by=by, value=value, temp_implicitly_wait=timeout)
+			except NoSuchElementException:
+				return None
+		
+		return self.driver.execute_async_script(self._js_scripts.wait_for_element, by, value, round(timeout * 1000))
+	
+	def _get_dom_fingerprint(self) -> tuple[int, int, int]:
+		"""
+		Gets a fingerprint of the current DOM state.
+
+		The first call in a document installs a `MutationObserver` that counts every child list, attribute
+		and text change of the document; later calls only read the counter. The fingerprint consists of a random
+		ID of the observer (new for every document), the mutation count and the vertical scroll offset bucketed
+		by 100 pixels, so reading it costs neither serializing nor traversing the DOM.
+		Properties that are not reflected in the markup (e.g., the current value of an input) are not covered.
+
+		Returns:
+			tuple[int, int, int]: The (observer ID, mutation count, scroll bucket) fingerprint.
+		"""
+		
+		return tuple(self._execute_js_snippet("get_dom_fingerprint"))
+	
+	def _invalidate_page_caches(self):
+		"""
+		Drops all results cached for the current page.
+
+		Called whenever the driver navigates, reloads, or changes the browsing context it is focused on,
+		as cached WebElement references are no longer valid after such operations.
+		"""
+		
+		self._find_cache.clear()
+		self._html_cache = None
+		self._compiled_js_scripts.clear()
+	
+	def _find_with_cache(self, key: tuple, find_function: Callable[[], Any]) -> Any:
+		"""
+		Returns a cached search result if the DOM fingerprint has not changed since it was stored.
+
+		Captures the current DOM fingerprint and compares it with the one stored alongside the cached result
+		for `key`. On a match the cached result is returned without querying the driver; otherwise `find_function`
+		is called and its result is cached under the new fingerprint.
+		Capturing the fingerprint is one JavaScript call, so a hit saves the search itself, not the round-trip;
+		caching pays off for searches that are slower than reading a counter (e.g., complex XPath, large result lists or waits).
+
+		Args:
+			key (tuple): The cache key identifying the search.
+			find_function (Callable[[], Any]): Function performing the actual search.
+
+		Returns:
+			Any: The cached or freshly found search result.
+		"""
+		
+		fingerprint = self._get_dom_fingerprint()
+		cached = self._find_cache.get(key)
+		
+		if cached is not None and cached[0] == fingerprint:
+			return cached[1]
+		
+		result = find_function()
+		self._find_cache[key] = (fingerprint, result)
+		
+		return result
+	
 	def find_inner_web_element(
 			self,
 			parent_element: WebElement,
@@ -991,6 +1656,7 @@ class BrowserWebDriver:
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element within another element.
@@ -1004,13 +1670,27 @@ class BrowserWebDriver:
 			value (str): Locator value. The actual string used by the locator strategy to find the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Overrides default if provided. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Overrides default if provided. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element. If no element is found within the timeout, a `NoSuchElementException` is raised.
 		"""
 		
-		self.update_times(temp_implicitly_wait, temp_page_load_timeout)
-		return parent_element.find_element(by, value)
+		if use_cache:
+			return self._find_with_cache(
+					key=(parent_element.id, by, value, "element"),
+					find_function=partial(
+							self.find_inner_web_element,
+							parent_element=parent_element,
+							by=by,
+							value=value,
+							temp_implicitly_wait=temp_implicitly_wait,
+							temp_page_load_timeout=temp_page_load_timeout,
+					),
+			)
+		
+		with self._with_timeouts(temp_implicitly_wait, temp_page_load_timeout):
+			return parent_element.find_element(by, value)
 	
 	def find_inner_web_elements(
 			self,
@@ -1019,6 +1699,8 @@ class BrowserWebDriver:
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
 			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements within another element.
@@ -1032,20 +1714,45 @@ class BrowserWebDriver:
 			value (str): Locator value. Used in conjunction with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
 		"""
 		
-		self.update_times(temp_implicitly_wait, temp_page_load_timeout)
-		return parent_element.find_elements(by, value)
+		if use_cache:
+			return self._find_with_cache(
+					key=(parent_element.id, by, value, "elements_in_viewport" if viewport_only else "elements"),
+					find_function=partial(
+							self.find_inner_web_elements,
+							parent_element=parent_element,
+							by=by,
+							value=value,
+							temp_implicitly_wait=temp_implicitly_wait,
+							temp_page_load_timeout=temp_page_load_timeout,
+							viewport_only=viewport_only,
+					),
+			)
+		
+		if viewport_only and by in (By.CSS_SELECTOR, By.XPATH):
+			return self.execute_js_script(self._js_scripts.find_elements_in_viewport, parent_element, by, value)
+		
+		with self._with_timeouts(temp_implicitly_wait, temp_page_load_timeout):
+			elements = parent_element.find_elements(by, value)
+		
+		if viewport_only:
+			return self._filter_elements_in_viewport(elements)
+		
+		return elements
 	
 	def find_web_element(
 			self,
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
 	) -> WebElement:
 		"""
 		Finds a single web element on the page.
@@ -1058,20 +1765,35 @@ class BrowserWebDriver:
 			value (str): Locator value. Used with the 'by' strategy to identify the element.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
 
 		Returns:
 			WebElement: The found web element.
 		"""
 		
-		self.update_times(temp_implicitly_wait, temp_page_load_timeout)
-		return self.driver.find_element(by, value)
+		if use_cache:
+			return self._find_with_cache(
+					key=(None, by, value, "element"),
+					find_function=partial(
+							self.find_web_element,
+							by=by,
+							value=value,
+							temp_implicitly_wait=temp_implicitly_wait,
+							temp_page_load_timeout=temp_page_load_timeout,
+					),
+			)
+		
+		with self._with_timeouts(temp_implicitly_wait, temp_page_load_timeout):
+			return self.driver.find_element(by, value)
 	
 	def find_web_elements(
 			self,
 			by: By,
 			value: str,
 			temp_implicitly_wait: Optional[int] = None,
-			temp_page_load_timeout: Optional[int] = None
+			temp_page_load_timeout: Optional[int] = None,
+			use_cache: bool = False,
+			viewport_only: bool = False,
 	) -> list[WebElement]:
 		"""
 		Finds multiple web elements on the page.
@@ -1084,13 +1806,36 @@ class BrowserWebDriver:
 			value (str): Locator value. Used with the 'by' strategy to locate elements.
 			temp_implicitly_wait (Optional[int]): Temporary implicit wait time in seconds for this operation. Defaults to None.
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for this operation. Defaults to None.
+			use_cache (bool): If True, returns the result of the previous identical search when the DOM has not been mutated since then, skipping the WebDriver query. Changes not reflected in the markup (e.g., typed input values) do not invalidate the result. Defaults to False.
+			viewport_only (bool): If True and `by` is By.CSS_SELECTOR or By.XPATH, the search runs in a single JavaScript call and returns only elements intersecting the viewport. Such a search does not wait for elements to appear. For other locator strategies, the regular search result is filtered by the elements' viewport rectangles fetched in one call. Defaults to False.
 
 		Returns:
 			list[WebElement]: A list of found web elements. Returns an empty list if no elements are found.
 		"""
 		
-		self.update_times(temp_implicitly_wait, temp_page_load_timeout)
-		return self.driver.find_elements(by, value)
+		if use_cache:
+			return self._find_with_cache(
+					key=(None, by, value, "elements_in_viewport" if viewport_only else "elements"),
+					find_function=partial(
+							self.find_web_elements,
+							by=by,
+							value=value,
+							temp_implicitly_wait=temp_implicitly_wait,
+							temp_page_load_timeout=temp_page_load_timeout,
+							viewport_only=viewport_only,
+					),
+			)
+		
+		if viewport_only and by in (By.CSS_SELECTOR, By.XPATH):
+			return self.execute_js_script(self._js_scripts.find_elements_in_viewport, None, by, value)
+		
+		with self._with_timeouts(temp_implicitly_wait, temp_page_load_timeout):
+			elements = self.driver.find_elements(by, value)
+		
+		if viewport_only:
+			return self._filter_elements_in_viewport(elements)
+		
+		return elements
 	
 	def get_document_scroll_size(self) -> Size:
 		"""
@@ -1104,25 +1849,77 @@ class BrowserWebDriver:
 					   'height' represents the scrollHeight.
 		"""
 		
-		size = self.execute_js_script(self._js_scripts["get_document_scroll_size"])
+		size = self._execute_js_snippet("get_document_scroll_size")
 		
 		return Size(width=int(size["width"]), height=int(size["height"]))
 	
-	def get_element_css_style(self, element: WebElement) -> dict[str, str]:
+	def get_element_css_style(
+			self,
+			element: WebElement,
+			properties: Optional[Iterable[str]] = None
+	) -> dict[str, str]:
 		"""
 		Retrieves the computed CSS style of a WebElement.
 
-		Uses JavaScript to get all computed CSS properties and their values for a given web element.
+		Uses JavaScript to get computed CSS properties and their values for a given web element.
 		Returns a dictionary where keys are CSS property names and values are their computed values.
+		Requesting only the needed properties keeps the transferred payload small.
 
 		Args:
 			element (WebElement): The WebElement for which to retrieve the CSS style.
+			properties (Optional[Iterable[str]]): Names of the CSS properties to retrieve. If None, all computed properties are retrieved. Defaults to None.
 
 		Returns:
 			dict[str, str]: A dictionary of CSS property names and their computed values as strings.
 		"""
 		
-		return self.execute_js_script(self._js_scripts["get_element_css"], element)
+		return self._execute_js_snippet(
+				"get_element_css",
+				element,
+				list(properties) if properties is not None else None
+		)
+	
+	def get_remote_capabilities(self) -> dict[str, Any]:
+		"""
+		Gets the capabilities returned by the server for the current WebDriver session.
+
+		Pass them to `remote_connect_driver` together with the values of `get_vars_for_remote`, so the attached driver
+		knows the real session values (e.g., `webSocketUrl` or `se:cdp`) needed for BiDi and DevTools connections.
+
+		Returns:
+			dict[str, Any]: The session capabilities.
+		"""
+		
+		return self.driver.caps
+	
+	def get_html(self, use_cache: bool = False) -> str:
+		"""
+		Gets the current page source, optionally reusing the previously fetched one.
+
+		Without caching this is the same as the `html` property. With `use_cache`, the DOM mutation counter
+		maintained in the page is compared with the one the cached source was fetched at;
+		if the DOM has not been mutated since then, the cached source is returned without transferring the page source again.
+		Checking the counter costs one JavaScript call, so caching only pays off for large pages that are read repeatedly.
+
+		Args:
+			use_cache (bool): If True, returns the previously fetched source when the DOM has not been mutated since then. Defaults to False.
+
+		Returns:
+			str: The HTML source code of the current page.
+		"""
+		
+		if not use_cache:
+			return self.driver.page_source
+		
+		dom_fingerprint = self._get_dom_fingerprint()[:2]
+		
+		if self._html_cache is not None and self._html_cache[0] == dom_fingerprint:
+			return self._html_cache[1]
+		
+		html = self.driver.page_source
+		self._html_cache = (dom_fingerprint, html)
+		
+		return html
 	
 	def get_vars_for_remote(self) -> tuple[RemoteConnection, str]:
 		"""
@@ -1149,7 +1946,7 @@ class BrowserWebDriver:
 					  'y' (vertical scroll offset) of the viewport.
 		"""
 		
-		position = self.execute_js_script(self._js_scripts["get_viewport_position"])
+		position = self._execute_js_snippet("get_viewport_position")
 		
 		return Position(x=int(position["x"]), y=int(position["y"]))
 	
@@ -1160,6 +1957,7 @@ class BrowserWebDriver:
 
 		Retrieves the HTML source code of the currently loaded webpage. This is useful for
 		inspecting the page structure and content, especially for debugging or data extraction purposes.
+		Use `get_html` to reuse the previously fetched source while the page is unchanged.
 
 		Returns:
 			str: The HTML source code of the current page.
@@ -1253,11 +2051,70 @@ class BrowserWebDriver:
 		
 		return action_chain
 	
+	def _build_smooth_move_to_element_action(
+			self,
+			element: WebElement,
+			xoffset: int,
+			yoffset: int,
+			duration: int,
+			action_chain: Optional[ActionChains],
+			start_position: Optional[ActionPoint]
+	) -> ActionChains:
+		"""
+		Adds an eased multistep mouse move to an offset from the center of a specified element.
+
+		The target point is calculated from the element's rectangle in the viewport, and the path from
+		`start_position` is split by `smooth_move_to_parts`. Every step is an absolute move to a viewport point,
+		so the cursor ends at the target even if `start_position` is slightly off its actual position. All steps are
+		added to a single ActionChains instance, so the whole trajectory is sent with one `perform()` call.
+		When a new chain is created, `duration` is spread over the steps.
+
+		Args:
+			element (WebElement): The target web element to base the offset from.
+			xoffset (int): The horizontal offset from the element's center.
+			yoffset (int): The vertical offset from the element's center.
+			duration (int): The total duration in milliseconds of the movement if `action_chain` is None.
+			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
+				the moves to. If None, a new chain is created.
+			start_position (Optional[ActionPoint]): The viewport point the path starts at, usually the current cursor position.
+
+		Returns:
+			ActionChains: The ActionChains instance with the move steps added.
+
+		Raises:
+			ValueError: If `start_position` is None, as the cursor position is not tracked by the driver.
+		"""
+		
+		if start_position is None:
+			raise ValueError("start_position is required for human-like moves.")
+		
+		element_rect = self.get_element_rect_in_viewport(element)
+		end_position = ActionPoint(
+				x=element_rect["x"] + element_rect["width"] // 2 + xoffset,
+				y=element_rect["y"] + element_rect["height"] // 2 + yoffset
+		)
+		
+		move_parts = smooth_move_to_parts(
+				start_position=start_position,
+				end_position=end_position
+		)
+		
+		if action_chain is None:
+			action_chain = self.build_action_chains(duration=duration // len(move_parts))
+		
+		for part in move_parts:
+			action_chain.w3c_actions.pointer_action.move_to_location(x=part.point.x, y=part.point.y)
+			action_chain.w3c_actions.key_action.pause()
+		
+		return action_chain
+	
 	def move_to_element_action(
 			self,
 			element: WebElement,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds a move mouse cursor action to the specified web element.
@@ -1272,12 +2129,28 @@ class BrowserWebDriver:
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
+		if human:
+			return self._build_smooth_move_to_element_action(
+					element=element,
+					xoffset=0,
+					yoffset=0,
+					duration=duration,
+					action_chain=action_chain,
+					start_position=start_position
+			)
+		
 		if action_chain is None:
 			action_chain = self.build_action_chains(duration=duration)
 		
@@ -1291,7 +2164,9 @@ class BrowserWebDriver:
 			xoffset: int,
 			yoffset: int,
 			duration: int = 250,
-			action_chain: Optional[ActionChains] = None
+			action_chain: Optional[ActionChains] = None,
+			human: bool = False,
+			start_position: Optional[ActionPoint] = None,
 	) -> ActionChains:
 		"""
 		Adds an action to move the mouse cursor to an offset from the center of a specified element.
@@ -1308,12 +2183,28 @@ class BrowserWebDriver:
 				ActionChains instance if `action_chain` is None. Defaults to 250.
 			action_chain (Optional[ActionChains]): An existing ActionChains instance to append
 				this action to. If None, a new chain is created. Defaults to None.
+			human (bool): If True, the cursor is moved along an eased path of several absolute steps instead of a single linear move. Defaults to False.
+			start_position (Optional[ActionPoint]): The viewport point the eased path starts at when `human` is True,
+				e.g., the end point returned by `build_hm_move_to_element_action` for the previous move. Required if `human` is True. Defaults to None.
 
 		Returns:
 			ActionChains: The ActionChains instance (either the one passed in or a new one)
 				with the move-with-offset action added, allowing for method chaining.
+
+		Raises:
+			ValueError: If `human` is True and `start_position` is None.
 		"""
 		
+		if human:
+			return self._build_smooth_move_to_element_action(
+					element=element,
+					xoffset=xoffset,
+					yoffset=yoffset,
+					duration=duration,
+					action_chain=action_chain,
+					start_position=start_position
+			)
+		
 		if action_chain is None:
 			action_chain = self.build_action_chains(duration=duration)
 		
@@ -1331,7 +2222,36 @@ class BrowserWebDriver:
 			link (str): URL to open in the new tab. If empty, opens a blank tab. Defaults to "".
 		"""
 		
-		self.execute_js_script(self._js_scripts["open_new_tab"], link)
+		self._execute_js_snippet("open_new_tab", link)
+		self._invalidate_page_caches()
+	
+	def open_new_target(self, link: str = "", switch_to: bool = True) -> str:
+		"""
+		Opens a new tab with the given URL and returns its window handle.
+
+		If the driver supports Chrome DevTools commands, the tab is created with a `Target.createTarget` command
+		(DevTools target IDs are the window handles), so no JavaScript is executed in the current page. This makes it
+		cheap for several WebDriver instances attached to the same browser (the same debugging port) to work in their own tabs
+		instead of starting a browser each. Otherwise, the tab is opened with `open_new_tab`.
+
+		Args:
+			link (str): URL to open in the new tab. If empty, opens a blank tab. Defaults to "".
+			switch_to (bool): Whether to switch focus to the new tab. Defaults to True.
+
+		Returns:
+			str: The window handle of the new tab.
+		"""
+		
+		if hasattr(self.driver, "execute_cdp_cmd"):
+			window_handle = self.driver.execute_cdp_cmd("Target.createTarget", {"url": link or "about:blank"})["targetId"]
+		else:
+			self.open_new_tab(link)
+			window_handle = self.windows_handles[-1]
+		
+		if switch_to:
+			self.switch_to_window(window_handle)
+		
+		return window_handle
 	
 	@property
 	def rect(self) -> WindowRect:
@@ -1362,6 +2282,7 @@ class BrowserWebDriver:
 		"""
 		
 		self.driver.refresh()
+		self._invalidate_page_caches()
 	
 	def release_action(
 			self,
@@ -1396,7 +2317,12 @@ class BrowserWebDriver:
 		
 		return action_chain
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote WebDriver session.
 
@@ -1406,6 +2332,8 @@ class BrowserWebDriver:
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 
 		Raises:
 			NotImplementedError: This function must be implemented in child classes.
@@ -1480,11 +2408,11 @@ class BrowserWebDriver:
 		Sets the proxy.
 
 		Configures the browser to use a proxy server for network requests. This can be a single proxy server or a list
-		of proxy servers, from which one will be randomly selected for use. Proxies are used to route browser traffic
+		of proxy servers, which are used in a shuffled round-robin order. Proxies are used to route browser traffic
 		through an intermediary server, often for anonymity, security, or accessing geo-restricted content.
 
 		Args:
-			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, a proxy will be randomly chosen from the list.
+			proxy (Optional[Union[str, list[str]]]): Proxy server address or list of addresses. If a list is provided, the next proxy of its shuffled rotation is used.
 				If None, proxy settings are removed.
 		"""
 		
@@ -1526,12 +2454,17 @@ class BrowserWebDriver:
 
 		This method configures the browser options to hide or show automation
 		indicators, which are typically present when a browser is controlled by WebDriver.
+		Does nothing if the requested state is already applied.
 
 		Args:
 			hide (bool): If True, hides automation indicators; otherwise, shows them.
 		"""
 		
+		if self._automation_hidden == hide:
+			return
+		
 		self._webdriver_options_manager.hide_automation(hide)
+		self._automation_hidden = hide
 	
 	def set_enable_devtools(self, enable_devtools: bool):
 		"""
@@ -1629,19 +2562,25 @@ class BrowserWebDriver:
 
 		Determines if a WebDriver instance is currently running and active by checking if the configured
 		debugging port is in use by any process. This is a way to verify if a browser session is active
-		without directly querying the WebDriver itself.
+		without directly querying the WebDriver itself. Scanning the processes is expensive, so the result
+		is reused for 0.1 seconds.
 
 		Returns:
 			bool: True if the WebDriver is active (debugging port is in use), False otherwise.
 		"""
 		
-		if any(
+		now = time.monotonic()
+		
+		if self._webdriver_active_check is not None and now - self._webdriver_active_check[0] < 0.1:
+			return self._webdriver_active_check[1]
+		
+		is_active = any(
 				ports == [self.debugging_port]
 				for pid, ports in get_localhost_processes_with_pids().items()
-		):
-			return True
-		else:
-			return False
+		)
+		self._webdriver_active_check = (now, is_active)
+		
+		return is_active
 	
 	def find_debugging_port(self, debugging_port: Optional[int], profile_dir: Optional[str]) -> int:
 		"""
@@ -1795,12 +2734,14 @@ class BrowserWebDriver:
 					trio_tokens_limits=trio_tokens_limits,
 			)
 		
+			self._webdriver_active_check = None
 			self._is_active = self.check_webdriver_active()
 		
 			if not self._is_active:
 				Popen(self._webdriver_start_args.start_command, shell=True)
 		
 				while not self._is_active:
+					time.sleep(0.1)
 					self._is_active = self.check_webdriver_active()
 		
 			self.create_driver()
@@ -1811,6 +2752,7 @@ class BrowserWebDriver:
 
 		Quits the current WebDriver session, closes all browser windows, and then forcefully terminates
 		the browser process. This ensures a clean shutdown of the browser and WebDriver environment.
+		Quitting also closes the pooled HTTP connections of the driver, and the driver is released even if quitting fails.
 		"""
 		
 		for pid, ports in get_localhost_processes_with_pids().items():
@@ -1820,13 +2762,21 @@ class BrowserWebDriver:
 						selectors=ProcessID(pid)
 				)
 		
+				self._webdriver_active_check = None
 				self._is_active = self.check_webdriver_active()
 		
 				while self._is_active:
+					time.sleep(0.1)
 					self._is_active = self.check_webdriver_active()
 		
-		self.driver.quit()
-		self.driver = None
+		self._session_timeouts.pop(self.driver.session_id, None)
+		
+		try:
+			self.driver.quit()
+		finally:
+			self.driver = None
+			self._timeouts_cache = {"implicit": None, "pageLoad": None}
+			self._invalidate_page_caches()
 	
 	def restart_webdriver(
 			self,
@@ -1878,6 +2828,76 @@ class BrowserWebDriver:
 				trio_tokens_limits=trio_tokens_limits,
 		)
 	
+	def _get_session_origins(self) -> set[str]:
+		"""
+		Collects the origins whose site data the browser session may hold.
+
+		`Storage.clearDataForOrigin` accepts only one concrete origin, so the origins are gathered from
+		the URLs of all DevTools targets (tabs, frames and workers) and from the domains of all cookies.
+		Opaque origins (e.g., about:blank or data: URLs) are skipped, as they have no site data to clear.
+		Requires a Chromium-based driver.
+
+		Returns:
+			set[str]: The origins in the "scheme://host[:port]" form.
+		"""
+		
+		origins = set()
+		
+		for target_info in self.driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]:
+			url = urlparse(target_info["url"])
+		
+			if url.scheme in ("http", "https") and url.netloc:
+				origins.add(f"{url.scheme}://{url.netloc}")
+		
+		for cookie in self.driver.execute_cdp_cmd("Storage.getCookies", {})["cookies"]:
+			domain = cookie["domain"].lstrip(".")
+		
+			origins.add(f"https://{domain}")
+		
+			if not cookie["secure"]:
+				origins.add(f"http://{domain}")
+		
+		return origins
+	
+	def reuse_webdriver(self, clean_session: bool = True):
+		"""
+		Prepares the running browser for the next task instead of restarting it.
+
+		Closing and starting the browser takes seconds, while cleaning the session takes a few commands.
+		All tabs except the first one are closed, focus is switched to the first tab, and it is navigated to the start page URL.
+		If `clean_session` is True, cookies and site storage are cleared first. With Chrome DevTools, all cookies are deleted
+		and the storage of every origin of an open tab, frame, worker or cookie is cleared; origins that are no longer open
+		and have no cookies are not known to the browser session and keep their storage. Otherwise, the cookies visible
+		to the current page are deleted and the local and session storage of every open tab is cleared.
+
+		Args:
+			clean_session (bool): Whether to clear cookies and site storage. Defaults to True.
+		"""
+		
+		windows_handles = self.windows_handles
+		
+		if clean_session:
+			if hasattr(self.driver, "execute_cdp_cmd"):
+				origins = self._get_session_origins()
+				self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+		
+				for origin in origins:
+					self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+			else:
+				self.driver.delete_all_cookies()
+		
+				for window_handle in windows_handles:
+					self.switch_to_window(window_handle)
+					self.execute_js_script(
+							"try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (error) {}"
+					)
+		
+		if len(windows_handles) > 1:
+			self.close_windows(windows_handles[1:])
+		
+		self.switch_to_window(windows_handles[0])
+		self.search_url(self._webdriver_start_args.start_page_url or "about:blank")
+	
 	def scroll_by_amount_action(
 			self,
 			delta_x: int,
@@ -1999,8 +3019,10 @@ class BrowserWebDriver:
 			temp_page_load_timeout (Optional[int]): Temporary page load timeout in seconds for page load. Defaults to None.
 		"""
 		
-		self.update_times(temp_implicitly_wait, temp_page_load_timeout)
-		self.driver.get(url)
+		with self._with_timeouts(temp_implicitly_wait, temp_page_load_timeout):
+			self.driver.get(url)
+		
+		self._invalidate_page_caches()
 	
 	def send_keys_action(
 			self,
@@ -2089,7 +3111,7 @@ class BrowserWebDriver:
 		to load or when you want to halt resource loading for performance testing or specific scenarios.
 		"""
 		
-		self.execute_js_script(self._js_scripts["stop_window_loading"])
+		self._execute_js_snippet("stop_window_loading")
 	
 	def switch_to_frame(self, frame: Union[str, int, WebElement]):
 		"""
@@ -2097,13 +3119,41 @@ class BrowserWebDriver:
 
 		Changes the WebDriver's focus to a specific frame within the current page. Frames are often used to embed
 		content from other sources within a webpage. After switching to a frame, all WebDriver commands will be
-		directed to elements within that frame until focus is switched back.
+		directed to elements within that frame until focus is switched back with `switch_to_parent_frame`,
+		`switch_to_default_content` or `switch_to_window`. Use these methods instead of `driver.switch_to`,
+		as only they keep track of the focused frame.
 
 		Args:
 			frame (Union[str, int, WebElement]): Specifies the frame to switch to. Can be a frame name (str), index (int), or a WebElement representing the frame.
 		"""
 		
 		self.driver.switch_to.frame(frame)
+		self._frame_depth += 1
+		self._invalidate_page_caches()
+	
+	def switch_to_default_content(self):
+		"""
+		Switches the driver's focus back to the top-level document of the current window.
+
+		Use it instead of `driver.switch_to.default_content()`, so the driver knows that predefined
+		JavaScript snippets can be run over DevTools again.
+		"""
+		
+		self.driver.switch_to.default_content()
+		self._frame_depth = 0
+		self._invalidate_page_caches()
+	
+	def switch_to_parent_frame(self):
+		"""
+		Switches the driver's focus to the parent of the current frame.
+
+		Use it instead of `driver.switch_to.parent_frame()`, so the driver keeps track of the frame it is focused on.
+		Does nothing if the driver is focused on a top-level browsing context.
+		"""
+		
+		self.driver.switch_to.parent_frame()
+		self._frame_depth = max(0, self._frame_depth - 1)
+		self._invalidate_page_caches()
 	
 	def to_wrapper(self) -> "TrioBrowserWebDriverWrapper":
 		"""
@@ -1,139 +1,66 @@
 import pathlib
 from selenium import webdriver
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from osn_bas.types import WindowRect
-from osn_bas.webdrivers.types import WebdriverOption
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from osn_bas.browsers_handler import get_path_to_browser
 from osn_bas.webdrivers.BaseDriver.webdriver import BrowserWebDriver
-from osn_bas.webdrivers.BaseDriver.start_args import BrowserStartArgs
+from osn_bas.webdrivers.BaseDriver.remote import (
+	AttachedRemote,
+	get_remote_connection
+)
 from selenium.webdriver.remote.remote_connection import RemoteConnection
-from osn_bas.webdrivers.BaseDriver.options import (
-	BrowserOptionsManager
+from osn_bas.webdrivers.Chromium import (
+	ChromiumOptionsManager,
+	ChromiumStartArgs
 )
 
 
-class ChromeOptionsManager(BrowserOptionsManager):
+class ChromeOptionsManager(ChromiumOptionsManager):
 	"""
 	Manages Chrome-specific browser options for Selenium WebDriver.
 
-	This class extends BrowserOptionsManager to provide specific configurations
-	for Chrome browser options, such as experimental options and arguments.
-	It initializes default Chrome options and provides methods to modify them.
+	This class specializes ChromiumOptionsManager for Chrome. Chrome shares all its options
+	with other Chromium-based browsers, so only the Selenium options class differs.
 
 	Attributes:
 		_options (webdriver.ChromeOptions): Chrome options object.
-		_debugging_port_command (WebdriverOption): Configuration for debugging port option.
-		_user_agent_command (WebdriverOption): Configuration for user agent option.
-		_proxy_command (WebdriverOption): Configuration for proxy option.
-		_enable_bidi_command (WebdriverOption): Configuration for enable BiDi option.
+		_debugging_port_command (WebdriverOption): Configuration for the debugging port option.
+		_user_agent_command (WebdriverOption): Configuration for the user agent option.
+		_proxy_command (WebdriverOption): Configuration for the proxy option.
+		_enable_bidi_command (WebdriverOption): Configuration for the enable BiDi option.
+		options_class (type[Options]): Selenium Chrome options class.
 	"""
 	
-	def __init__(self):
-		"""
-		Initializes ChromeOptionsManager.
-
-		Sets up the Chrome options manager with specific option configurations for
-		debugging port, user agent, proxy, and BiDi protocol.
-		"""
-		
-		super().__init__(
-				WebdriverOption(
-						name="debugger_address_",
-						command="debuggerAddress",
-						type="experimental"
-				),
-				WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
-				WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
-				WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
-		)
-	
-	def hide_automation(self, hide: bool):
-		"""
-		Adds arguments to hide automation features in Chrome.
-
-		This method configures Chrome options to reduce the detectability of automated browsing,
-		making it harder for websites to identify the browser as being controlled by automation software.
-
-		Args:
-			hide (bool): If True, adds arguments to hide automation; if False, removes them.
-		"""
-		
-		if hide:
-			self.set_argument(
-					"disable_blink_features_",
-					"--disable-blink-features=AutomationControlled"
-			)
-			self.set_argument("no_first_run_", "--no-first-run")
-			self.set_argument("no_service_autorun_", "--no-service-autorun")
-			self.set_argument("password_store_", "--password-store=basic")
-		else:
-			self.remove_argument("disable_blink_features_")
-			self.remove_argument("no_first_run_")
-			self.remove_argument("no_service_autorun_")
-			self.remove_argument("password_store_")
-	
-	def renew_webdriver_options(self) -> Options:
-		"""
-		Creates and returns a new Chrome Options object.
+	options_class = Options
 
-		Returns a fresh instance of `webdriver.ChromeOptions`, allowing for a clean
-		state of browser options to be configured.
 
-		Returns:
-			Options: A new Selenium Chrome Options object.
-		"""
-		
-		return Options()
-
-
-class ChromeStartArgs(BrowserStartArgs):
+class ChromeStartArgs(ChromiumStartArgs):
 	"""
 	Manages Chrome-specific browser start arguments for Selenium WebDriver.
 
-	This class extends BrowserStartArgs and is tailored for Chrome. It defines
-	command-line arguments specific to starting the Chrome browser with configurations
-	suitable for WebDriver control, such as remote debugging port, user profile directory,
-	headless mode, and proxy settings.
+	Chrome accepts the same command-line arguments as other Chromium-based browsers,
+	so this class only names them for Chrome.
 
 	Attributes:
 		_browser_exe (Union[str, pathlib.Path]): Path to the Chrome executable.
-		_debugging_port_command_line (str): Command line argument for debugging port.
-		_profile_dir_command_line (str): Command line argument for profile directory.
-		_headless_mode_command_line (str): Command line argument for headless mode.
-		_mute_audio_command_line (str): Command line argument for mute audio.
-		_user_agent_command_line (str): Command line argument for user agent.
-		_proxy_server_command_line (str): Command line argument for proxy server.
+		_debugging_port_command_line (str): Command-line format for debugging port.
+		_profile_dir_command_line (str): Command-line format for profile directory.
+		_headless_mode_command_line (str): Command-line argument for headless mode.
+		_mute_audio_command_line (str): Command-line argument for mute audio.
+		_user_agent_command_line (str): Command-line format for user agent.
+		_proxy_server_command_line (str): Command-line format for proxy server.
 		start_page_url (str): Default start page URL.
 		debugging_port (Optional[int]): Current debugging port number.
 		profile_dir (Optional[str]): Current profile directory path.
-		headless_mode (Optional[bool]): Current headless mode status.
-		mute_audio (Optional[bool]): Current mute audio status.
+		headless_mode (bool): Current headless mode status.
+		mute_audio (bool): Current mute audio status.
 		user_agent (Optional[str]): Current user agent string.
 		proxy_server (Optional[str]): Current proxy server address.
 	"""
 	
-	def __init__(self, browser_exe: Union[str, pathlib.Path]):
-		"""
-		 Initializes ChromeStartArgs.
-
-		Configures command-line arguments for starting the Chrome browser, including
-		settings for remote debugging, user data directory, headless mode, and more.
-
-		 Args:
-			browser_exe (Union[str, pathlib.Path]): The path to the Chrome executable.
-		"""
-		
-		super().__init__(
-				browser_exe,
-				"--remote-debugging-port={value}",
-				"--user-data-dir=\"{value}\"",
-				"--headless",
-				"--mute-audio",
-				"--user-agent=\"{value}\"",
-				"--proxy-server=\"{value}\"",
-		)
+	__slots__ = ()
 
 
 class ChromeWebDriver(BrowserWebDriver):
@@ -146,7 +73,7 @@ class ChromeWebDriver(BrowserWebDriver):
 
 	Attributes:
 		_window_rect (WindowRect): Initial window rectangle settings.
-		_js_scripts (dict[str, str]): Collection of JavaScript scripts for browser interaction.
+		_js_scripts (JS_Scripts): Collection of JavaScript scripts for browser interaction.
 		_browser_exe (Union[str, pathlib.Path]): Path to the Chrome browser executable.
 		_webdriver_path (str): Path to the ChromeDriver executable.
 		_webdriver_start_args (ChromeStartArgs): Manages Chrome startup arguments.
@@ -158,6 +85,8 @@ class ChromeWebDriver(BrowserWebDriver):
 		dev_tools (DevTools): Instance of DevTools for interacting with browser developer tools.
 	"""
 	
+	__slots__ = ()
+	
 	def __init__(
 			self,
 			webdriver_path: str,
@@ -229,20 +158,26 @@ class ChromeWebDriver(BrowserWebDriver):
 
 		Initializes the Selenium ChromeDriver with configured options and service,
 		sets up window parameters, and applies default timeouts.
+		The driver gets a copy of the options, so later option changes don't leak into a running session.
+		The base timeouts are sent as a capability of the New Session command, so only the window rectangle
+		needs a separate command.
 		"""
 		
-		webdriver_options = self._webdriver_options_manager._options
+		webdriver_options = self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options)
 		webdriver_service = Service(executable_path=self._webdriver_path)
+		self._add_base_timeouts_capability(webdriver_options)
 		
 		self.driver = webdriver.Chrome(options=webdriver_options, service=webdriver_service)
 		
+		self._apply_base_timeouts()
 		self.set_window_rect(self._window_rect)
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote Chrome WebDriver session.
 
@@ -252,21 +187,22 @@ class ChromeWebDriver(BrowserWebDriver):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 
 		:Usage:
 			command_executor, session_id = driver.get_vars_for_remote()
+			capabilities = driver.get_remote_capabilities()
 			new_driver = ChromeWebDriver(webdriver_path="path/to/chromedriver")
-			new_driver.remote_connect_driver(command_executor, session_id)
+			new_driver.remote_connect_driver(command_executor, session_id, capabilities)
 			# Now new_driver controls the same browser session as driver
 		"""
 		
-		self.driver = webdriver.Remote(
-				command_executor=command_executor,
-				options=self._webdriver_options_manager._options
+		self.driver = AttachedRemote(
+				command_executor=get_remote_connection(command_executor),
+				session_id=session_id,
+				options=self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options),
+				capabilities=capabilities
 		)
-		self.driver.session_id = session_id
 		
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
+		self._apply_attached_session_timeouts()
@@ -0,0 +1,145 @@
+import pathlib
+from typing import Union
+from types import MappingProxyType
+from osn_bas.webdrivers.types import WebdriverOption
+from osn_bas.webdrivers.BaseDriver.start_args import BrowserStartArgs
+from selenium.webdriver.chromium.options import ChromiumOptions
+from osn_bas.webdrivers.BaseDriver.options import BrowserOptionsManager
+
+
+CHROMIUM_HIDE_AUTOMATION_ARGUMENTS = (
+	("disable_blink_features_", "--disable-blink-features=AutomationControlled"),
+	("no_first_run_", "--no-first-run"),
+	("no_service_autorun_", "--no-service-autorun"),
+	("password_store_", "--password-store=basic"),
+)
+
+
+class ChromiumOptionsManager(BrowserOptionsManager):
+	"""
+	Manages browser options shared by all Chromium-based browsers for Selenium WebDriver.
+
+	Chrome, Edge and Yandex Browser understand the same options, so this class implements them once.
+	Browser-specific managers only set `options_class` to their Selenium options class.
+
+	Attributes:
+		_options (ChromiumOptions): Chromium options object of the browser-specific class.
+		_debugging_port_command (WebdriverOption): Configuration for the debugging port option.
+		_user_agent_command (WebdriverOption): Configuration for the user agent option.
+		_proxy_command (WebdriverOption): Configuration for the proxy option.
+		_enable_bidi_command (WebdriverOption): Configuration for the enable BiDi option.
+		options_class (type[ChromiumOptions]): Selenium options class of the browser.
+		_COMMANDS (MappingProxyType[str, WebdriverOption]): Read-only table of the debugging port, user agent, proxy
+			and enable BiDi option configurations, shared by all instances.
+		_options_prototypes (dict[type[ChromiumOptions], ChromiumOptions]): Pristine options built once per process and options class,
+			copied by `renew_webdriver_options`.
+	"""
+	
+	options_class: type[ChromiumOptions] = ChromiumOptions
+	_options_prototypes: dict[type[ChromiumOptions], ChromiumOptions] = {}
+	_COMMANDS = MappingProxyType(
+			{
+				"debugger_address_": WebdriverOption(
+						name="debugger_address_",
+						command="debuggerAddress",
+						type="experimental"
+				),
+				"user_agent_": WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
+				"proxy_": WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
+				"enable_bidi_": WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
+			}
+	)
+	
+	def __init__(self):
+		"""
+		Initializes ChromiumOptionsManager.
+
+		Sets up the options manager with configurations for debugging port,
+		user agent, proxy, and enable BiDi options, shared by Chromium-based browsers.
+		The configurations come from the class-level `_COMMANDS` table, so no option records are built per instance.
+		"""
+		
+		super().__init__(*self._COMMANDS.values())
+	
+	def hide_automation(self, hide: bool):
+		"""
+		Adds arguments to hide automation features in a Chromium-based browser.
+
+		Configures browser options to make it harder for websites to detect
+		that the browser is being controlled by automation tools, thus appearing more like a regular user.
+
+		Args:
+			hide (bool): If True, adds arguments to hide automation features; if False, removes them.
+		"""
+		
+		if hide:
+			self.set_arguments(CHROMIUM_HIDE_AUTOMATION_ARGUMENTS)
+		else:
+			self.remove_arguments(argument_name for argument_name, _ in CHROMIUM_HIDE_AUTOMATION_ARGUMENTS)
+	
+	def renew_webdriver_options(self) -> ChromiumOptions:
+		"""
+		Creates and returns a new options object of `options_class`.
+
+		The options are copied from a prototype shared by all managers with the same `options_class`
+		instead of being constructed every time.
+
+		Returns:
+			ChromiumOptions: A new Selenium options object of the browser.
+		"""
+		
+		options_prototype = self._options_prototypes.get(self.options_class)
+		
+		if options_prototype is None:
+			options_prototype = self.options_class()
+			self._options_prototypes[self.options_class] = options_prototype
+		
+		return self.copy_webdriver_options(options_prototype)
+
+
+class ChromiumStartArgs(BrowserStartArgs):
+	"""
+	Manages browser start arguments shared by all Chromium-based browsers for Selenium WebDriver.
+
+	Chrome, Edge and Yandex Browser accept the same command-line arguments for remote debugging,
+	user data directory, headless mode, mute audio, user agent and proxy settings, so they are defined once here.
+
+	Attributes:
+		_browser_exe (Union[str, pathlib.Path]): Path to the browser executable.
+		_debugging_port_command_line (str): Command-line format for debugging port.
+		_profile_dir_command_line (str): Command-line format for profile directory.
+		_headless_mode_command_line (str): Command-line argument for headless mode.
+		_mute_audio_command_line (str): Command-line argument for mute audio.
+		_user_agent_command_line (str): Command-line format for user agent.
+		_proxy_server_command_line (str): Command-line format for proxy server.
+		start_page_url (str): Default start page URL.
+		debugging_port (Optional[int]): Current debugging port number.
+		profile_dir (Optional[str]): Current profile directory path.
+		headless_mode (bool): Current headless mode status.
+		mute_audio (bool): Current mute audio status.
+		user_agent (Optional[str]): Current user agent string.
+		proxy_server (Optional[str]): Current proxy server address.
+	"""
+	
+	__slots__ = ()
+	
+	def __init__(self, browser_exe: Union[str, pathlib.Path]):
+		"""
+		Initializes ChromiumStartArgs.
+
+		Configures command-line arguments for starting a Chromium-based browser,
+		including settings for remote debugging, user data directory, headless mode, and more.
+
+		Args:
+			browser_exe (Union[str, pathlib.Path]): The path to the browser executable.
+		"""
+		
+		super().__init__(
+				browser_exe,
+				"--remote-debugging-port={value}",
+				"--user-data-dir=\"{value}\"",
+				"--headless",
+				"--mute-audio",
+				"--user-agent=\"{value}\"",
+				"--proxy-server=\"{value}\"",
+		)
@@ -1,25 +1,43 @@
 import pathlib
 from selenium import webdriver
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from osn_bas.types import WindowRect
+from osn_bas.errors import PlatformNotSupportedError
 from selenium.webdriver.edge.options import Options
 from selenium.webdriver.edge.service import Service
-from osn_bas.webdrivers.types import WebdriverOption
-from osn_bas.browsers_handler import get_path_to_browser
+from osn_bas.webdrivers._functions import resolve_webdriver_path
+from osn_bas.browsers_handler import (
+	get_path_to_browser,
+	get_version_of_browser
+)
 from osn_bas.webdrivers.BaseDriver.webdriver import BrowserWebDriver
-from osn_bas.webdrivers.BaseDriver.start_args import BrowserStartArgs
+from osn_bas.webdrivers.BaseDriver.service import get_shared_service
+from osn_bas.webdrivers.BaseDriver.remote import (
+	AttachedRemote,
+	get_remote_connection,
+	set_connection_pool_size
+)
 from selenium.webdriver.remote.remote_connection import RemoteConnection
-from osn_bas.webdrivers.BaseDriver.options import (
-	BrowserOptionsManager
+from osn_bas.webdrivers.Chromium import (
+	ChromiumOptionsManager,
+	ChromiumStartArgs
+)
+
+
+_WELL_KNOWN_EDGE_PATHS = (
+	pathlib.Path(r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe"),
+	pathlib.Path(r"C:\Program Files\Microsoft\Edge\Application\msedge.exe"),
+	pathlib.Path("/usr/bin/microsoft-edge"),
+	pathlib.Path("/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"),
 )
 
 
-class EdgeOptionsManager(BrowserOptionsManager):
+class EdgeOptionsManager(ChromiumOptionsManager):
 	"""
 	Manages Edge-specific browser options for Selenium WebDriver.
 
-	This class specializes BrowserOptionsManager for Microsoft Edge, providing
-	functionality to manage browser options specific to Edge using Selenium WebDriver.
+	This class specializes ChromiumOptionsManager for Microsoft Edge. Microsoft Edge shares all its options
+	with other Chromium-based browsers, so only the Selenium options class differs.
 
 	Attributes:
 		_options (webdriver.EdgeOptions): Edge options object.
@@ -27,73 +45,18 @@ class EdgeOptionsManager(BrowserOptionsManager):
 		_user_agent_command (WebdriverOption): Configuration for the user agent option.
 		_proxy_command (WebdriverOption): Configuration for the proxy option.
 		_enable_bidi_command (WebdriverOption): Configuration for the enable BiDi option.
+		options_class (type[Options]): Selenium Edge options class.
 	"""
 	
-	def __init__(self):
-		"""
-		Initializes EdgeOptionsManager.
-
-		Sets up the Edge options manager with configurations for debugging port,
-		user agent, proxy, and enable BiDi options, specific to Microsoft Edge.
-		"""
-		
-		super().__init__(
-				WebdriverOption(
-						name="debugger_address_",
-						command="debuggerAddress",
-						type="experimental"
-				),
-				WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
-				WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
-				WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
-		)
-	
-	def hide_automation(self, hide: bool):
-		"""
-		Adds arguments to hide automation features in Edge.
-
-		Configures Edge browser options to make it harder for websites to detect
-		that the browser is being controlled by automation tools, thus appearing more like a regular user.
-
-		Args:
-			hide (bool): If True, adds arguments to hide automation features; if False, removes them.
-		"""
-		
-		if hide:
-			self.set_argument(
-					"disable_blink_features_",
-					"--disable-blink-features=AutomationControlled"
-			)
-			self.set_argument("no_first_run_", "--no-first-run")
-			self.set_argument("no_service_autorun_", "--no-service-autorun")
-			self.set_argument("password_store_", "--password-store=basic")
-		else:
-			self.remove_argument("disable_blink_features_")
-			self.remove_argument("no_first_run_")
-			self.remove_argument("no_service_autorun_")
-			self.remove_argument("password_store_")
-	
-	def renew_webdriver_options(self) -> Options:
-		"""
-		Creates and returns a new Options object.
-
-		Returns a fresh instance of Selenium Edge Options, allowing for configuration
-		of new Edge browser sessions with a clean set of options.
-
-		Returns:
-			Options: A new Selenium Edge options object.
-		"""
-		
-		return Options()
+	options_class = Options
 
 
-class EdgeStartArgs(BrowserStartArgs):
+class EdgeStartArgs(ChromiumStartArgs):
 	"""
 	Manages Edge-specific browser start arguments for Selenium WebDriver.
 
-	This class extends BrowserStartArgs to handle command-line arguments specifically
-	for starting Microsoft Edge with Selenium WebDriver, including configurations
-	for remote debugging, user data directory, headless mode, and proxy settings.
+	Microsoft Edge accepts the same command-line arguments as other Chromium-based browsers,
+	so this class only names them for Microsoft Edge.
 
 	Attributes:
 		_browser_exe (Union[str, pathlib.Path]): Path to the Edge executable.
@@ -106,32 +69,13 @@ class EdgeStartArgs(BrowserStartArgs):
 		start_page_url (str): Default start page URL.
 		debugging_port (Optional[int]): Current debugging port number.
 		profile_dir (Optional[str]): Current profile directory path.
-		headless_mode (Optional[bool]): Current headless mode status.
-		mute_audio (Optional[bool]): Current mute audio status.
+		headless_mode (bool): Current headless mode status.
+		mute_audio (bool): Current mute audio status.
 		user_agent (Optional[str]): Current user agent string.
 		proxy_server (Optional[str]): Current proxy server address.
 	"""
 	
-	def __init__(self, browser_exe: Union[str, pathlib.Path]):
-		"""
-		 Initializes EdgeStartArgs.
-
-		Configures command-line arguments for starting the Microsoft Edge browser,
-		including settings for remote debugging, user data directory, headless mode, and more.
-
-		 Args:
-		 	browser_exe (Union[str, pathlib.Path]): The path to the Edge executable.
-		"""
-		
-		super().__init__(
-				browser_exe,
-				"--remote-debugging-port={value}",
-				"--user-data-dir=\"{value}\"",
-				"--headless",
-				"--mute-audio",
-				"--user-agent=\"{value}\"",
-				"--proxy-server=\"{value}\"",
-		)
+	__slots__ = ()
 
 
 class EdgeWebDriver(BrowserWebDriver):
@@ -144,7 +88,7 @@ class EdgeWebDriver(BrowserWebDriver):
 
 	Attributes:
 		_window_rect (WindowRect): Initial window rectangle settings.
-		_js_scripts (dict[str, str]): Collection of JavaScript scripts for browser interaction.
+		_js_scripts (JS_Scripts): Collection of JavaScript scripts for browser interaction.
 		_browser_exe (Union[str, pathlib.Path]): Path to the Microsoft Edge browser executable.
 		_webdriver_path (str): Path to the MSEdgeDriver executable.
 		_webdriver_start_args (EdgeStartArgs): Manages Edge startup arguments.
@@ -154,11 +98,15 @@ class EdgeWebDriver(BrowserWebDriver):
 		_base_page_load_timeout (int): Base page load timeout for page loading operations.
 		_is_active (bool): Indicates if the WebDriver instance is currently active.
 		dev_tools (DevTools): Instance of DevTools for interacting with browser developer tools.
+		_pool_maxsize (Optional[int]): Size of the HTTP connection pool of the driver, or None to size it to the Trio capacity limiter.
+		_keep_alive (bool): Whether the driver keeps its HTTP connections alive.
 	"""
 	
+	__slots__ = ("_pool_maxsize", "_keep_alive")
+	
 	def __init__(
 			self,
-			webdriver_path: str,
+			webdriver_path: Optional[str],
 			enable_devtools: bool,
 			browser_exe: Optional[Union[str, pathlib.Path]] = None,
 			hide_automation: bool = True,
@@ -171,6 +119,8 @@ class EdgeWebDriver(BrowserWebDriver):
 			implicitly_wait: int = 5,
 			page_load_timeout: int = 5,
 			window_rect: Optional[WindowRect] = None,
+			pool_maxsize: Optional[int] = None,
+			keep_alive: bool = True,
 			start_page_url: str = "https://www.google.com",
 	):
 		"""
@@ -181,10 +131,12 @@ class EdgeWebDriver(BrowserWebDriver):
 		for browser behavior like headless mode, proxy, and DevTools.
 
 		Args:
-			webdriver_path (str): Path to the EdgeDriver executable compatible with Edge Browser.
+			webdriver_path (Optional[str]): Path to the EdgeDriver executable compatible with Edge Browser.
+				If None, a matching driver is resolved with Selenium Manager and its path is cached between runs.
 			enable_devtools (bool): Enables or disables the use of DevTools for this browser instance.
 			browser_exe (Optional[Union[str, pathlib.Path]]): Path to the Edge Browser executable.
-				If None, the path is automatically detected. Defaults to None.
+				If None, the default installation paths are checked first, then the installed browsers are searched once per process
+				(only on Windows). Defaults to None.
 			hide_automation (bool): Hides automation indicators in the browser if True. Defaults to True.
 			debugging_port (Optional[int]): Specifies a debugging port for the browser. Defaults to None.
 			profile_dir (Optional[str]): Path to the browser profile directory to be used. Defaults to None.
@@ -196,11 +148,43 @@ class EdgeWebDriver(BrowserWebDriver):
 			implicitly_wait (int): Base implicit wait time for WebDriver element searches in seconds. Defaults to 5.
 			page_load_timeout (int): Base page load timeout for WebDriver operations in seconds. Defaults to 5.
 			window_rect (Optional[WindowRect]): Initial window rectangle settings for the browser window. Defaults to None.
+			pool_maxsize (Optional[int]): Size of the HTTP connection pool used for WebDriver commands.
+				If None, it is sized to the Trio capacity limiter (at least 20 connections). Defaults to None.
+			keep_alive (bool): Whether to keep HTTP connections to the WebDriver server alive between commands. Defaults to True.
 			start_page_url (str): URL to open when the browser starts. Defaults to "https://www.google.com".
+
+		Raises:
+			FileNotFoundError: If `webdriver_path` is None and no Edge executable was found to resolve the driver for.
 		"""
 		
 		if browser_exe is None:
-			browser_exe = get_path_to_browser("Microsoft Edge")
+			browser_exe = next((path for path in _WELL_KNOWN_EDGE_PATHS if path.is_file()), None)
+		
+			if browser_exe is None:
+				try:
+					browser_exe = get_path_to_browser("Microsoft Edge")
+				except PlatformNotSupportedError:
+					browser_exe = None
+		
+		if webdriver_path is None:
+			if browser_exe is None:
+				raise FileNotFoundError(
+						"Microsoft Edge executable was not found, pass `browser_exe` or `webdriver_path` explicitly."
+				)
+		
+			try:
+				browser_version = get_version_of_browser("Microsoft Edge")
+			except PlatformNotSupportedError:
+				browser_version = None
+		
+			webdriver_path = resolve_webdriver_path(
+					selenium_browser_name="MicrosoftEdge",
+					browser_exe=browser_exe,
+					browser_version=browser_version
+			)
+		
+		self._pool_maxsize = pool_maxsize
+		self._keep_alive = keep_alive
 		
 		super().__init__(
 				browser_exe=browser_exe,
@@ -226,21 +210,37 @@ class EdgeWebDriver(BrowserWebDriver):
 		Creates the Edge webdriver instance.
 
 		Initializes the Selenium EdgeDriver with configured options and service.
-		Sets window position, size, implicit wait time, and page load timeout for the Edge browser.
+		The driver gets a copy of the options, so later option changes don't leak into a running session.
+		The HTTP connection pool of the driver is sized to `pool_maxsize` or the Trio capacity limiter, so concurrent commands don't queue on one connection.
+		All drivers with the same `webdriver_path` share one msedgedriver process instead of starting their own.
+		The base timeouts are sent as a capability of the New Session command, so only the window rectangle
+		needs a separate command.
 		"""
 		
-		webdriver_options = self._webdriver_options_manager._options
-		webdriver_service = Service(executable_path=self._webdriver_path)
+		webdriver_options = self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options)
+		webdriver_service = get_shared_service(Service, self._webdriver_path)
+		self._add_base_timeouts_capability(webdriver_options)
+		
+		self.driver = webdriver.Edge(
+				options=webdriver_options,
+				service=webdriver_service,
+				keep_alive=self._keep_alive
+		)
 		
-		self.driver = webdriver.Edge(options=webdriver_options, service=webdriver_service)
+		if self._pool_maxsize is not None:
+			set_connection_pool_size(self.driver.command_executor, self._pool_maxsize, min_size=1)
+		else:
+			set_connection_pool_size(self.driver.command_executor, self.trio_capacity_limiter.total_tokens)
 		
+		self._apply_base_timeouts()
 		self.set_window_rect(self._window_rect)
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote Edge WebDriver session.
 
@@ -251,21 +251,22 @@ class EdgeWebDriver(BrowserWebDriver):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 
 		:Usage:
 			command_executor, session_id = driver.get_vars_for_remote()
+			capabilities = driver.get_remote_capabilities()
 			new_driver = EdgeWebDriver(webdriver_path="path/to/msedgedriver")
-			new_driver.remote_connect_driver(command_executor, session_id)
+			new_driver.remote_connect_driver(command_executor, session_id, capabilities)
 			# Now new_driver controls the same browser session as driver
 		"""
 		
-		self.driver = webdriver.Remote(
-				command_executor=command_executor,
-				options=self._webdriver_options_manager._options
+		self.driver = AttachedRemote(
+				command_executor=get_remote_connection(command_executor, keep_alive=self._keep_alive),
+				session_id=session_id,
+				options=self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options),
+				capabilities=capabilities
 		)
-		self.driver.session_id = session_id
 		
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
+		self._apply_attached_session_timeouts()
@@ -0,0 +1,171 @@
+import os
+import trio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable
+from osn_bas.webdrivers.Edge import EdgeWebDriver
+
+
+class EdgePool:
+	"""
+	Keeps a pool of started Edge browsers and hands them out to Trio tasks.
+
+	Starting Edge and MSEdgeDriver takes seconds, so a task that needs a browser for a short job
+	borrows an already started `EdgeWebDriver` instead of creating its own. Idle browsers are kept in a deque,
+	the number of borrowed browsers is bounded by a capacity limiter, and a browser is closed instead of being
+	returned after `max_uses` borrows or after the borrowing task raised an exception.
+
+	Attributes:
+		_factory (Callable[[], EdgeWebDriver]): Creates a new, not yet started, EdgeWebDriver.
+		_max_uses (int): Number of borrows after which a browser is closed instead of being reused.
+		_idle (deque[tuple[EdgeWebDriver, int]]): Started browsers waiting to be borrowed, with their use counts.
+		_lock (trio.Lock): Guards `_idle`.
+		_capacity_limiter (trio.CapacityLimiter): Limits the number of browsers borrowed at the same time.
+	"""
+	
+	def __init__(
+			self,
+			size: int,
+			factory: Callable[[], EdgeWebDriver],
+			max_uses: int = 50
+	):
+		"""
+		Initializes EdgePool.
+
+		Args:
+			size (int): Maximum number of browsers borrowed at the same time.
+			factory (Callable[[], EdgeWebDriver]): Creates a new, not yet started, EdgeWebDriver.
+				Every created browser must use its own debugging port and profile directory.
+			max_uses (int): Number of borrows after which a browser is closed instead of being reused. Defaults to 50.
+		"""
+		
+		self._factory = factory
+		self._max_uses = max_uses
+		self._idle: deque[tuple[EdgeWebDriver, int]] = deque()
+		self._lock = trio.Lock()
+		self._capacity_limiter = trio.CapacityLimiter(size)
+	
+	def _start_webdriver(self) -> EdgeWebDriver:
+		"""
+		Creates and starts a new browser with the pool factory.
+
+		Returns:
+			EdgeWebDriver: The started browser.
+		"""
+		
+		webdriver = self._factory()
+		webdriver.start_webdriver()
+		
+		return webdriver
+	
+	async def _warmup_one(self, limiter: trio.CapacityLimiter):
+		"""
+		Starts one browser and puts it into the pool.
+
+		Args:
+			limiter (trio.CapacityLimiter): Limits the number of browsers started at the same time.
+		"""
+		
+		webdriver = await trio.to_thread.run_sync(self._start_webdriver, limiter=limiter)
+		
+		async with self._lock:
+			self._idle.append((webdriver, 0))
+	
+	async def warmup(self, count: int):
+		"""
+		Starts browsers in advance and puts them into the pool.
+
+		The browsers are started concurrently, at most one per CPU core at a time,
+		so warming up takes about as long as starting a few browsers instead of `count` of them.
+
+		Args:
+			count (int): Number of browsers to start.
+		"""
+		
+		limiter = trio.CapacityLimiter(max(1, min(count, os.cpu_count() or 1)))
+		
+		async with trio.open_nursery() as nursery:
+			for _ in range(count):
+				nursery.start_soon(self._warmup_one, limiter)
+	
+	async def _release(self, webdriver: EdgeWebDriver, uses: int, reuse: bool):
+		"""
+		Returns a borrowed browser to the pool or closes it.
+
+		If `reuse` is True, the session is cleaned with `reuse_webdriver` and the browser is put back to the idle deque;
+		if cleaning fails, the browser is closed instead. Errors of cleaning and closing are logged and never raised,
+		so they don't replace an exception raised by the borrowing block.
+
+		Args:
+			webdriver (EdgeWebDriver): The borrowed browser.
+			uses (int): Number of borrows of the browser, including the finished one.
+			reuse (bool): Whether to try returning the browser to the pool.
+		"""
+		
+		if reuse:
+			try:
+				await trio.to_thread.run_sync(webdriver.reuse_webdriver)
+			except Exception as error:
+				logging.log(logging.ERROR, error)
+			else:
+				async with self._lock:
+					self._idle.append((webdriver, uses))
+		
+				return
+		
+		try:
+			await trio.to_thread.run_sync(webdriver.close_webdriver)
+		except Exception as error:
+			logging.log(logging.ERROR, error)
+	
+	@asynccontextmanager
+	async def acquire(self) -> AsyncGenerator[EdgeWebDriver, None]:
+		"""
+		Borrows a started browser from the pool.
+
+		An idle browser is reused if there is one, otherwise a new one is started. When the block exits,
+		the browser session is cleaned with `reuse_webdriver` and the browser is returned to the pool, unless the block raised an exception
+		or the browser reached `max_uses`, in which case it is closed.
+		The cleanup is shielded from cancellation, so a cancelled block still closes or returns its browser,
+		and cleanup errors are logged instead of replacing the exception of the block.
+
+		Returns:
+			AsyncGenerator[EdgeWebDriver, None]: Context manager yielding the borrowed browser.
+
+		:Usage:
+			pool = EdgePool(size=4, factory=lambda: EdgeWebDriver(webdriver_path="path/to/msedgedriver", enable_devtools=False))
+
+			async with pool.acquire() as webdriver:
+				await webdriver.to_wrapper().search_url("https://www.example.com")
+		"""
+		
+		async with self._capacity_limiter:
+			async with self._lock:
+				webdriver, uses = self._idle.popleft() if self._idle else (None, 0)
+		
+			if webdriver is None:
+				webdriver = await trio.to_thread.run_sync(self._start_webdriver)
+		
+			succeeded = False
+		
+			try:
+				yield webdriver
+				succeeded = True
+			finally:
+				with trio.CancelScope(shield=True):
+					await self._release(webdriver, uses + 1, reuse=succeeded and uses + 1 < self._max_uses)
+	
+	async def close(self):
+		"""
+		Closes all idle browsers of the pool.
+
+		Borrowed browsers are closed or returned when their `acquire` blocks exit.
+		"""
+		
+		async with self._lock:
+			idle = list(self._idle)
+			self._idle.clear()
+		
+		for webdriver, _ in idle:
+			await trio.to_thread.run_sync(webdriver.close_webdriver)
@@ -1,6 +1,7 @@
 import pathlib
 from selenium import webdriver
-from typing import Optional, Union
+from typing import Any, Optional, Union
+from types import MappingProxyType
 from osn_bas.types import WindowRect
 from osn_bas.webdrivers.types import WebdriverOption
 from selenium.webdriver.firefox.options import Options
@@ -8,6 +9,10 @@ from selenium.webdriver.firefox.service import Service
 from osn_bas.browsers_handler import get_path_to_browser
 from osn_bas.webdrivers.BaseDriver.webdriver import BrowserWebDriver
 from osn_bas.webdrivers.BaseDriver.start_args import BrowserStartArgs
+from osn_bas.webdrivers.BaseDriver.remote import (
+	AttachedRemote,
+	get_remote_connection
+)
 from selenium.webdriver.remote.remote_connection import RemoteConnection
 from osn_bas.webdrivers.BaseDriver.options import (
 	BrowserOptionsManager
@@ -27,8 +32,19 @@ class FirefoxOptionsManager(BrowserOptionsManager):
 		_user_agent_command (WebdriverOption): Configuration for user agent option.
 		_proxy_command (WebdriverOption): Configuration for proxy option.
 		_enable_bidi_command (WebdriverOption): Configuration for enable BiDi option.
+		_COMMANDS (MappingProxyType[str, WebdriverOption]): Read-only table of the debugging port, user agent, proxy
+			and enable BiDi option configurations, shared by all instances.
 	"""
 	
+	_COMMANDS = MappingProxyType(
+			{
+				"debugger_address_": WebdriverOption(name="debugger_address_", command="--port={value}", type="normal"),
+				"user_agent_": WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
+				"proxy_": WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
+				"enable_bidi_": WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
+			}
+	)
+	
 	def __init__(self):
 		"""
 		Initializes FirefoxOptionsManager.
@@ -37,12 +53,7 @@ class FirefoxOptionsManager(BrowserOptionsManager):
 		debugging port, user agent, proxy, and BiDi protocol.
 		"""
 		
-		super().__init__(
-				WebdriverOption(name="debugger_address_", command="--port={value}", type="normal"),
-				WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
-				WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
-				WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
-		)
+		super().__init__(*self._COMMANDS.values())
 	
 	def hide_automation(self, hide: bool):
 		"""
@@ -103,12 +114,14 @@ class FirefoxStartArgs(BrowserStartArgs):
 		start_page_url (str): Default start page URL.
 		debugging_port (Optional[int]): Current debugging port number.
 		profile_dir (Optional[str]): Current profile directory path.
-		headless_mode (Optional[bool]): Current headless mode status.
-		mute_audio (Optional[bool]): Current mute audio status.
+		headless_mode (bool): Current headless mode status.
+		mute_audio (bool): Current mute audio status.
 		user_agent (Optional[str]): Current user agent string.
 		proxy_server (Optional[str]): Current proxy server address.
 	"""
 	
+	__slots__ = ()
+	
 	def __init__(self, browser_exe: Union[str, pathlib.Path]):
 		"""
 		 Initializes FirefoxStartArgs.
@@ -142,7 +155,7 @@ class FirefoxWebDriver(BrowserWebDriver):
 		_browser_exe (Union[str, pathlib.Path]): Path to the browser executable or just the executable name.
 		_webdriver_path (str): Path to the WebDriver executable.
 		_window_rect (WindowRect): Object to store window rectangle settings, controlling window position and size.
-		_js_scripts (dict[str, str]): Collection of JavaScript scripts for browser interaction.
+		_js_scripts (JS_Scripts): Collection of JavaScript scripts for browser interaction.
 		_webdriver_start_args (FirefoxStartArgs): Manages browser-specific start arguments passed to the WebDriver.
 		_webdriver_options_manager (FirefoxOptionsManager): Manages browser options, such as headless mode, extensions, etc.
 		driver (Optional[webdriver.Firefox]): The Firefox WebDriver instance.
@@ -152,6 +165,8 @@ class FirefoxWebDriver(BrowserWebDriver):
 		dev_tools (DevTools): Instance of DevTools to manage DevTools functionalities.
 	"""
 	
+	__slots__ = ()
+	
 	def __init__(
 			self,
 			webdriver_path: str,
@@ -223,9 +238,10 @@ class FirefoxWebDriver(BrowserWebDriver):
 
 		This method initializes and sets up the Selenium Firefox WebDriver with configured options and service.
 		It also sets the window position, size, implicit wait time, and page load timeout.
+		The driver gets a copy of the options, so later option changes don't leak into a running session.
 		"""
 		
-		webdriver_options = self._webdriver_options_manager._options
+		webdriver_options = self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options)
 		webdriver_service = Service(executable_path=self._webdriver_path)
 		
 		self.driver = webdriver.Firefox(options=webdriver_options, service=webdriver_service)
@@ -236,7 +252,12 @@ class FirefoxWebDriver(BrowserWebDriver):
 				implicit_wait_timeout=self._base_implicitly_wait
 		)
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote Firefox WebDriver session.
 
@@ -246,21 +267,22 @@ class FirefoxWebDriver(BrowserWebDriver):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 
 		:Usage:
 		  command_executor, session_id = driver.get_vars_for_remote()
+		  capabilities = driver.get_remote_capabilities()
 		  new_driver = FirefoxWebDriver(webdriver_path="path/to/geckodriver")
-		  new_driver.remote_connect_driver(command_executor, session_id)
+		  new_driver.remote_connect_driver(command_executor, session_id, capabilities)
 		  # Now new_driver controls the same browser session as driver
 		"""
 		
-		self.driver = webdriver.Remote(
-				command_executor=command_executor,
-				options=self._webdriver_options_manager._options
+		self.driver = AttachedRemote(
+				command_executor=get_remote_connection(command_executor),
+				session_id=session_id,
+				options=self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options),
+				capabilities=capabilities
 		)
-		self.driver.session_id = session_id
 		
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
+		self._apply_attached_session_timeouts()
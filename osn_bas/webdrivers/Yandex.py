@@ -1,137 +1,68 @@
 import pathlib
 from selenium import webdriver
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from osn_bas.types import WindowRect
-from osn_bas.webdrivers.types import WebdriverOption
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from osn_bas.browsers_handler import get_path_to_browser
 from osn_bas.webdrivers.BaseDriver.webdriver import BrowserWebDriver
-from osn_bas.webdrivers.BaseDriver.start_args import BrowserStartArgs
+from osn_bas.webdrivers.BaseDriver.service import get_shared_service
+from osn_bas.webdrivers.BaseDriver.remote import (
+	AttachedRemote,
+	get_remote_connection,
+	set_connection_pool_size
+)
 from selenium.webdriver.remote.remote_connection import RemoteConnection
-from osn_bas.webdrivers.BaseDriver.options import (
-	BrowserOptionsManager
+from osn_bas.webdrivers.Chromium import (
+	ChromiumOptionsManager,
+	ChromiumStartArgs
 )
 
 
-class YandexOptionsManager(BrowserOptionsManager):
+class YandexOptionsManager(ChromiumOptionsManager):
 	"""
-	Manages Yandex Browser-specific options for Selenium WebDriver.
+	Manages Yandex Browser-specific browser options for Selenium WebDriver.
 
-	This class extends BrowserOptionsManager to provide specific configurations
-	for Yandex Browser options, such as experimental options and arguments.
+	This class specializes ChromiumOptionsManager for Yandex Browser. Yandex Browser shares all its options
+	with other Chromium-based browsers, so only the Selenium options class differs.
 
 	Attributes:
-		_options (webdriver.ChromeOptions): Yandex Browser options object, which is based on ChromeOptions.
-		_debugging_port_command (WebdriverOption): Configuration for debugging port option.
-		_user_agent_command (WebdriverOption): Configuration for user agent option.
-		_proxy_command (WebdriverOption): Configuration for proxy option.
-		_enable_bidi_command (WebdriverOption): Configuration for enable BiDi option.
+		_options (webdriver.ChromeOptions): Yandex Browser options object.
+		_debugging_port_command (WebdriverOption): Configuration for the debugging port option.
+		_user_agent_command (WebdriverOption): Configuration for the user agent option.
+		_proxy_command (WebdriverOption): Configuration for the proxy option.
+		_enable_bidi_command (WebdriverOption): Configuration for the enable BiDi option.
+		options_class (type[Options]): Selenium Yandex Browser options class.
 	"""
 	
-	def __init__(self):
-		"""
-		Initializes YandexOptionsManager.
-
-		Sets up the Yandex Browser options manager with specific option configurations for
-		debugging port, user agent, proxy, and BiDi protocol.
-		"""
-		
-		super().__init__(
-				WebdriverOption(
-						name="debugger_address_",
-						command="debuggerAddress",
-						type="experimental"
-				),
-				WebdriverOption(name="user_agent_", command="--user-agent=\"{value}\"", type="normal"),
-				WebdriverOption(name="proxy_", command="--proxy-server=\"{value}\"", type="normal"),
-				WebdriverOption(name="enable_bidi_", command="enable_bidi", type="attribute"),
-		)
-	
-	def hide_automation(self, hide: bool):
-		"""
-		Adds arguments to hide automation features in Yandex Browser.
+	options_class = Options
 
-		This method adds Yandex Browser-specific arguments to disable automation detection, making the browser appear more like a regular user.
 
-		Args:
-			hide (bool): If True, adds arguments to hide automation; otherwise, removes them.
-		"""
-		
-		if hide:
-			self.set_argument(
-					"disable_blink_features_",
-					"--disable-blink-features=AutomationControlled"
-			)
-			self.set_argument("no_first_run_", "--no-first-run")
-			self.set_argument("no_service_autorun_", "--no-service-autorun")
-			self.set_argument("password_store_", "--password-store=basic")
-		else:
-			self.remove_argument("disable_blink_features_")
-			self.remove_argument("no_first_run_")
-			self.remove_argument("no_service_autorun_")
-			self.remove_argument("password_store_")
-	
-	def renew_webdriver_options(self) -> Options:
-		"""
-		Creates and returns a new Options object.
-
-		Returns a fresh instance of `webdriver.ChromeOptions`, as Yandex Browser is based on Chromium,
-		allowing for a clean state of browser options to be configured.
-
-		Returns:
-			Options: A new Selenium Yandex Browser options object, based on ChromeOptions.
-		"""
-		
-		return Options()
-
-
-class YandexStartArgs(BrowserStartArgs):
+class YandexStartArgs(ChromiumStartArgs):
 	"""
 	Manages Yandex Browser-specific browser start arguments for Selenium WebDriver.
 
-	This class extends BrowserStartArgs and is tailored for Yandex Browser. It defines
-	command-line arguments specific to starting the Yandex Browser with configurations
-	suitable for WebDriver control, such as remote debugging port, user profile directory,
-	headless mode, and proxy settings.
+	Yandex Browser accepts the same command-line arguments as other Chromium-based browsers,
+	so this class only names them for Yandex Browser.
 
 	Attributes:
 		_browser_exe (Union[str, pathlib.Path]): Path to the Yandex Browser executable.
-		_debugging_port_command_line (str): Command line argument for debugging port.
-		_profile_dir_command_line (str): Command line argument for profile directory.
-		_headless_mode_command_line (str): Command line argument for headless mode.
-		_mute_audio_command_line (str): Command line argument for mute audio.
-		_user_agent_command_line (str): Command line argument for user agent.
-		_proxy_server_command_line (str): Command line argument for proxy server.
-		start_page_url (str): Default start page URL, set to Yandex homepage.
+		_debugging_port_command_line (str): Command-line format for debugging port.
+		_profile_dir_command_line (str): Command-line format for profile directory.
+		_headless_mode_command_line (str): Command-line argument for headless mode.
+		_mute_audio_command_line (str): Command-line argument for mute audio.
+		_user_agent_command_line (str): Command-line format for user agent.
+		_proxy_server_command_line (str): Command-line format for proxy server.
+		start_page_url (str): Default start page URL.
 		debugging_port (Optional[int]): Current debugging port number.
 		profile_dir (Optional[str]): Current profile directory path.
-		headless_mode (Optional[bool]): Current headless mode status.
-		mute_audio (Optional[bool]): Current mute audio status.
+		headless_mode (bool): Current headless mode status.
+		mute_audio (bool): Current mute audio status.
 		user_agent (Optional[str]): Current user agent string.
 		proxy_server (Optional[str]): Current proxy server address.
 	"""
 	
-	def __init__(self, browser_exe: Union[str, pathlib.Path]):
-		"""
-		 Initializes YandexStartArgs.
-
-		Configures command-line arguments for starting the Yandex Browser, including
-		settings for remote debugging, user data directory, headless mode, and more.
-
-		 Args:
-		 	browser_exe (Union[str, pathlib.Path]): The path to the Yandex executable.
-		"""
-		
-		super().__init__(
-				browser_exe,
-				"--remote-debugging-port={value}",
-				"--user-data-dir=\"{value}\"",
-				"--headless",
-				"--mute-audio",
-				"--user-agent=\"{value}\"",
-				"--proxy-server=\"{value}\"",
-		)
+	__slots__ = ()
 
 
 class YandexWebDriver(BrowserWebDriver):
@@ -145,7 +76,7 @@ class YandexWebDriver(BrowserWebDriver):
 
 	Attributes:
 		_window_rect (WindowRect): Initial window rectangle settings.
-		_js_scripts (dict[str, str]): Collection of JavaScript scripts for browser interaction.
+		_js_scripts (JS_Scripts): Collection of JavaScript scripts for browser interaction.
 		_browser_exe (Union[str, pathlib.Path]): Path to the Yandex Browser executable.
 		_webdriver_path (str): Path to the ChromeDriver executable (Yandex Browser compatible).
 		_webdriver_start_args (YandexStartArgs): Manages Yandex Browser startup arguments.
@@ -155,8 +86,12 @@ class YandexWebDriver(BrowserWebDriver):
 		_base_page_load_timeout (int): Base page load timeout for page loading operations.
 		_is_active (bool): Indicates if the WebDriver instance is currently active.
 		dev_tools (DevTools): Instance of DevTools for interacting with browser developer tools.
+		_pool_maxsize (Optional[int]): Size of the HTTP connection pool of the driver, or None to size it to the Trio capacity limiter.
+		_keep_alive (bool): Whether the driver keeps its HTTP connections alive.
 	"""
 	
+	__slots__ = ("_pool_maxsize", "_keep_alive")
+	
 	def __init__(
 			self,
 			webdriver_path: str,
@@ -172,6 +107,8 @@ class YandexWebDriver(BrowserWebDriver):
 			implicitly_wait: int = 5,
 			page_load_timeout: int = 5,
 			window_rect: Optional[WindowRect] = None,
+			pool_maxsize: Optional[int] = None,
+			keep_alive: bool = True,
 			start_page_url: str = "https://www.yandex.com",
 	):
 		"""
@@ -197,12 +134,18 @@ class YandexWebDriver(BrowserWebDriver):
 			implicitly_wait (int): Base implicit wait time for WebDriver element searches in seconds. Defaults to 5.
 			page_load_timeout (int): Base page load timeout for WebDriver operations in seconds. Defaults to 5.
 			window_rect (Optional[WindowRect]): Initial window rectangle settings for the browser window. Defaults to None.
+			pool_maxsize (Optional[int]): Size of the HTTP connection pool used for WebDriver commands.
+				If None, it is sized to the Trio capacity limiter (at least 20 connections). Defaults to None.
+			keep_alive (bool): Whether to keep HTTP connections to the WebDriver server alive between commands. Defaults to True.
 			start_page_url (str): URL to open when the browser starts. Defaults to "https://www.yandex.com".
 		"""
 		
 		if browser_exe is None:
 			browser_exe = get_path_to_browser("Yandex")
 		
+		self._pool_maxsize = pool_maxsize
+		self._keep_alive = keep_alive
+		
 		super().__init__(
 				browser_exe=browser_exe,
 				webdriver_path=webdriver_path,
@@ -227,21 +170,36 @@ class YandexWebDriver(BrowserWebDriver):
 		Creates the Yandex webdriver instance.
 
 		This method initializes and sets up the Selenium Yandex WebDriver using ChromeDriver with configured options and service.
-		It also sets the window position, size, implicit wait time, and page load timeout.
+		The HTTP connection pool of the driver is sized to `pool_maxsize` or the Trio capacity limiter.
+		All drivers with the same `webdriver_path` share one chromedriver process instead of starting their own.
+		The base timeouts are sent as a capability of the New Session command, so only the window rectangle
+		needs a separate command.
 		"""
 		
-		webdriver_options = self._webdriver_options_manager._options
-		webdriver_service = Service(executable_path=self._webdriver_path)
+		webdriver_options = self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options)
+		webdriver_service = get_shared_service(Service, self._webdriver_path)
+		self._add_base_timeouts_capability(webdriver_options)
 		
-		self.driver = webdriver.Chrome(options=webdriver_options, service=webdriver_service)
+		self.driver = webdriver.Chrome(
+				options=webdriver_options,
+				service=webdriver_service,
+				keep_alive=self._keep_alive
+		)
+		
+		if self._pool_maxsize is not None:
+			set_connection_pool_size(self.driver.command_executor, self._pool_maxsize, min_size=1)
+		else:
+			set_connection_pool_size(self.driver.command_executor, self.trio_capacity_limiter.total_tokens)
 		
+		self._apply_base_timeouts()
 		self.set_window_rect(self._window_rect)
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
 	
-	def remote_connect_driver(self, command_executor: Union[str, RemoteConnection], session_id: str):
+	def remote_connect_driver(
+			self,
+			command_executor: Union[str, RemoteConnection],
+			session_id: str,
+			capabilities: Optional[dict[str, Any]] = None
+	):
 		"""
 		Connects to an existing remote Yandex WebDriver session.
 
@@ -251,21 +209,22 @@ class YandexWebDriver(BrowserWebDriver):
 		Args:
 			command_executor (Union[str, RemoteConnection]): The URL of the remote WebDriver server or a `RemoteConnection` object.
 			session_id (str): The ID of the existing WebDriver session to connect to.
+			capabilities (Optional[dict[str, Any]]): The capabilities returned by the server for the session, as provided by `get_remote_capabilities`.
+				They are needed for BiDi and DevTools connections to the session. If None, the requested capabilities of the options are used. Defaults to None.
 
 		:Usage:
 		  command_executor, session_id = driver.get_vars_for_remote()
+		  capabilities = driver.get_remote_capabilities()
 		  new_driver = YandexWebDriver(webdriver_path="path/to/chromedriver")
-		  new_driver.remote_connect_driver(command_executor, session_id)
+		  new_driver.remote_connect_driver(command_executor, session_id, capabilities)
 		  # Now new_driver controls the same browser session as driver
 		"""
 		
-		self.driver = webdriver.Remote(
-				command_executor=command_executor,
-				options=self._webdriver_options_manager._options
+		self.driver = AttachedRemote(
+				command_executor=get_remote_connection(command_executor, keep_alive=self._keep_alive),
+				session_id=session_id,
+				options=self._webdriver_options_manager.copy_webdriver_options(self._webdriver_options_manager._options),
+				capabilities=capabilities
 		)
-		self.driver.session_id = session_id
 		
-		self.set_driver_timeouts(
-				page_load_timeout=self._base_page_load_timeout,
-				implicit_wait_timeout=self._base_implicitly_wait
-		)
+		self._apply_attached_session_timeouts()
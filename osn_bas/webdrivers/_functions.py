@@ -1,12 +1,16 @@
+import os
 import re
 import sys
+import json
 import math
 import pathlib
 from copy import deepcopy
+from functools import lru_cache
 from random import randint
 from subprocess import PIPE, Popen
 from typing import Optional, Union
 from pandas import DataFrame, Series
+from selenium.webdriver.common.selenium_manager import SeleniumManager
 from osn_bas.errors import (
 	PlatformNotSupportedError
 )
@@ -128,16 +132,18 @@ def scroll_to_parts(start_position: ActionPoint, end_position: ActionPoint) -> l
 	return parts
 
 
+@lru_cache(maxsize=1)
 def read_js_scripts() -> JS_Scripts:
 	"""
-	Reads JavaScript scripts from files and returns them in a _JS_Scripts object.
+	Reads JavaScript scripts from files and returns them in a JS_Scripts object.
 
 	This function locates all `.js` files within the 'js_scripts' directory, which is expected to be located two levels above the current file's directory.
-	It reads the content of each JavaScript file, using UTF-8 encoding, and stores these scripts in a dictionary-like `_JS_Scripts` object.
-	The filenames (without the `.js` extension) are used as keys in the `_JS_Scripts` object to access the script content.
+	It reads the content of each JavaScript file, using UTF-8 encoding, and stores these scripts in an immutable `JS_Scripts` named tuple.
+	The filenames (without the `.js` extension) are used as field names in the `JS_Scripts` object to access the script content.
+	The files are read once per process, and every caller shares the same `JS_Scripts` object.
 
 	Returns:
-		JS_Scripts: An object of type _JS_Scripts, containing the content of each JavaScript file as attributes.
+		JS_Scripts: An object of type JS_Scripts, containing the content of each JavaScript file as attributes.
 	"""
 	
 	scripts = {}
@@ -147,15 +153,19 @@ def read_js_scripts() -> JS_Scripts:
 	
 	return JS_Scripts(
 			check_element_in_viewport=scripts["check_element_in_viewport"],
+			find_elements_in_viewport=scripts["find_elements_in_viewport"],
 			get_document_scroll_size=scripts["get_document_scroll_size"],
+			get_dom_fingerprint=scripts["get_dom_fingerprint"],
 			get_element_css=scripts["get_element_css"],
 			get_element_rect_in_viewport=scripts["get_element_rect_in_viewport"],
+			get_element_rects_in_viewport=scripts["get_element_rects_in_viewport"],
 			get_random_element_point_in_viewport=scripts["get_random_element_point_in_viewport"],
 			get_viewport_position=scripts["get_viewport_position"],
 			get_viewport_rect=scripts["get_viewport_rect"],
 			get_viewport_size=scripts["get_viewport_size"],
 			open_new_tab=scripts["open_new_tab"],
 			stop_window_loading=scripts["stop_window_loading"],
+			wait_for_element=scripts["wait_for_element"],
 	)
 
 
@@ -282,6 +292,57 @@ def move_to_parts(start_position: ActionPoint, end_position: ActionPoint) -> lis
 	return parts
 
 
+def smooth_move_to_parts(start_position: ActionPoint, end_position: ActionPoint) -> list[MovePart]:
+	"""
+	Calculates a sequence of eased move steps between two points.
+
+	The points are placed on the straight line between the start and end positions using
+	the smootherstep easing `t^3 * (t * (6t - 15) + 10)`, so the cursor accelerates at the
+	start and decelerates at the end. The number of steps is one per 30 pixels of distance,
+	clamped to the [3, 40] range. Offsets are calculated from the rounded previous point,
+	so they always sum up exactly to the total displacement.
+
+	Args:
+		start_position (ActionPoint): The starting coordinates for the movement.
+		end_position (ActionPoint): The target coordinates for the movement.
+
+	Returns:
+		list[MovePart]: A list of `MovePart` objects representing the sequence of mouse movements.
+			Each `MovePart` indicates the `point` to move to and the `offset` from the previous point.
+			The `duration` of every part is 0, as the duration is defined by the ActionChains performing the moves.
+	"""
+	
+	distance = math.hypot(end_position.x - start_position.x, end_position.y - start_position.y)
+	steps_count = min(max(int(distance / 30), 3), 40)
+	
+	parts = []
+	previous_position = ActionPoint(x=start_position.x, y=start_position.y)
+	
+	for index in range(1, steps_count + 1):
+		t = index / steps_count
+		progress = t ** 3 * (t * (t * 6 - 15) + 10)
+	
+		new_position = ActionPoint(
+				x=round(start_position.x + (end_position.x - start_position.x) * progress),
+				y=round(start_position.y + (end_position.y - start_position.y) * progress)
+		)
+	
+		parts.append(
+				MovePart(
+						point=new_position,
+						offset=MoveOffset(
+								x=new_position.x - previous_position.x,
+								y=new_position.y - previous_position.y
+						),
+						duration=0
+				)
+		)
+	
+		previous_position = new_position
+	
+	return parts
+
+
 def get_found_profile_dir(data: Series, profile_dir_command: str) -> Optional[str]:
 	"""
 	Extracts the browser profile directory path from a process's command line arguments.
@@ -414,3 +475,67 @@ def build_first_start_argument(browser_exe: Union[str, pathlib.Path]) -> str:
 		return f"\"{str(browser_exe.resolve())}\""
 	else:
 		raise TypeError(f"browser_exe must be str or pathlib.Path, not {type(browser_exe)}.")
+
+
+def get_webdriver_cache_dir() -> pathlib.Path:
+	"""
+	Returns the directory where osn_bas keeps its per-user cache.
+
+	Uses `%LOCALAPPDATA%` on Windows and `$XDG_CACHE_HOME` (or `~/.cache`) elsewhere.
+
+	Returns:
+		pathlib.Path: The cache directory. It may not exist yet.
+	"""
+	
+	if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+		base_dir = pathlib.Path(os.environ["LOCALAPPDATA"])
+	else:
+		base_dir = pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache")
+	
+	return base_dir / "osn_bas"
+
+
+def resolve_webdriver_path(
+		selenium_browser_name: str,
+		browser_exe: Union[str, pathlib.Path],
+		browser_version: Optional[str] = None
+) -> str:
+	"""
+	Resolves the path to a WebDriver executable matching the browser, caching it between runs.
+
+	Resolved paths are stored in `webdriver_paths.json` in the osn_bas cache directory, keyed by browser and version
+	(or by the executable modification time if the version is unknown). Selenium Manager, which may query
+	and download drivers over HTTP, is only run when the browser was updated or the cached driver is gone.
+
+	Args:
+		selenium_browser_name (str): The browser name as Selenium Manager expects it (e.g., "MicrosoftEdge", "chrome").
+		browser_exe (Union[str, pathlib.Path]): Path to the browser executable.
+		browser_version (Optional[str]): The installed browser version. Defaults to None.
+
+	Returns:
+		str: The path to the WebDriver executable.
+	"""
+	
+	browser_exe = pathlib.Path(browser_exe)
+	cache_file = get_webdriver_cache_dir() / "webdriver_paths.json"
+	cache_key = f"{selenium_browser_name}-{browser_version or browser_exe.stat().st_mtime_ns}"
+	
+	try:
+		webdriver_paths = json.loads(cache_file.read_text(encoding="utf-8"))
+	except (OSError, ValueError):
+		webdriver_paths = {}
+	
+	webdriver_path = webdriver_paths.get(cache_key)
+	
+	if webdriver_path is not None and pathlib.Path(webdriver_path).is_file():
+		return webdriver_path
+	
+	webdriver_path = SeleniumManager().binary_paths(
+			["--browser", selenium_browser_name, "--browser-path", str(browser_exe)]
+	)["driver_path"]
+	webdriver_paths[cache_key] = webdriver_path
+	
+	cache_file.parent.mkdir(parents=True, exist_ok=True)
+	cache_file.write_text(json.dumps(webdriver_paths), encoding="utf-8")
+	
+	return webdriver_path
@@ -4,7 +4,7 @@ import pathlib
 from subprocess import PIPE, Popen
 from typing import Optional, Union
 from pandas import DataFrame, Series
-from osn_bas.webdrivers.types import JS_Scripts
+from osn_bas.webdrivers._functions import read_js_scripts  # noqa: F401
 from osn_bas.errors import (
 	PlatformNotSupportedError
 )
@@ -13,30 +13,6 @@ from osn_windows_cmd.netstat import (
 )
 
 
-def read_js_scripts() -> JS_Scripts:
-	"""
-	Reads JavaScript scripts from files and returns them in a JS_Scripts object.
-
-	This function locates all `.js` files within the 'js_scripts' directory, which is expected to be located two levels above the current file's directory.
-	It reads the content of each JavaScript file, using UTF-8 encoding, and stores these scripts in a dictionary-like `JS_Scripts` object.
-	The filenames (without the `.js` extension) are used as keys in the `JS_Scripts` object to access the script content.
-
-	Returns:
-		JS_Scripts: An object of type JS_Scripts, containing the content of each JavaScript file as attributes.
-	"""
-	
-	scripts = {}
-	
-	for script_file in (pathlib.Path(__file__).parent / "js_scripts").iterdir():
-		scripts[re.sub(r"\.js$", "", script_file.name)] = open(script_file, "r", encoding="utf-8").read()
-	
-	return JS_Scripts(
-			get_element_css=scripts["get_element_css"],
-			open_new_tab=scripts["open_new_tab"],
-			stop_window_loading=scripts["stop_window_loading"],
-	)
-
-
 def get_found_profile_dir(data: Series, profile_dir_command: str) -> Optional[str]:
 	"""
 	Extracts the browser profile directory path from a process's command line arguments.
@@ -0,0 +1,25 @@
+var root = arguments[0] || document;
+var by = arguments[1];
+var value = arguments[2];
+
+var elements = [];
+
+if (by === "xpath") {
+    var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var node = snapshot.snapshotItem(i);
+        if (node.nodeType === Node.ELEMENT_NODE) {
+            elements.push(node);
+        }
+    }
+} else {
+    elements = Array.prototype.slice.call(root.querySelectorAll(value));
+}
+
+var viewportWidth = window.innerWidth || document.documentElement.clientWidth;
+var viewportHeight = window.innerHeight || document.documentElement.clientHeight;
+
+return elements.filter(function (element) {
+    var rect = element.getBoundingClientRect();
+    return rect.bottom > 0 && rect.right > 0 && rect.top < viewportHeight && rect.left < viewportWidth;
+});
@@ -0,0 +1,26 @@
+var state = window.__osnBasDomState;
+
+if (!state || state.document !== document) {
+    state = {
+        document: document,
+        id: Math.floor(Math.random() * 2147483647),
+        version: 0
+    };
+
+    new MutationObserver(function () {
+        state.version++;
+    }).observe(document, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        characterData: true
+    });
+
+    window.__osnBasDomState = state;
+}
+
+return [
+    state.id,
+    state.version,
+    Math.floor(window.scrollY / 100)
+];
\ No newline at end of file
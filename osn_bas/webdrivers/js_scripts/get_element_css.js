@@ -1,6 +1,7 @@
 var items = {};
 var computedStyle = getComputedStyle(arguments[0]);
-for (var i = 0; i < computedStyle.length; i++) {
-    items[computedStyle[i]] = computedStyle.getPropertyValue(computedStyle[i]);
+var properties = arguments[1] || computedStyle;
+for (var i = 0; i < properties.length; i++) {
+    items[properties[i]] = computedStyle.getPropertyValue(properties[i]);
 }
-return items;
\ No newline at end of file
+return items;
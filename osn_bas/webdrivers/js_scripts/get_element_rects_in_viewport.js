@@ -0,0 +1,12 @@
+var elements = arguments[0];
+
+return elements.map(function (element) {
+    var rect = element.getBoundingClientRect();
+
+    return {
+        x: rect.x,
+        y: rect.y,
+        width: rect.width,
+        height: rect.height
+    };
+});
@@ -1,52 +1,56 @@
+function is_hit(targetElement, viewportX, viewportY) {
+    const hitElement = document.elementFromPoint(viewportX, viewportY);
+
+    return hitElement !== null && (hitElement === targetElement || targetElement.contains(hitElement));
+}
+
+function build_point(rect, viewportX, viewportY) {
+    return {
+        x: viewportX - rect.left,
+        y: viewportY - rect.top,
+        viewportX: viewportX,
+        viewportY: viewportY
+    };
+}
+
 function get_random_point_in_element_shape_grid(targetElement, step) {
     try {
         const rect = targetElement.getBoundingClientRect();
 
-        if (rect.width <= 0 || rect.height <= 0) {
-            return null;
-        }
+        const left = Math.max(0, rect.left);
+        const top = Math.max(0, rect.top);
+        const right = Math.min(window.innerWidth || document.documentElement.clientWidth, rect.right);
+        const bottom = Math.min(window.innerHeight || document.documentElement.clientHeight, rect.bottom);
 
-        const points = [];
-
-        for (let xOffset = 0; xOffset < rect.width; xOffset += step) {
-            for (let yOffset = 0; yOffset < rect.height; yOffset += step) {
-                points.push(
-                    {
-                        viewportX: Math.floor(rect.left + xOffset),
-                        viewportY: Math.floor(rect.top + yOffset),
-                        elementOffsetX: xOffset,
-                        elementOffsetY: yOffset
-                    }
-                );
-            }
+        if (right <= left || bottom <= top) {
+            return null;
         }
 
-        if (points.length === 0) {
-             const centerX = rect.left + rect.width / 2;
-             const centerY = rect.top + rect.height / 2;
+        const columns = Math.max(1, Math.ceil((right - left) / step));
+        const rows = Math.max(1, Math.ceil((bottom - top) / step));
+        const pointsCount = columns * rows;
 
-             const hitElement = document.elementFromPoint(Math.floor(centerX), Math.floor(centerY));
+        const randomAttempts = Math.min(pointsCount, 32);
 
-             if (hitElement && (hitElement === targetElement || targetElement.contains(hitElement))) {
-                  return { x: rect.width / 2, y: rect.height / 2 };
-             }
+        for (let i = 0; i < randomAttempts; i++) {
+            const index = Math.floor(Math.random() * pointsCount);
+            const viewportX = Math.floor(left + (index % columns) * step);
+            const viewportY = Math.floor(top + Math.floor(index / columns) * step);
 
-             return null;
+            if (is_hit(targetElement, viewportX, viewportY)) {
+                return build_point(rect, viewportX, viewportY);
+            }
         }
 
-        for (let i = points.length - 1; i > 0; i--) {
-            const j = Math.floor(Math.random() * (i + 1));
-            [points[i], points[j]] = [points[j], points[i]];
-        }
+        const start = Math.floor(Math.random() * pointsCount);
 
-        for (const point of points) {
-            const hitElement = document.elementFromPoint(point.viewportX, point.viewportY);
+        for (let i = 0; i < pointsCount; i++) {
+            const index = (start + i) % pointsCount;
+            const viewportX = Math.floor(left + (index % columns) * step);
+            const viewportY = Math.floor(top + Math.floor(index / columns) * step);
 
-            if (hitElement && (hitElement === targetElement || targetElement.contains(hitElement))) {
-                return {
-                    x: point.elementOffsetX,
-                    y: point.elementOffsetY
-                };
+            if (is_hit(targetElement, viewportX, viewportY)) {
+                return build_point(rect, viewportX, viewportY);
             }
         }
 
@@ -56,4 +60,4 @@ function get_random_point_in_element_shape_grid(targetElement, step) {
     }
 }
 
-return get_random_point_in_element_shape_grid(arguments[0], arguments[1]);
\ No newline at end of file
+return get_random_point_in_element_shape_grid(arguments[0], arguments[1]);
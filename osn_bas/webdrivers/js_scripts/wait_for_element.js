@@ -0,0 +1,34 @@
+var by = arguments[0];
+var value = arguments[1];
+var timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+
+function find() {
+    if (by === "xpath") {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(value);
+}
+
+var element = find();
+
+if (element) {
+    done(element);
+    return;
+}
+
+var observer = new MutationObserver(function () {
+    var found = find();
+    if (found) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(found);
+    }
+});
+
+var timer = setTimeout(function () {
+    observer.disconnect();
+    done(null);
+}, timeout);
+
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
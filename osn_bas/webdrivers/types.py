@@ -1,4 +1,4 @@
-from typing import Literal, TypedDict
+from typing import Literal, NamedTuple
 
 
 class _MoveStep:
@@ -38,11 +38,11 @@ class _MoveStep:
 		return f"MoveStep(amplitude_x={self.amplitude_x}, amplitude_y={self.amplitude_y})"
 
 
-class WebdriverOption(TypedDict):
+class WebdriverOption(NamedTuple):
 	"""
 	Type definition for WebDriver option configuration.
 
-	This TypedDict defines the structure for configuring WebDriver options,
+	This NamedTuple defines the structure for configuring WebDriver options,
 	allowing to specify the name, command, and type of option to be set for a browser instance.
 
 	Attributes:
@@ -299,34 +299,42 @@ class MovePart:
 		return f"MovePart(point={self.point}, offset={self.offset}, duration={self.duration})"
 
 
-class JS_Scripts(TypedDict):
+class JS_Scripts(NamedTuple):
 	"""
 	Type definition for a collection of JavaScript script snippets.
 
-	This TypedDict defines the structure for storing a collection of JavaScript snippets as strings.
+	This NamedTuple defines the structure for storing a collection of JavaScript snippets as strings.
 	It is used to organize and access various JavaScript functionalities intended to be executed
 	within a browser context, typically via Selenium WebDriver's `execute_script` method.
 
 	Attributes:
 		check_element_in_viewport (str): JavaScript code to check if an element is fully within the current browser viewport. Expects the element as arguments[0].
+		find_elements_in_viewport (str): JavaScript code to find elements by a CSS selector or XPath and keep only those intersecting the viewport. Expects the search root (or null for the document) as arguments[0], the locator strategy as arguments[1] and the locator value as arguments[2].
 		get_document_scroll_size (str): JavaScript code to retrieve the total scrollable width and height of the document.
-		get_element_css (str): JavaScript code to retrieve all computed CSS style properties of a DOM element. Expects the element as arguments[0].
+		get_dom_fingerprint (str): JavaScript code to get a DOM state fingerprint: the random ID of a `MutationObserver` installed once per document, the number of DOM mutations it has counted and the vertical scroll offset bucketed by 100 pixels.
+		get_element_css (str): JavaScript code to retrieve computed CSS style properties of a DOM element. Expects the element as arguments[0] and an optional list of property names as arguments[1] (all properties if null).
 		get_element_rect_in_viewport (str): JavaScript code to get the bounding rectangle (position and dimensions) of an element relative to the viewport. Expects the element as arguments[0].
-		get_random_element_point_in_viewport (str): JavaScript code to calculate a random point (x, y coordinates) within the visible portion of a given element in the viewport. Expects the element as arguments[0].
+		get_element_rects_in_viewport (str): JavaScript code to get the bounding rectangles of several elements relative to the viewport. Expects the list of elements as arguments[0].
+		get_random_element_point_in_viewport (str): JavaScript code to calculate a random point within the visible portion of a given element in the viewport. Expects the element as arguments[0] and the grid step as arguments[1]. Returns the point relative to the element ('x', 'y') and to the viewport ('viewportX', 'viewportY'), or null if no visible point is found.
 		get_viewport_position (str): JavaScript code to get the current scroll position (X and Y offsets) of the viewport.
 		get_viewport_rect (str): JavaScript code to get the viewport's position (scroll offsets) and dimensions (width, height).
 		get_viewport_size (str): JavaScript code to get the current dimensions (width and height) of the viewport.
 		stop_window_loading (str): JavaScript code to stop the current window's page loading process (`window.stop()`).
 		open_new_tab (str): JavaScript code to open a new browser tab/window using `window.open()`. Expects an optional URL as arguments[0].
+		wait_for_element (str): Asynchronous JavaScript code that waits for an element matching a CSS selector or XPath with a `MutationObserver`. Expects the locator strategy as arguments[0], the locator value as arguments[1] and the timeout in milliseconds as arguments[2]. Resolves with the element, or null on timeout.
 	"""
 	
 	check_element_in_viewport: str
+	find_elements_in_viewport: str
 	get_document_scroll_size: str
+	get_dom_fingerprint: str
 	get_element_css: str
 	get_element_rect_in_viewport: str
+	get_element_rects_in_viewport: str
 	get_random_element_point_in_viewport: str
 	get_viewport_position: str
 	get_viewport_rect: str
 	get_viewport_size: str
 	stop_window_loading: str
 	open_new_tab: str
+	wait_for_element: str